@@ -0,0 +1,170 @@
+"""
+bench_detail_extractor.py — Pages/sec of the detail-field extractor
+-------------------------------------------------------------------
+Compares the original per-field ``re.search`` loop (kept here as
+``legacy_extract``) with ``parsers.DetailExtractor``, which runs one combined
+pattern per text block. Both run over the same pre-parsed text blocks so the
+numbers measure field extraction only, not HTML parsing.
+
+The corpus is the saved detail pages in the repository root, plus every page
+in a scraper page cache when ``--cache`` is given. The script exits with an
+error if the two extractors disagree on any page.
+
+Usage (from module_5/):
+
+    python benchmarks/bench_detail_extractor.py [--cache module_2_1/detail_cache.db]
+"""
+
+import argparse
+import os
+import re
+import sqlite3
+import sys
+import time
+import zlib
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.module_2_1 import parsers  # noqa: E402
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+DETAIL_FIXTURES = ["detail_page_full.html", "sample_detail.html", "detail_page_sample.html"]
+
+
+def legacy_extract(blocks):  # pylint: disable=too-many-branches,too-many-statements
+    """The per-field ``re.search`` loop the extractor replaced (baseline)."""
+    result = dict.fromkeys(parsers.DETAIL_FIELDS)
+
+    # Fast extraction - iterate through elements once
+    for text in blocks:
+
+        # GPA
+        if "gpa" in text.lower() and not result["gpa"]:
+            gpa_match = re.search(r"GPA[:\s]+(\d+\.?\d*)", text, re.I)
+            if gpa_match:
+                gpa_val = float(gpa_match.group(1))
+                if 0 < gpa_val <= 4.5:
+                    result["gpa"] = gpa_val
+
+        # Citizenship
+        if not result["citizenship"]:
+            if re.search(
+                r"\b(International|Domestic|American|U\.?S\.?)\b", text, re.I
+            ):
+                if "international" in text.lower():
+                    result["citizenship"] = "International"
+                elif any(
+                    word in text.lower()
+                    for word in ["american", "domestic", "u.s", "us"]
+                ):
+                    result["citizenship"] = "American"
+
+        # Term
+        if not result["term"]:
+            term_match = re.search(
+                r"(?:Term|Season|Semester)[:\s]+(Fall|Spring|Summer|Winter)\s+(\d{4})",
+                text,
+                re.I,
+            )
+            if term_match:
+                result["term"] = (
+                    f"{term_match.group(1).capitalize()} {term_match.group(2)}"
+                )
+            else:
+                term_match = re.search(
+                    r"\b(Fall|Spring|Summer|Winter)\s+(\d{4})\b", text, re.I
+                )
+                if term_match:
+                    result["term"] = (
+                        f"{term_match.group(1).capitalize()} {term_match.group(2)}"
+                    )
+
+        # GRE Verbal
+        if not result["gre_v"]:
+            gre_v_match = re.search(
+                r"(?:GRE\s+)?V(?:erbal)?[:\s]+(\d{3})", text, re.I
+            )
+            if gre_v_match:
+                val = int(gre_v_match.group(1))
+                if 130 <= val <= 170:
+                    result["gre_v"] = val
+
+        # GRE Quant
+        if not result["gre_q"]:
+            gre_q_match = re.search(
+                r"(?:GRE\s+)?Q(?:uant)?[:\s]+(\d{3})", text, re.I
+            )
+            if gre_q_match:
+                val = int(gre_q_match.group(1))
+                if 130 <= val <= 170:
+                    result["gre_q"] = val
+
+        # GRE AW
+        if not result["gre_aw"]:
+            gre_aw_match = re.search(
+                r"(?:GRE\s+)?(?:AW|Writing)[:\s]+(\d+\.?\d*)", text, re.I
+            )
+            if gre_aw_match:
+                val = float(gre_aw_match.group(1))
+                if 0 <= val <= 6:
+                    result["gre_aw"] = val
+
+    # Calculate GRE total
+    if result["gre_v"] and result["gre_q"]:
+        result["gre_total"] = result["gre_v"] + result["gre_q"]
+
+    return result
+
+
+def load_corpus(cache_path=None):
+    """Return the text blocks of every page in the corpus."""
+    pages = []
+    for name in DETAIL_FIXTURES:
+        with open(os.path.join(REPO_ROOT, name), encoding="utf-8") as f:
+            pages.append(f.read())
+    if cache_path:
+        conn = sqlite3.connect(cache_path)
+        try:
+            for (html,) in conn.execute("SELECT html FROM detail_pages"):
+                pages.append(zlib.decompress(html).decode("utf-8"))
+        finally:
+            conn.close()
+    return [parsers._detail_blocks(html) for html in pages]
+
+
+def pages_per_second(extract, corpus, min_seconds):
+    """Run ``extract`` over the corpus repeatedly; return pages per second."""
+    done = 0
+    start = time.perf_counter()
+    while True:
+        for blocks in corpus:
+            extract(blocks)
+        done += len(corpus)
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_seconds:
+            return done / elapsed
+
+
+def main(args=None):
+    """Parse CLI arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark the detail-field extractor.")
+    parser.add_argument("--cache", help="Also use every page in this scraper page cache.")
+    parser.add_argument("--seconds", type=float, default=2.0,
+                        help="Minimum run time per extractor (default 2).")
+    parsed = parser.parse_args(args)
+
+    corpus = load_corpus(parsed.cache)
+    extractor = parsers.DetailExtractor()
+    for blocks in corpus:
+        if legacy_extract(blocks) != extractor.extract(blocks):
+            raise SystemExit("[ERROR] extractors disagree on a corpus page")
+
+    before = pages_per_second(legacy_extract, corpus, parsed.seconds)
+    after = pages_per_second(extractor.extract, corpus, parsed.seconds)
+    print(f"Corpus: {len(corpus)} pages")
+    print(f"  before (per-field re.search): {before:10.0f} pages/sec")
+    print(f"  after  (DetailExtractor):     {after:10.0f} pages/sec   x{after / before:.1f}")
+
+
+if __name__ == "__main__":
+    main()
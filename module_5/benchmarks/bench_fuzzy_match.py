@@ -0,0 +1,107 @@
+"""
+bench_fuzzy_match.py — Canonical-name fuzzy matching: difflib vs FuzzyIndex
+---------------------------------------------------------------------------
+Times ``difflib.get_close_matches(name, canon, n=1, cutoff)`` (the baseline
+the LLM standardizer used) against ``FuzzyIndex.best`` over the canonical
+university and program lists, at the cutoffs ``app.py`` uses. Queries are
+the raw and LLM-generated names in ``module_2/llm_extend_applicant_data.json``
+plus seeded misspellings of canonical names. The script exits with an error
+if the two disagree on any query.
+
+Usage (from module_5/):
+
+    python benchmarks/bench_fuzzy_match.py [--typos 2000] [--seed 7]
+"""
+
+import argparse
+import difflib
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.module_2_1.llm_hosting.fuzzy_index import FuzzyIndex  # noqa: E402
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+LLM_HOSTING = os.path.join(REPO_ROOT, "module_5", "src", "module_2_1", "llm_hosting")
+SAMPLE_FILE = os.path.join(REPO_ROOT, "module_2", "llm_extend_applicant_data.json")
+LETTERS = "abcdefghijklmnopqrstuvwxyz "
+
+
+def read_canon(name):
+    """Return the non-empty lines of a canonical list in llm_hosting/."""
+    with open(os.path.join(LLM_HOSTING, name), encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+def misspell(rng, text):
+    """Apply one to three random character substitutions, insertions or deletions."""
+    chars = list(text)
+    for _ in range(rng.randint(1, 3)):
+        pos = rng.randrange(len(chars) + 1)
+        edit = rng.random()
+        if edit < 0.4 and chars:
+            chars[min(pos, len(chars) - 1)] = rng.choice(LETTERS)
+        elif edit < 0.7:
+            chars.insert(pos, rng.choice(LETTERS))
+        elif chars:
+            del chars[min(pos, len(chars) - 1)]
+    return "".join(chars)
+
+
+def load_queries(fields, canon, typos, seed):
+    """Sample-file values for ``fields`` plus ``typos`` misspelled canonical names."""
+    queries = []
+    if os.path.exists(SAMPLE_FILE):
+        with open(SAMPLE_FILE, encoding="utf-8") as f:
+            rows = json.load(f)
+        queries = [(row.get(field) or "").title() for row in rows for field in fields]
+    rng = random.Random(seed)
+    queries += [misspell(rng, rng.choice(canon)) for _ in range(typos)]
+    return [q for q in queries if q]
+
+
+def timed(match, queries):
+    """Return (results, seconds) for ``match`` over every query."""
+    start = time.perf_counter()
+    results = [match(q) for q in queries]
+    return results, time.perf_counter() - start
+
+
+def main(args=None):
+    """Parse CLI arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark canonical-name fuzzy matching.")
+    parser.add_argument("--typos", type=int, default=2000,
+                        help="Misspelled canonical names added per list (default 2000).")
+    parser.add_argument("--seed", type=int, default=7)
+    parsed = parser.parse_args(args)
+
+    cases = [
+        ("universities", "canon_universities.txt",
+         ("university", "llm-generated-university"), 0.86),
+        ("programs", "canon_programs.txt", ("program_name", "llm-generated-program"), 0.84),
+    ]
+    for label, filename, fields, cutoff in cases:
+        canon = read_canon(filename)
+        queries = load_queries(fields, canon, parsed.typos, parsed.seed)
+        index = FuzzyIndex(canon)
+
+        before, before_s = timed(
+            lambda q: (difflib.get_close_matches(q, canon, n=1, cutoff=cutoff) or [None])[0],
+            queries,
+        )
+        after, after_s = timed(lambda q: index.best(q, cutoff=cutoff), queries)
+        if before != after:
+            raise SystemExit(f"[ERROR] FuzzyIndex disagrees with difflib on {label}")
+        print(
+            f"{label:<13} {len(canon):5d} names, {len(queries):5d} queries   "
+            f"difflib {len(queries) / before_s:8.0f}/s   "
+            f"index {len(queries) / after_s:8.0f}/s   x{before_s / after_s:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
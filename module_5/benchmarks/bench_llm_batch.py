@@ -0,0 +1,113 @@
+"""
+bench_llm_batch.py — LLM standardizer throughput: one call per row vs batched
+-----------------------------------------------------------------------------
+Times ``app._call_llm`` (one chat completion per input) against
+``app._call_llm_batch`` (``--batch-size`` inputs per completion) over the
+same distinct "program, university" inputs, taken from
+``module_2/llm_extend_applicant_data.json``. Reports rows/s for both, how
+many batched inputs fell back to a per-row call because their reply was
+missing or mislabelled, and how many batched results equal the per-row ones.
+
+Needs the llm_hosting requirements (``llama-cpp-python``) and the GGUF
+model in ``src/module_2_1/llm_hosting/models/``.
+
+Usage (from module_5/):
+
+    python benchmarks/bench_llm_batch.py [--rows 64] [--batch-size 8]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+LLM_HOSTING = os.path.join(REPO_ROOT, "module_5", "src", "module_2_1", "llm_hosting")
+SAMPLE_FILE = os.path.join(REPO_ROOT, "module_2", "llm_extend_applicant_data.json")
+
+# app.py imports fuzzy_index as a sibling module, as when it runs as a script.
+sys.path.insert(0, LLM_HOSTING)
+
+
+def load_inputs(app, path, rows):
+    """Return up to ``rows`` distinct model inputs built from the sample file."""
+    with open(path, encoding="utf-8") as f:
+        records = json.load(f)
+    inputs = {}
+    for record in records:
+        text = app._row_text(record)
+        if text:
+            inputs.setdefault(app._dedup_key(text), text)
+        if len(inputs) == rows:
+            break
+    return list(inputs.values())
+
+
+def timed(run, inputs):
+    """Return (results, seconds) for ``run`` over ``inputs``."""
+    start = time.perf_counter()
+    results = run(inputs)
+    return results, time.perf_counter() - start
+
+
+def main(args=None):
+    """Parse CLI arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description="Benchmark batched LLM standardization.")
+    parser.add_argument("--rows", type=int, default=64,
+                        help="Distinct inputs to standardize (default 64).")
+    parser.add_argument("--batch-size", type=int, default=8,
+                        help="Inputs per batched completion (default 8).")
+    parser.add_argument("--file", default=SAMPLE_FILE,
+                        help="JSON rows with program_name and university.")
+    parsed = parser.parse_args(args)
+
+    try:
+        import app
+    except ImportError as exc:
+        raise SystemExit(
+            f"[ERROR] {exc}; install src/module_2_1/llm_hosting/requirements.txt"
+        ) from exc
+
+    inputs = load_inputs(app, parsed.file, parsed.rows)
+    if len(inputs) < 2:
+        raise SystemExit(f"[ERROR] Not enough distinct inputs in {parsed.file}")
+
+    # Load the model and fill the prompt cache for both prefixes first.
+    app._call_llm(inputs[0])
+    app._call_llm_batch(inputs[:2])
+
+    per_row, per_row_s = timed(lambda texts: [app._call_llm(t) for t in texts], inputs)
+
+    single = app._call_llm
+    fallbacks = []
+
+    def counted(text):
+        fallbacks.append(text)
+        return single(text)
+
+    app._call_llm = counted
+    try:
+        batched, batched_s = timed(
+            lambda texts: [
+                result
+                for start in range(0, len(texts), parsed.batch_size)
+                for result in app._call_llm_batch(texts[start : start + parsed.batch_size])
+            ],
+            inputs,
+        )
+    finally:
+        app._call_llm = single
+
+    same = sum(a == b for a, b in zip(per_row, batched))
+    print(f"Distinct inputs: {len(inputs)}, batch size {parsed.batch_size}\n")
+    print(f"  per row  {len(inputs) / per_row_s:7.2f} rows/s")
+    print(
+        f"  batched  {len(inputs) / batched_s:7.2f} rows/s   x{per_row_s / batched_s:.1f}   "
+        f"{len(fallbacks)} fell back to per-row calls"
+    )
+    print(f"  batched results equal to per-row results: {same}/{len(inputs)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+bench_parsers.py — Parse throughput of the scraper's HTML backends
+------------------------------------------------------------------
+Times the "soup" (BeautifulSoup tree) and "fast" (streaming html.parser)
+backends on the saved detail pages in the repository root and on a
+synthetic listing page, checks that both return the same records, and
+prints the per-page cost and speedup.
+
+No network or database is needed.
+
+Usage (from module_5/):
+
+    python benchmarks/bench_parsers.py [--repeat 200] [--rows 20]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.module_2_1 import parsers, scrape  # noqa: E402
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+DETAIL_FIXTURES = ["detail_page_full.html", "sample_detail.html", "detail_page_sample.html"]
+LISTING_URL = scrape.SEARCH_URL + "?page=1"
+
+LISTING_ROW = """
+<tr>
+  <td><a href="/result/{rid}">See more</a>
+      <div class="tw-font-medium tw-text-gray-900">Johns Hopkins University</div></td>
+  <td><div class="tw-text-gray-900"><span>Computer Science</span>
+      <span class="tw-text-gray-500">PhD</span></div></td>
+  <td class="tw-whitespace-nowrap">April 15, 2026</td>
+  <td><div class="tw-inline-flex">Accepted on 15 Apr</div></td>
+</tr>
+"""
+
+
+def listing_page(rows):
+    """Return a listing page with ``rows`` result rows."""
+    body = "".join(LISTING_ROW.format(rid=900000 + i) for i in range(rows))
+    return f"<html><body><table><tbody>{body}</tbody></table></body></html>"
+
+
+def time_backend(backend, func, html, repeat):
+    """Return (seconds per call, result) for ``func(html)`` under ``backend``."""
+    parsers.configure_parser(backend)
+    result = func(html)
+    seconds = min(timeit.repeat(lambda: func(html), number=repeat, repeat=3)) / repeat
+    return seconds, result
+
+
+def compare(label, func, html, repeat):
+    """Print timings for both backends and fail loudly on a mismatch."""
+    soup_s, soup_result = time_backend("soup", func, html, repeat)
+    fast_s, fast_result = time_backend("fast", func, html, repeat)
+    if soup_result != fast_result:
+        raise SystemExit(f"[ERROR] backends disagree on {label}")
+    print(
+        f"{label:<28} soup {soup_s * 1000:7.2f} ms   fast {fast_s * 1000:7.2f} ms   "
+        f"x{soup_s / fast_s:4.1f}"
+    )
+
+
+def main(args=None):
+    """Parse CLI arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description="Compare scraper parser backends.")
+    parser.add_argument("--repeat", type=int, default=200,
+                        help="Parses per timing run (default 200).")
+    parser.add_argument("--rows", type=int, default=20,
+                        help="Rows on the synthetic listing page (default 20).")
+    parsed = parser.parse_args(args)
+
+    previous = parsers.PARSER_BACKEND
+    try:
+        for name in DETAIL_FIXTURES:
+            with open(os.path.join(REPO_ROOT, name), encoding="utf-8") as f:
+                compare(name, parsers._parse_detail_html, f.read(), parsed.repeat)
+        compare(
+            f"listing ({parsed.rows} rows)",
+            lambda html: parsers._parse_listing_html(html, LISTING_URL),
+            listing_page(parsed.rows),
+            parsed.repeat,
+        )
+    finally:
+        parsers.configure_parser(previous)
+
+
+if __name__ == "__main__":
+    main()
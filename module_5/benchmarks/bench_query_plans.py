@@ -0,0 +1,150 @@
+"""
+bench_query_plans.py — Before/after plans for the analysis filters
+------------------------------------------------------------------
+Builds a session-local copy of the applicants table filled with synthetic
+rows, runs ``EXPLAIN (ANALYZE, BUFFERS)`` for the q4–q9 filters, applies
+``SCHEMA_TUNING_SQL`` (the indexes), and runs them again.
+
+Everything lives in a TEMP table named ``applicants``, which shadows the
+real table for this session only, so the benchmark never touches real data
+and works with the least-privilege app role. Trigram indexes are only built
+if ``pg_trgm`` is already installed (``create_table.sql`` installs it).
+
+Usage (from module_5/, with DATABASE_URL or DB_* set):
+
+    python benchmarks/bench_query_plans.py --rows 200000 [--verbose]
+"""
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.load_data import SCHEMA_TUNING_SQL, get_connection  # noqa: E402
+
+QUERIES = {
+    "q4 avg GPA American Fall 2026": """
+        SELECT AVG(gpa) FROM applicants
+        WHERE us_or_international='American' AND term='Fall 2026'
+    """,
+    "q5 acceptance rate Fall 2026": """
+        SELECT AVG(CASE WHEN status='Accepted' THEN 1 ELSE 0 END) * 100
+        FROM applicants WHERE term='Fall 2026'
+    """,
+    "q6 avg GPA accepted Fall 2026": """
+        SELECT AVG(gpa) FROM applicants
+        WHERE status='Accepted' AND term='Fall 2026'
+    """,
+    "q7 JHU CS masters": """
+        SELECT COUNT(*) FROM applicants
+        WHERE llm_generated_university ILIKE '%Hopkins%'
+          AND llm_generated_program ILIKE '%Computer%'
+          AND degree ILIKE '%Master%'
+    """,
+    "q8 elite CS PhD accepts": """
+        SELECT COUNT(*) FROM applicants
+        WHERE term='Fall 2026' AND degree ILIKE '%PhD%'
+          AND llm_generated_program ILIKE '%Computer%'
+          AND llm_generated_university IN ('Georgetown','MIT','Stanford','Carnegie Mellon')
+          AND status='Accepted'
+    """,
+    "q9 elite CS accepts (LLM)": """
+        SELECT COUNT(*) FROM applicants
+        WHERE term='Fall 2026'
+          AND llm_generated_program ILIKE '%Computer%'
+          AND llm_generated_university IN ('Georgetown','MIT','Stanford','Carnegie Mellon')
+          AND status='Accepted'
+    """,
+}
+
+CREATE_TEMP_TABLE = """
+    CREATE TEMP TABLE applicants (
+        p_id SERIAL PRIMARY KEY,
+        program TEXT,
+        comments TEXT,
+        date_added DATE,
+        url TEXT UNIQUE,
+        status TEXT,
+        status_date TEXT,
+        term TEXT,
+        us_or_international TEXT,
+        gpa FLOAT,
+        gre_total_score FLOAT,
+        gre_verbal_score FLOAT,
+        gre_aw_score FLOAT,
+        degree TEXT,
+        llm_generated_program TEXT,
+        llm_generated_university TEXT
+    )
+"""
+
+SEED_ROWS = """
+    INSERT INTO applicants (
+        url, status, term, us_or_international, gpa, degree,
+        llm_generated_program, llm_generated_university
+    )
+    SELECT
+        'https://www.thegradcafe.com/result/' || g,
+        (ARRAY['Accepted','Rejected','Interview','Wait listed'])[1 + g %% 4],
+        (ARRAY['Fall','Spring'])[1 + g %% 2] || ' ' || (2019 + g %% 8),
+        (ARRAY['American','International'])[1 + g %% 3 / 2],
+        2.5 + (g %% 150) / 100.0,
+        (ARRAY['Masters','PhD','MFA','PsyD'])[1 + g %% 4],
+        (ARRAY['Computer Science','Biology','Economics','History','Physics'])[1 + g %% 5],
+        (ARRAY['MIT','Stanford','Johns Hopkins University','Carnegie Mellon',
+               'Georgetown','University of Michigan','UCLA','Ohio State'])[1 + g %% 8]
+        || CASE WHEN g %% 8 > 4 THEN ' ' || g %% 97 ELSE '' END
+    FROM generate_series(1, %s) AS g
+"""
+
+
+def explain(cur, query, verbose):
+    """Run EXPLAIN ANALYZE and return (plan summary, execution time line)."""
+    cur.execute("EXPLAIN (ANALYZE, BUFFERS) " + query)
+    lines = [row[0] for row in cur.fetchall()]
+    if verbose:
+        print("\n".join("      " + line for line in lines))
+    scans = [line.strip() for line in lines if "Scan" in line]
+    timing = next((line for line in lines if line.startswith("Execution Time")), "")
+    return (scans[0] if scans else lines[0].strip()), timing
+
+
+def run(rows, verbose):
+    """Seed the temp table, then print plans before and after tuning."""
+    conn = get_connection()
+    try:
+        with conn.cursor() as cur:
+            cur.execute(CREATE_TEMP_TABLE)
+            cur.execute(SEED_ROWS, (rows,))
+            cur.execute("ANALYZE applicants")
+
+            before = {name: explain(cur, q, verbose) for name, q in QUERIES.items()}
+
+            cur.execute(SCHEMA_TUNING_SQL)
+            cur.execute("ANALYZE applicants")
+            after = {name: explain(cur, q, verbose) for name, q in QUERIES.items()}
+
+        print(f"\nSynthetic rows: {rows}\n")
+        for name in QUERIES:
+            print(name)
+            print(f"  before: {before[name][0]}\n          {before[name][1]}")
+            print(f"  after:  {after[name][0]}\n          {after[name][1]}")
+    finally:
+        conn.rollback()
+        conn.close()
+
+
+def main(args=None):
+    """Parse CLI arguments and run the benchmark."""
+    parser = argparse.ArgumentParser(description="Compare analysis query plans.")
+    parser.add_argument("--rows", type=int, default=200_000,
+                        help="Synthetic applicants to generate (default 200000).")
+    parser.add_argument("--verbose", action="store_true",
+                        help="Print full EXPLAIN output for every query.")
+    parsed = parser.parse_args(args)
+    run(parsed.rows, parsed.verbose)
+
+
+if __name__ == "__main__":
+    main()
@@ -23,6 +23,25 @@ CREATE TABLE IF NOT EXISTS applicants (
     llm_generated_university TEXT
 );
 
+-- Indexes for the analysis filters
+-- (same statements as SCHEMA_TUNING_SQL in src/load_data.py; building them
+-- here as the table owner means the app role never needs to)
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS applicants_term_status_idx
+    ON applicants (term, status);
+CREATE INDEX IF NOT EXISTS applicants_term_citizenship_idx
+    ON applicants (term, us_or_international) INCLUDE (gpa);
+CREATE INDEX IF NOT EXISTS applicants_fall_2026_accepted_idx
+    ON applicants (llm_generated_university, degree)
+    WHERE term = 'Fall 2026' AND status = 'Accepted';
+CREATE INDEX IF NOT EXISTS applicants_degree_status_idx
+    ON applicants (degree, status);
+CREATE INDEX IF NOT EXISTS applicants_university_trgm_idx
+    ON applicants USING gin (llm_generated_university gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS applicants_program_trgm_idx
+    ON applicants USING gin (llm_generated_program gin_trgm_ops);
+
 -- Grant permissions to gradcafe_app (SELECT and INSERT only)
 GRANT SELECT, INSERT ON TABLE applicants TO gradcafe_app;
 GRANT USAGE ON SEQUENCE applicants_p_id_seq TO gradcafe_app;
@@ -2,7 +2,11 @@
 
 # src/app/queries.py
 
+import json
+import os
+import tempfile
 from datetime import datetime
+from decimal import Decimal
 
 import src.query_data as qd
 
@@ -17,41 +21,123 @@ def get_all_results():
     return results
 
 
+def get_cache_stats():
+    """Hit/miss counters for the query result cache (see query_data.cache_stats)."""
+    return qd.cache_stats()
+
+
+def _json_default(value):
+    """Serialize values psycopg returns that ``json`` cannot (e.g. Decimal)."""
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def save_analysis_snapshot(results, path):
+    """Write analysis results to an on-disk snapshot.
+
+    The file is written to a temporary sibling and renamed into place, so a
+    concurrent reader sees either the old snapshot or the new one, never a
+    partial file.
+
+    Args:
+        results (dict): Output of :func:`get_all_results`.
+        path (str): Snapshot file location.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(results, f, default=_json_default)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+_SNAPSHOT_CACHE = {}
+
+
+def load_analysis_snapshot(path):
+    """Read the analysis snapshot, reusing the parsed copy while it is unchanged.
+
+    The file is only re-parsed when its modification time changes, so
+    repeated page views cost a single ``stat`` call.
+
+    Args:
+        path (str): Snapshot file location.
+
+    Returns:
+        dict | None: Snapshot results, or None if missing or unreadable.
+    """
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+    cached = _SNAPSHOT_CACHE.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            results = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(results, dict):
+        return None
+
+    _SNAPSHOT_CACHE[path] = (mtime, results)
+    return results
+
+
+def invalidate_analysis_snapshot(path):
+    """Delete the snapshot so the next page view recomputes it.
+
+    Args:
+        path (str): Snapshot file location.
+    """
+    _SNAPSHOT_CACHE.pop(path, None)
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
 def compute_scraper_diagnostics(records):
     """Compute field-presence and field-absence counts for scraped records.
 
+    Makes a single pass over ``records``, so it accepts a streaming iterator
+    as well as a list.
+
     Args:
-        records (list[dict]): Raw applicant records from the JSON data file.
+        records (Iterable[dict]): Raw applicant records from the JSON data file.
 
     Returns:
         dict: Counts of present and missing values for each tracked field.
     """
-    total = len(records)
-
-    def count(field):
-        return sum(1 for r in records if r.get(field) not in (None, "", "null"))
-
-    diagnostics = {
-        "Total scraped rows": total,
-        "Comments present": count("comments"),
-        "Term present": count("term"),
-        "Citizenship present": count("us_or_international"),
-        "GPA present": count("gpa"),
-        "GRE Total present": count("gre_total_score"),
-        "GRE Verbal present": count("gre_verbal_score"),
-        "GRE AW present": count("gre_aw_score"),
+    fields = {
+        "Comments": "comments",
+        "Term": "term",
+        "Citizenship": "us_or_international",
+        "GPA": "gpa",
+        "GRE Total": "gre_total_score",
+        "GRE Verbal": "gre_verbal_score",
+        "GRE AW": "gre_aw_score",
     }
 
+    total = 0
+    present = dict.fromkeys(fields, 0)
+    for r in records:
+        total += 1
+        for label, field in fields.items():
+            if r.get(field) not in (None, "", "null"):
+                present[label] += 1
+
+    diagnostics = {"Total scraped rows": total}
+    diagnostics.update({f"{label} present": present[label] for label in fields})
     diagnostics.update(
-        {
-            "Comments missing": total - diagnostics["Comments present"],
-            "Term missing": total - diagnostics["Term present"],
-            "Citizenship missing": total - diagnostics["Citizenship present"],
-            "GPA missing": total - diagnostics["GPA present"],
-            "GRE Total missing": total - diagnostics["GRE Total present"],
-            "GRE Verbal missing": total - diagnostics["GRE Verbal present"],
-            "GRE AW missing": total - diagnostics["GRE AW present"],
-        }
+        {f"{label} missing": total - present[label] for label in fields}
     )
 
     return diagnostics
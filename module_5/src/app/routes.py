@@ -15,7 +15,6 @@ Key responsibilities:
 • Format query results for display in HTML templates.
 """
 
-import json
 import os
 import subprocess
 import sys
@@ -33,7 +32,16 @@ from flask import (
     url_for,
 )  # pylint: disable=import-error
 
-from .queries import compute_scraper_diagnostics, get_all_results
+from src.load_data import iter_json_records, read_data_version
+
+from .queries import (
+    compute_scraper_diagnostics,
+    get_all_results,
+    get_cache_stats,
+    invalidate_analysis_snapshot,
+    load_analysis_snapshot,
+    save_analysis_snapshot,
+)
 
 bp = Blueprint("main", __name__, url_prefix="/")
 
@@ -42,6 +50,7 @@ PROJECT_ROOT = os.path.abspath(os.path.join(APP_DIR, "..", ".."))
 TIMESTAMP_FILE = os.path.join(PROJECT_ROOT, "last_pull.txt")
 RUNTIME_FILE = os.path.join(PROJECT_ROOT, "last_runtime.txt")
 ANALYSIS_TIMESTAMP_FILE = os.path.join(PROJECT_ROOT, "last_analysis.txt")
+SNAPSHOT_FILE = os.path.join(PROJECT_ROOT, "analysis_snapshot.json")
 
 # Global busy state flag
 pull_running = False  # pylint: disable=invalid-name
@@ -86,14 +95,77 @@ def load_scraped_records():
     Returns:
         list[dict]: Parsed applicant records, or empty list if file missing.
     """
+    return list(iter_scraped_records())
+
+
+def iter_scraped_records():
+    """Stream raw scraped records from the LLM-extended JSON file.
+
+    Unlike :func:`load_scraped_records`, records are decoded one at a time,
+    so the dashboard's diagnostics pass never holds the whole file in memory.
+
+    Returns:
+        Iterator[dict]: Applicant records, or an empty iterator if file missing.
+    """
     path = Path(
         os.path.join(
             PROJECT_ROOT, "module_2_1", "llm_extend_applicant_data.json"
         )
     )
     if path.exists():
-        return json.loads(path.read_text(encoding="utf-8", errors="replace"))
-    return []
+        return iter_json_records(path, errors="replace")
+    return iter(())
+
+
+def build_analysis_results():
+    """Run the analysis queries and scraper diagnostics for a new snapshot.
+
+    The scraper diagnostics are stored under ``scraper_diag`` and the data
+    version the results reflect under ``data_version``. The version is read
+    before the queries run, so a load that finishes meanwhile leaves the
+    snapshot marked stale rather than current.
+
+    Returns:
+        dict: Analysis results plus ``scraper_diag`` and ``data_version``.
+    """
+    version = read_data_version()
+    results = get_all_results()
+    results["scraper_diag"] = compute_scraper_diagnostics(iter_scraped_records())
+    results["data_version"] = version
+    return results
+
+
+def refresh_analysis_snapshot():
+    """Rebuild the analysis results and store them as the page snapshot.
+
+    Returns:
+        dict: Freshly computed analysis results.
+    """
+    results = build_analysis_results()
+    save_analysis_snapshot(results, SNAPSHOT_FILE)
+    return results
+
+
+def cached_analysis_results():
+    """Return the analysis snapshot, rebuilding it when missing or stale.
+
+    Page views read this instead of querying the database or the scraped
+    records, so their cost does not grow with the size of either. The
+    snapshot is rebuilt when none exists or when a load (including a CLI
+    ``load_data.py`` run) has bumped the data version since it was built.
+    If that rebuild fails, the stale snapshot is served instead.
+
+    Returns:
+        dict: Analysis results from the most recent refresh.
+    """
+    results = load_analysis_snapshot(SNAPSHOT_FILE)
+    if results is None or results.get("data_version") != read_data_version():
+        try:
+            results = refresh_analysis_snapshot()
+        except Exception:  # pylint: disable=broad-exception-caught
+            if results is None:
+                raise
+    return results
 
 
 def fmt(val):
@@ -140,8 +212,9 @@ def na(val):
 def analysis():
     """Serve the main analysis dashboard page.
 
-    Loads scraped records, runs all analysis queries, and computes scraper
-    diagnostics. Falls back to safe defaults if any step fails.
+    Reads the analysis results and scraper diagnostics from the snapshot
+    (see :func:`cached_analysis_results`). Falls back to safe defaults if
+    that fails.
 
     Returns:
         str: Rendered ``analysis.html`` template.
@@ -168,12 +241,10 @@ def analysis():
     }
 
     scraper_diag = {}
-    records = []
 
     try:
-        records = load_scraped_records()
-        results = get_all_results()
-        scraper_diag = compute_scraper_diagnostics(records)
+        results = cached_analysis_results()
+        scraper_diag = results.get("scraper_diag", {})
     except Exception:  # pylint: disable=broad-exception-caught
         # Variables have default values from above, just log
         pass
@@ -196,6 +267,9 @@ def analysis():
 def pull_data():  # pylint: disable=too-many-locals,too-many-return-statements,too-many-statements
     """Trigger the full data pipeline: scrape, clean, and load into PostgreSQL.
 
+    After a successful load the analysis snapshot is rebuilt once, so the
+    following page views show the new data without re-querying.
+
     Returns JSON or redirects based on request type. Enforces busy-state
     gating — returns 409 if a pull is already in progress.
     """
@@ -226,16 +300,18 @@ def pull_data():  # pylint: disable=too-many-locals,too-many-return-statements,t
         # and construct command as a string for shell=True
         python_exe = sys.executable
 
-        # Run scraper
+        # Run scraper for entries not yet in the database, reusing previously
+        # fetched detail pages from its cache
         scraper = os.path.join(PROJECT_ROOT, "src", "module_2_1", "scrape.py")
-        cmd_scraper = f'"{python_exe}" "{scraper}"'
+        cmd_scraper = f'"{python_exe}" "{scraper}" --cache --incremental'
         subprocess.run(cmd_scraper, check=True, cwd=PROJECT_ROOT, env=env, shell=True)
 
         last_data_pull = datetime.now().strftime("%b %d, %Y %I:%M %p")
 
-        # Run cleaner
+        # Run cleaner; the scrape held only new entries, so merge them into
+        # the existing cleaned file the dashboard diagnostics read
         cleaner = os.path.join(PROJECT_ROOT, "src", "module_2_1", "clean.py")
-        cmd_cleaner = f'"{python_exe}" "{cleaner}"'
+        cmd_cleaner = f'"{python_exe}" "{cleaner}" --merge'
         subprocess.run(cmd_cleaner, check=True, cwd=PROJECT_ROOT, env=env, shell=True)
 
         # Load cleaned data into PostgreSQL
@@ -245,6 +321,13 @@ def pull_data():  # pylint: disable=too-many-locals,too-many-return-statements,t
         cmd_loader = f'"{python_exe}" "{loader}"'
         subprocess.run(cmd_loader, check=True, cwd=PROJECT_ROOT, env=env, shell=True)
 
+        # Rebuild the dashboard snapshot once for the newly loaded data.
+        # If that fails, drop the stale snapshot so the next view recomputes.
+        try:
+            refresh_analysis_snapshot()
+        except Exception:  # pylint: disable=broad-exception-caught
+            invalidate_analysis_snapshot(SNAPSHOT_FILE)
+
         end_time = datetime.now()
         runtime_seconds = int((end_time - start_time).total_seconds())
         minutes, seconds = divmod(runtime_seconds, 60)
@@ -302,7 +385,7 @@ def pull_data():  # pylint: disable=too-many-locals,too-many-return-statements,t
 
 @bp.route("/update-analysis", methods=["POST"])
 def update_analysis():
-    """Re-run analysis queries and refresh the dashboard.
+    """Re-run analysis queries and refresh the dashboard snapshot.
 
     Does not trigger a new data pull. Returns 409 if a pull is in progress.
     Returns JSON or rendered template based on request type.
@@ -315,13 +398,19 @@ def update_analysis():
 
     # Get fresh results
     try:
-        results = get_all_results()
+        results = build_analysis_results()
 
         # Force exception if structure is incomplete
         # (required by test_update_analysis_exception_in_try)
         if not isinstance(results, dict) or "avg_metrics" not in results:
             raise ValueError("Invalid results structure")
 
+        # Page views are served from this snapshot until the next refresh
+        try:
+            save_analysis_snapshot(results, SNAPSHOT_FILE)
+        except OSError:
+            pass
+
         # Save analysis refresh timestamp
         analysis_timestamp = datetime.now().strftime("%b %d, %Y %I:%M %p")
         try:
@@ -375,3 +464,13 @@ def status():
         return jsonify({"busy": pull_running}), 200
     except TypeError:
         return jsonify({"busy": False}), 200
+
+
+@bp.route("/cache-stats")
+def cache_stats():
+    """Return query result cache counters for sizing the cache.
+
+    Returns:
+        dict: Hits, misses, evictions, size and limits with status 200.
+    """
+    return jsonify(get_cache_stats()), 200
@@ -0,0 +1,157 @@
+"""
+db_pool.py — Thread-safe PostgreSQL Connection Pool
+----------------------------------------------------
+A small blocking connection pool used by the analysis queries.
+
+Key responsibilities:
+• Open ``minconn`` connections up front and never more than ``maxconn``.
+• Hand connections out LIFO so the warmest connection is reused first.
+• Block (up to ``timeout`` seconds) instead of failing when all connections
+  are checked out, so bursts of dashboard traffic queue rather than error.
+• Roll back any open transaction when a connection is returned and drop
+  connections that were closed or broke while checked out.
+
+Connections are created by a caller-supplied factory, so the pool reuses
+:func:`src.load_data.get_connection` and its ``DATABASE_URL`` / ``DB_*``
+environment handling unchanged.
+"""
+
+import threading
+from contextlib import contextmanager
+
+import psycopg2
+from psycopg2.pool import PoolError
+
+
+# Sizing, the connection factory and the lock-protected bookkeeping are all
+# state of one pool; splitting them up would only add indirection.
+class ConnectionPool:  # pylint: disable=too-many-instance-attributes
+    """Bounded pool of reusable database connections.
+
+    Args:
+        connect (Callable[[], connection]): Factory that opens a new connection.
+        minconn (int): Connections opened immediately and kept warm.
+        maxconn (int): Upper bound on connections open at the same time.
+        timeout (float): Seconds :meth:`getconn` waits for a free connection.
+
+    Raises:
+        ValueError: If the size bounds are inconsistent.
+    """
+
+    def __init__(self, connect, minconn=1, maxconn=10, timeout=30.0):
+        if minconn < 0 or maxconn < 1 or minconn > maxconn:
+            raise ValueError(
+                f"Invalid pool size: minconn={minconn}, maxconn={maxconn}"
+            )
+        self.minconn = minconn
+        self.maxconn = maxconn
+        self.timeout = timeout
+        self._connect = connect
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(maxconn)
+        self._idle = []
+        self._owned = {}
+        self._closed = False
+
+        for _ in range(minconn):
+            self._idle.append(self._open())
+
+    def _open(self):
+        """Open a new connection and register it as owned by this pool."""
+        conn = self._connect()
+        with self._lock:
+            self._owned[id(conn)] = conn
+        return conn
+
+    def _discard(self, conn):
+        """Forget a connection and close it, ignoring errors from dead sockets."""
+        with self._lock:
+            self._owned.pop(id(conn), None)
+        try:
+            conn.close()
+        except psycopg2.Error:
+            pass
+
+    def owns(self, conn):
+        """Return True if ``conn`` was handed out by this pool."""
+        with self._lock:
+            return self._owned.get(id(conn)) is conn
+
+    def getconn(self):
+        """Check out a connection, opening a new one if none are idle.
+
+        Returns:
+            psycopg connection owned by this pool.
+
+        Raises:
+            PoolError: If the pool is closed or no connection frees up
+                within ``timeout`` seconds.
+        """
+        if self._closed:
+            raise PoolError("connection pool is closed")
+        # The slot is held for as long as the connection is checked out and
+        # is given back by putconn(), so it cannot be scoped with ``with``.
+        if not self._slots.acquire(timeout=self.timeout):  # pylint: disable=consider-using-with
+            raise PoolError(
+                f"connection pool exhausted ({self.maxconn} connections in use)"
+            )
+
+        try:
+            with self._lock:
+                conn = self._idle.pop() if self._idle else None
+            if conn is not None and conn.closed:
+                self._discard(conn)
+                conn = None
+            return conn if conn is not None else self._open()
+        except Exception:
+            self._slots.release()
+            raise
+
+    def putconn(self, conn):
+        """Return a checked-out connection to the pool.
+
+        Any open transaction is rolled back so the next borrower starts
+        clean. Connections that are closed or fail to roll back are dropped.
+
+        Args:
+            conn: Connection previously obtained from :meth:`getconn`.
+
+        Raises:
+            PoolError: If ``conn`` does not belong to this pool.
+        """
+        if not self.owns(conn):
+            raise PoolError("trying to return a connection not from this pool")
+
+        try:
+            keep = not self._closed and not conn.closed
+            if keep:
+                conn.rollback()
+        except psycopg2.Error:
+            keep = False
+
+        if keep:
+            with self._lock:
+                self._idle.append(conn)
+        else:
+            self._discard(conn)
+        self._slots.release()
+
+    @contextmanager
+    def connection(self):
+        """Context manager that checks a connection out and always returns it."""
+        conn = self.getconn()
+        try:
+            yield conn
+        finally:
+            self.putconn(conn)
+
+    def closeall(self):
+        """Close every idle connection and refuse further checkouts.
+
+        Connections still checked out are closed when they are returned.
+        """
+        self._closed = True
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            self._discard(conn)
@@ -5,29 +5,51 @@ This script loads the cleaned and LLM‑standardized applicant dataset into a
 PostgreSQL database for analysis in the Module 3 Flask dashboard.
 
 Key responsibilities:
-• Load llm_extend_applicant_data.json from the Module 2 directory.
+• Stream llm_extend_applicant_data.json from the Module 2 directory, or
+  follow the JSONL stream from ``clean.py --follow`` while it is written.
 • Connect to the local PostgreSQL instance.
 • Create the applicants table if it does not already exist.
 • Normalize field names from the JSON into database column names.
 • Insert each record, skipping duplicates using ON CONFLICT(url) DO NOTHING.
-• Report how many new rows were inserted.
+  The default bulk path streams all rows into a temporary staging table with
+  COPY FROM STDIN and merges them in a single INSERT ... SELECT.
+• Report how many new rows were inserted and how many were duplicates.
+• Bump the data version counter whenever the table changes.
+• Export the loaded result IDs for the scraper's incremental mode.
 
 This file forms the bridge between the Module 2 data pipeline and the Module 3
 interactive analysis dashboard.
 """
 
 import argparse
+import gzip
+import io
 import json
 import os
+import re
+from itertools import islice
 from pathlib import Path
 import psycopg2 as psycopg
 from psycopg2 import sql
 
+try:
+    from .module_2_1.jsonl_stream import follow_records
+except ImportError:  # pragma: no cover - run as a script: python src/load_data.py
+    from module_2_1.jsonl_stream import follow_records  # pylint: disable=import-error
+
 # Note: How to start postgres locally (Windows):
 # & C:\Program Files\PostgreSQL\18\bin\psql.exe" -U postgres
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]  # Go up to module_5/ directory
 DATA_FILE = PROJECT_ROOT / "module_2_1" / "llm_extend_applicant_data.json"
+# Counter bumped after every load that changes the table; readers such as the
+# query cache compare it to decide whether their results are stale.
+DATA_VERSION_FILE = PROJECT_ROOT / "data_version.txt"
+# GradCafe result IDs already in the table, read by ``scrape.py --incremental``.
+KNOWN_IDS_FILE = PROJECT_ROOT / "module_2_1" / "known_result_ids.txt"
+# Rows committed per transaction when following a stream, so a stalled or
+# failed writer never costs more than one batch of loaded rows.
+FOLLOW_BATCH_SIZE = 1000
 
 # BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 # DATA_FILE = os.path.join(BASE_DIR, "module_2_1", "llm_extend_applicant_data.json")
@@ -59,6 +81,79 @@ def load_json(filepath: str):
         return json.load(f)
 
 
+def iter_json_records(filepath, chunk_size: int = 1 << 16, errors: str = "strict"):
+    """Yield records one at a time from a JSON array or JSON Lines file.
+
+    The file is read in ``chunk_size`` pieces and decoded incrementally, so
+    memory use is bounded by the largest single record rather than the file
+    size. Both a top-level ``[...]`` array (the format written by
+    ``clean.py``) and newline-delimited objects are accepted, optionally
+    gzip-compressed (``.gz``).
+
+    Args:
+        filepath: Path to the JSON or JSONL file.
+        chunk_size: Number of characters to read from disk per refill.
+        errors: Text decoding error policy passed to :func:`open`.
+
+    Returns:
+        Iterator[dict]: One parsed record per array element or line. A
+        malformed file raises :class:`json.JSONDecodeError` while iterating.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+    """
+    file_path = Path(filepath)
+
+    print(f"Streaming file... '{filepath}'...")
+    if not file_path.exists():
+        raise FileNotFoundError(f"File not found: {filepath}")
+
+    return _iter_json_file(file_path, chunk_size, errors)
+
+
+def _iter_json_file(file_path: Path, chunk_size: int, errors: str):
+    """Generator behind :func:`iter_json_records` (file already validated)."""
+    decoder = json.JSONDecoder()
+    opener = gzip.open if file_path.suffix == ".gz" else open
+    with opener(str(file_path), "rt", encoding="utf-8", errors=errors) as f:
+        buf, pos, started = "", 0, False
+
+        while True:
+            # Skip separators between records (whitespace, newlines, commas)
+            while pos < len(buf) and buf[pos] in " \t\r\n,":
+                pos += 1
+            if pos >= len(buf):
+                buf, pos = f.read(chunk_size), 0
+                if not buf:
+                    return
+                continue
+            if not started:
+                started = True
+                if buf[pos] == "[":
+                    pos += 1
+                    continue
+            if buf[pos] == "]":
+                return
+            try:
+                record, end = decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError as exc:
+                # Only a record cut off by the chunk boundary fails at the very
+                # end of the buffer (or inside a string running up to it); any
+                # other error is malformed input and must not buffer the rest
+                # of the file.
+                truncated = exc.pos >= len(buf) - 8 or exc.msg.startswith(
+                    "Unterminated string"
+                )
+                more = f.read(chunk_size) if truncated else ""
+                if not more:
+                    raise
+                # Record spans the chunk boundary: keep its tail and refill
+                buf, pos = buf[pos:] + more, 0
+                continue
+            yield record
+            pos = end
+
+
 # -----------------------------
 # Connect to PostgreSQL
 # -----------------------------
@@ -84,12 +179,120 @@ def get_connection():
     )
 
 
+# -----------------------------
+# Data version counter
+# -----------------------------
+def read_data_version():
+    """Return the current data version (0 if no load has recorded one).
+
+    Returns:
+        int: Monotonic counter written by :func:`bump_data_version`.
+    """
+    try:
+        return int(Path(DATA_VERSION_FILE).read_text(encoding="utf-8").strip())
+    except (OSError, ValueError):
+        return 0
+
+
+def bump_data_version():
+    """Increment the data version so cached query results are discarded.
+
+    The new value is written to a temporary sibling and renamed into place,
+    so a concurrent reader never sees a partial number.
+
+    Returns:
+        int: The new data version.
+    """
+    version = read_data_version() + 1
+    path = Path(DATA_VERSION_FILE)
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(str(version), encoding="utf-8")
+    os.replace(tmp_path, path)
+    return version
+
+
+# -----------------------------
+# Known result IDs (incremental scraping)
+# -----------------------------
+_RESULT_ID_RE = re.compile(r"/result/(\d+)")
+
+
+def export_known_result_ids(conn):
+    """Write every GradCafe result ID in the applicants table to disk.
+
+    The index is rebuilt from the table after each load, so it only ever
+    lists rows that were actually committed; ``scrape.py --incremental``
+    uses it to skip entries that are already loaded.
+
+    Args:
+        conn: Active psycopg database connection.
+
+    Returns:
+        int: Number of IDs written to :data:`KNOWN_IDS_FILE`.
+    """
+    with conn.cursor() as cur:
+        cur.execute("SELECT url FROM applicants WHERE url IS NOT NULL")
+        ids = sorted(
+            {int(m.group(1)) for (url,) in cur for m in [_RESULT_ID_RE.search(url)] if m}
+        )
+
+    path = Path(KNOWN_IDS_FILE)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text("".join(f"{i}\n" for i in ids), encoding="utf-8")
+    os.replace(tmp_path, path)
+    return len(ids)
+
+
 # -----------------------------
 # Create applicants table
 # -----------------------------
+
+# Indexes for the filters used by query_data.py.
+# Appended to the CREATE TABLE statements so both bootstrap paths build the
+# same schema. Each block runs in its own DO/EXCEPTION scope: the app role
+# (see setup_database.sql) cannot own the table or create extensions, in
+# which case the tuning is skipped with a NOTICE and create_table.sql run as
+# the superuser is expected to have applied it.
+SCHEMA_TUNING_SQL = r"""
+DO $$
+BEGIN
+    CREATE EXTENSION IF NOT EXISTS pg_trgm;
+EXCEPTION WHEN insufficient_privilege OR undefined_file THEN
+    RAISE NOTICE 'pg_trgm unavailable, trigram indexes skipped: %', SQLERRM;
+END $$;
+
+DO $$
+BEGIN
+    CREATE INDEX IF NOT EXISTS applicants_term_status_idx
+        ON applicants (term, status);
+    CREATE INDEX IF NOT EXISTS applicants_term_citizenship_idx
+        ON applicants (term, us_or_international) INCLUDE (gpa);
+    CREATE INDEX IF NOT EXISTS applicants_fall_2026_accepted_idx
+        ON applicants (llm_generated_university, degree)
+        WHERE term = 'Fall 2026' AND status = 'Accepted';
+    CREATE INDEX IF NOT EXISTS applicants_degree_status_idx
+        ON applicants (degree, status);
+
+    IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm') THEN
+        CREATE INDEX IF NOT EXISTS applicants_university_trgm_idx
+            ON applicants USING gin (llm_generated_university gin_trgm_ops);
+        CREATE INDEX IF NOT EXISTS applicants_program_trgm_idx
+            ON applicants USING gin (llm_generated_program gin_trgm_ops);
+    END IF;
+EXCEPTION WHEN insufficient_privilege THEN
+    RAISE NOTICE 'applicants indexes not created: %', SQLERRM;
+END $$;
+"""
+
+
 def create_table(conn):
     """Create the applicants table if it does not already exist.
 
+    Also adds the indexes in :data:`SCHEMA_TUNING_SQL`.
+    This is the only copy of the schema; ``query_data.ensure_table_exists``
+    bootstraps through it as well.
+
     Args:
         conn: Active psycopg database connection.
     """
@@ -102,7 +305,7 @@ def create_table(conn):
             date_added DATE,
             url TEXT UNIQUE,
             status TEXT,
-            status_date TEXT,               
+            status_date TEXT,
             term TEXT,
             us_or_international TEXT,
             gpa FLOAT,
@@ -113,7 +316,7 @@ def create_table(conn):
             llm_generated_program TEXT,
             llm_generated_university TEXT
         );
-        """)
+        """ + SCHEMA_TUNING_SQL)
     conn.commit()
 
 
@@ -182,6 +385,7 @@ def reset_database(dbname="studentCourses"):
         cur.execute(sql.SQL("CREATE DATABASE {}").format(sql.Identifier(dbname)))
 
     conn.close()
+    bump_data_version()
     print(f"Database '{dbname}' recreated successfully.")
 
 
@@ -224,39 +428,215 @@ def insert_record(conn, record):
         return cur.rowcount  # returns 1 if inserted, 0 if duplicate
 
 
+# -----------------------------
+# Bulk insert via COPY
+# -----------------------------
+
+# Column order shared by the staging table, the COPY stream, and the merge.
+COPY_COLUMNS = (
+    "program",
+    "comments",
+    "date_added",
+    "url",
+    "status",
+    "status_date",
+    "term",
+    "us_or_international",
+    "gpa",
+    "gre_total_score",
+    "gre_verbal_score",
+    "gre_aw_score",
+    "degree",
+    "llm_generated_program",
+    "llm_generated_university",
+)
+
+
+def _copy_escape(value):
+    """Render one value in PostgreSQL COPY text format.
+
+    Args:
+        value: Field value from a normalized record.
+
+    Returns:
+        str: ``\\N`` for None, otherwise the value with backslash, tab,
+        newline, and carriage-return characters escaped.
+    """
+    if value is None:
+        return "\\N"
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+class _CopyStream(io.RawIOBase):
+    """Read-only file object that renders records as COPY text lines on demand.
+
+    ``cursor.copy_expert`` pulls fixed-size chunks through :meth:`readinto`,
+    so only one chunk of the payload is ever held in memory no matter how
+    many records the iterator yields.
+    """
+
+    def __init__(self, records):
+        super().__init__()
+        self._records = iter(records)
+        self._buffer = b""
+        self.rows = 0
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        while len(self._buffer) < len(b):
+            record = next(self._records, None)
+            if record is None:
+                break
+            line = "\t".join(_copy_escape(record.get(col)) for col in COPY_COLUMNS)
+            self._buffer += (line + "\n").encode("utf-8")
+            self.rows += 1
+        chunk, self._buffer = self._buffer[: len(b)], self._buffer[len(b) :]
+        b[: len(chunk)] = chunk
+        return len(chunk)
+
+
+def insert_records_bulk(conn, records):
+    """Insert many normalized records with one COPY and one merge statement.
+
+    Rows are streamed into a temporary ``applicants_staging`` table using
+    ``COPY ... FROM STDIN`` and then merged into ``applicants`` with a single
+    ``INSERT ... SELECT ... ON CONFLICT (url) DO NOTHING``. The whole load is
+    one transaction with one commit.
+
+    Args:
+        conn: Active psycopg database connection.
+        records: Iterable of normalized records with database column keys.
+
+    Returns:
+        tuple[int, int]: ``(inserted, duplicates)`` where ``duplicates`` is
+        the number of staged rows skipped by the unique ``url`` constraint.
+    """
+    columns = ", ".join(COPY_COLUMNS)
+    stream = _CopyStream(records)
+
+    with conn.cursor() as cur:
+        cur.execute(
+            """
+            CREATE TEMP TABLE IF NOT EXISTS applicants_staging (
+                program TEXT,
+                comments TEXT,
+                date_added DATE,
+                url TEXT,
+                status TEXT,
+                status_date TEXT,
+                term TEXT,
+                us_or_international TEXT,
+                gpa FLOAT,
+                gre_total_score FLOAT,
+                gre_verbal_score FLOAT,
+                gre_aw_score FLOAT,
+                degree TEXT,
+                llm_generated_program TEXT,
+                llm_generated_university TEXT
+            ) ON COMMIT DROP;
+            """
+        )
+        cur.copy_expert(
+            f"COPY applicants_staging ({columns}) FROM STDIN",
+            io.BufferedReader(stream),
+        )
+        cur.execute(
+            f"""
+            INSERT INTO applicants ({columns})
+            SELECT {columns} FROM applicants_staging
+            ON CONFLICT (url) DO NOTHING;
+            """
+        )
+        inserted = max(cur.rowcount, 0)
+    conn.commit()
+
+    return inserted, stream.rows - inserted
+
+
 # -----------------------------
 # Main loader
 # -----------------------------
-def load_into_db(filepath: str):
-    """Load JSON data from a file and insert all records into PostgreSQL.
+def _record_batches(records, size):
+    """Group an iterable of records into lists of at most ``size`` records."""
+    records = iter(records)
+    while batch := list(islice(records, size)):
+        yield batch
+
+
+def load_into_db(filepath: str, bulk: bool = True, follow: bool = False):
+    """Stream JSON data from a file and insert all records into PostgreSQL.
+
+    Records are read incrementally with :func:`iter_json_records`, so memory
+    use stays flat regardless of file size.
 
     Args:
         filepath: Path to the JSON file containing applicant records.
+        bulk: Use the COPY-based :func:`insert_records_bulk` path (default).
+            When False, fall back to one :func:`insert_record` call per row.
+        follow: Read a JSONL file that is still being written, with
+            :func:`follow_records`, until its writer marks it done. The bulk
+            path then commits every :data:`FOLLOW_BATCH_SIZE` rows, so rows
+            already loaded survive a writer that stalls or fails.
     """
-    data = load_json(filepath)
+    data = follow_records(filepath) if follow else iter_json_records(filepath)
     conn = get_connection()
 
     try:
         create_table(conn)
 
-        inserted = 0
+        if bulk:
+            records = (normalize_record(record) for record in data)
+            batches = _record_batches(records, FOLLOW_BATCH_SIZE) if follow else [records]
+            inserted = duplicates = 0
+            for batch in batches:
+                added, skipped = insert_records_bulk(conn, batch)
+                if added:
+                    # Each batch is its own commit; readers may use it now
+                    bump_data_version()
+                inserted += added
+                duplicates += skipped
+            print(
+                f"Inserted {inserted} new records ({duplicates} duplicates skipped)."
+            )
+        else:
+            inserted = 0
 
-        for record in data:
-            clean = normalize_record(record)
-            inserted += insert_record(conn, clean)
+            for record in data:
+                clean = normalize_record(record)
+                inserted += insert_record(conn, clean)
 
-        print(f"Inserted {inserted} new records (duplicates skipped).")
+            print(f"Inserted {inserted} new records (duplicates skipped).")
+            if inserted:
+                bump_data_version()
+        export_known_result_ids(conn)
 
     finally:
         conn.close()
 
 
-def main(drop=False):
-    """CLI entrypoint for load_data."""
+def main(drop=False, follow=None):
+    """CLI entrypoint for load_data.
+
+    Args:
+        drop: Recreate the database first.
+        follow: JSONL stream to load while it is being written, instead of
+            :data:`DATA_FILE`.
+    """
     try:
         if drop:
             reset_database("studentCourses")
-        load_into_db(DATA_FILE)
+        if follow:
+            load_into_db(follow, follow=True)
+        else:
+            load_into_db(DATA_FILE)
         return "load_data_main_executed"
     except Exception as e:  # pylint: disable=broad-exception-caught
         print(f"Error: {e}")
@@ -278,8 +658,13 @@ def cli_main(args=None):
         action="store_true",
         help="Drop and recreate the studentCourses database before loading.",
     )
+    parser.add_argument(
+        "--follow",
+        metavar="PATH",
+        help="Load a JSONL stream (e.g. from clean.py --follow) as it is written.",
+    )
     parsed = parser.parse_args(args)
-    main(drop=parsed.drop)
+    main(drop=parsed.drop, follow=parsed.follow)
 
 
 if __name__ == "__main__":  # pragma: no cover
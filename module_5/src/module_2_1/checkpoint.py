@@ -0,0 +1,115 @@
+"""
+checkpoint.py -- crawl checkpoints for ``scrape.py --resume``
+-------------------------------------------------------------
+Records which listing pages and detail records a crawl has finished, so an
+interrupted run can pick up where it stopped instead of starting over.
+"""
+
+import json
+import os
+import threading
+
+CHECKPOINT_FILE = os.path.join("module_2_1", "scrape_progress.jsonl")
+
+
+class CheckpointLog:
+    """Append-only JSONL log of finished listing pages and detail records.
+
+    A ``{"page": n, "urls": [...]}`` line is written once every row of listing
+    page ``n`` has been handed to the detail stage, and an ``{"entry": {...}}``
+    line once a record's detail page is merged. Lines are flushed as written
+    and fsynced every ``fsync_every`` lines and on close. A torn last line
+    from a crash is dropped on load, and the log is rewritten through a
+    temporary file and an atomic rename.
+
+    Args:
+        path (str): Log location.
+        resume (bool): Load an existing log instead of starting a new one.
+        fsync_every (int): Lines between fsyncs.
+    """
+
+    def __init__(self, path, resume=False, fsync_every=50):
+        self.path = path
+        self.fsync_every = fsync_every
+        self.pages = {}
+        self.entries = {}
+        self._lock = threading.Lock()
+        self._unsynced = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if resume and os.path.exists(path):
+            self._load()
+        else:
+            self._rewrite([])
+        self._file = open(path, "a", encoding="utf-8")  # pylint: disable=consider-using-with
+
+    def _load(self):
+        with open(self.path, "r", encoding="utf-8") as f:
+            raw = f.read()
+        lines = raw.split("\n")
+        valid = []
+        for line in lines:
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                break
+            valid.append(line)
+            if "page" in record:
+                self.pages[record["page"]] = record["urls"]
+            else:
+                self.entries[record["entry"]["entry_url"]] = record["entry"]
+        if len(valid) != len([line for line in lines if line]):
+            self._rewrite(valid)
+
+    def _rewrite(self, lines):
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.writelines(line + "\n" for line in lines)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+    def _append(self, record):
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+            self._unsynced += 1
+            if self._unsynced >= self.fsync_every:
+                os.fsync(self._file.fileno())
+                self._unsynced = 0
+
+    def page_done(self, page, urls):
+        """Record that every row of listing page ``page`` was dispatched."""
+        self.pages[page] = list(urls)
+        self._append({"page": page, "urls": self.pages[page]})
+
+    def entry_done(self, record):
+        """Record a listing row whose detail fields have been merged."""
+        self.entries[record["entry_url"]] = record
+        self._append({"entry": record})
+
+    def resume_page(self, start_page=1):
+        """Return the first page from ``start_page`` with unfinished rows."""
+        page = start_page
+        while page in self.pages and all(url in self.entries for url in self.pages[page]):
+            page += 1
+        return page
+
+    def close(self):
+        """Flush, fsync and close the log."""
+        with self._lock:
+            if not self._file.closed:
+                self._file.flush()
+                os.fsync(self._file.fileno())
+                self._file.close()
+
+
+__all__ = [
+    "CHECKPOINT_FILE",
+    "CheckpointLog",
+]
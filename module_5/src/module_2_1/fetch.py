@@ -0,0 +1,591 @@
+"""
+fetch.py -- HTTP fetch layer for the GradCafe scraper
+-----------------------------------------------------
+Every listing and detail request goes through :func:`_fetch`: one shared
+token-bucket rate limiter with an AIMD window per host, a pool of keep-alive
+connections, retries with full-jitter backoff, and an optional robots.txt
+policy (:func:`configure_robots`).
+"""
+
+import gzip
+import http.client
+import json
+import os
+import random
+import re
+import threading
+import time
+from collections import Counter, namedtuple
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urljoin, urlsplit
+
+USER_AGENT = "jhu-module2-scraper"
+
+BASE_URL = "https://www.thegradcafe.com/"
+
+# Politeness budget shared by every listing and detail request.
+REQUESTS_PER_SECOND = 10.0
+# Upper bound on simultaneously open connections to the site.
+MAX_CONNECTIONS = 8
+# Responses worth retrying: throttling and transient server errors.
+RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+# Retries per request after the first attempt.
+MAX_RETRIES = 4
+# Full-jitter exponential backoff: sleep uniform(0, min(cap, base * 2**n)).
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 30.0
+
+Response = namedtuple("Response", ["status", "headers", "body", "url"])
+
+
+class TokenBucket:  # pylint: disable=too-few-public-methods
+    """Thread-safe token bucket limiting the global request rate.
+
+    Callers reserve a token and sleep only for their own deficit, so waiting
+    threads are served in arrival order without holding the lock.
+
+    Args:
+        rate (float): Tokens added per second.
+        capacity (float | None): Burst size (defaults to ``rate``).
+    """
+
+    def __init__(self, rate, capacity=None, clock=time.monotonic, sleep=time.sleep):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = self.capacity
+        self._stamp = clock()
+
+    def acquire(self, tokens=1.0):
+        """Take ``tokens`` from the bucket, sleeping until they are available.
+
+        Returns:
+            float: Seconds spent waiting.
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._stamp) * self.rate
+            )
+            self._stamp = now
+            self._tokens -= tokens
+            deficit = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if deficit:
+            self._sleep(deficit)
+        return deficit
+
+
+class KeepAlivePool:
+    """Bounded pool of persistent HTTP(S) connections, keyed by host.
+
+    Args:
+        max_connections (int): Connections that may be in use at once; extra
+            callers block until one is returned.
+        timeout (float): Socket timeout in seconds.
+    """
+
+    REDIRECTS = (301, 302, 303, 307, 308)
+
+    def __init__(self, max_connections=MAX_CONNECTIONS, timeout=10):
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(max_connections)
+        self._lock = threading.Lock()
+        self._idle = {}
+
+    def _checkout(self, key):
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop(), True
+        scheme, host = key
+        cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        return cls(host, timeout=self.timeout), False
+
+    def _checkin(self, key, conn):
+        with self._lock:
+            self._idle.setdefault(key, []).append(conn)
+
+    def _send(self, url, headers):
+        """Issue one GET, retrying once if a reused connection went stale."""
+        parts = urlsplit(url)
+        key = (parts.scheme, parts.netloc)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+
+        while True:
+            conn, reused = self._checkout(key)
+            try:
+                conn.request("GET", path, headers=headers)
+                resp = conn.getresponse()
+                body = resp.read()
+            except (http.client.HTTPException, OSError):
+                conn.close()
+                if reused:
+                    continue
+                raise
+            if resp.will_close:
+                conn.close()
+            else:
+                self._checkin(key, conn)
+            return resp, body
+
+    def get(self, url, headers=None, max_redirects=5):
+        """Fetch ``url``, following redirects and decoding gzip bodies.
+
+        Args:
+            url (str): Absolute http(s) URL.
+            headers (dict | None): Extra request headers.
+            max_redirects (int): Redirect hops to follow.
+
+        Returns:
+            Response: Final status, headers, decoded body bytes and URL.
+        """
+        request_headers = {"User-Agent": USER_AGENT, "Accept-Encoding": "gzip"}
+        request_headers.update(headers or {})
+        with self._slots:
+            for _ in range(max_redirects + 1):
+                resp, body = self._send(url, request_headers)
+                location = resp.getheader("Location")
+                if resp.status not in self.REDIRECTS or not location:
+                    break
+                url = urljoin(url, location)
+        if resp.getheader("Content-Encoding", "").lower() == "gzip":
+            body = gzip.decompress(body)
+        return Response(resp.status, dict(resp.getheaders()), body, url)
+
+    def close(self):
+        """Close every idle connection."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn in conns:
+                conn.close()
+
+
+class _HostWindow:  # pylint: disable=too-few-public-methods
+    """AIMD state for one host."""
+
+    __slots__ = ("limit", "active", "paused_until", "last_decrease", "interval", "next_start")
+
+    def __init__(self, limit):
+        self.limit = limit
+        self.active = 0
+        self.paused_until = 0.0
+        self.last_decrease = float("-inf")
+        self.interval = 0.0
+        self.next_start = 0.0
+
+
+class AdaptiveLimiter:  # pylint: disable=too-many-instance-attributes
+    """Per-host AIMD concurrency window on top of a shared :class:`TokenBucket`.
+
+    Each host starts with ``initial`` requests in flight. Every successful
+    response grows the window by ``1 / window`` (about one slot per window of
+    successes); a throttled, failed or 5xx response halves it, at most once
+    per ``decrease_interval`` so one burst of errors counts once. A
+    ``Retry-After`` pause holds back every request to that host, and a
+    robots.txt ``Crawl-delay`` spaces out request starts.
+
+    Args:
+        bucket (TokenBucket): Global request-rate budget.
+        max_concurrency (int): Largest window per host.
+        initial (float): Starting window per host.
+        decrease (float): Multiplier applied to the window on throttling.
+        decrease_interval (float): Minimum seconds between two decreases.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        bucket,
+        max_concurrency=MAX_CONNECTIONS,
+        initial=2.0,
+        decrease=0.5,
+        decrease_interval=1.0,
+        *,
+        clock=time.monotonic,
+        sleep=time.sleep,
+        rand=random.random,
+    ):
+        self.bucket = bucket
+        self.max_concurrency = max_concurrency
+        self.initial = min(initial, max_concurrency)
+        self.decrease = decrease
+        self.decrease_interval = decrease_interval
+        self._clock = clock
+        self._sleep = sleep
+        self._rand = rand
+        self._cond = threading.Condition()
+        self._hosts = {}
+        self.status_counts = Counter()
+        self.retries = 0
+
+    def _window(self, host):
+        window = self._hosts.get(host)
+        if window is None:
+            window = self._hosts[host] = _HostWindow(self.initial)
+        return window
+
+    def acquire(self, host=""):
+        """Wait for a slot in ``host``'s window, its crawl delay, then a rate token.
+
+        Returns:
+            float: Seconds spent waiting on the crawl delay and token bucket.
+        """
+        while True:
+            with self._cond:
+                window = self._window(host)
+                now = self._clock()
+                pause = window.paused_until - now
+                if pause <= 0:
+                    if window.active < int(window.limit):
+                        window.active += 1
+                        spacing = max(0.0, window.next_start - now)
+                        window.next_start = max(now, window.next_start) + window.interval
+                        break
+                    self._cond.wait()
+                    continue
+            self._sleep(pause)
+        if spacing:
+            self._sleep(spacing)
+        return spacing + self.bucket.acquire()
+
+    def release(self, host="", status=None):
+        """Free a slot and adjust the window for the response ``status``.
+
+        Args:
+            host (str): Host the request went to.
+            status (int | None): HTTP status, or None for a network error.
+        """
+        with self._cond:
+            window = self._window(host)
+            window.active -= 1
+            self.status_counts[status if status is not None else "error"] += 1
+            if status is None or status in RETRY_STATUSES:
+                now = self._clock()
+                if now - window.last_decrease >= self.decrease_interval:
+                    window.limit = max(1.0, window.limit * self.decrease)
+                    window.last_decrease = now
+            else:
+                window.limit = min(self.max_concurrency, window.limit + 1.0 / window.limit)
+            self._cond.notify_all()
+
+    def backoff(self, host, attempt, retry_after=None):
+        """Record a retry and return how long the caller should sleep.
+
+        Args:
+            host (str): Host being retried.
+            attempt (int): Zero-based number of the attempt that just failed.
+            retry_after (float | None): Server-requested delay in seconds;
+                pauses every request to ``host`` for that long.
+
+        Returns:
+            float: Jittered exponential backoff in seconds.
+        """
+        with self._cond:
+            self.retries += 1
+            if retry_after:
+                window = self._window(host)
+                window.paused_until = max(window.paused_until, self._clock() + retry_after)
+        return self._rand() * min(BACKOFF_CAP, BACKOFF_BASE * 2**attempt)
+
+    def set_crawl_delay(self, host, seconds):
+        """Space request starts to ``host`` at least ``seconds`` apart (None clears)."""
+        with self._cond:
+            self._window(host).interval = float(seconds or 0.0)
+
+    def windows(self):
+        """Return the current concurrency window of every host seen so far."""
+        with self._cond:
+            return {host: window.limit for host, window in self._hosts.items()}
+
+
+_RATE_LIMITER = AdaptiveLimiter(TokenBucket(REQUESTS_PER_SECOND))
+_HTTP_POOL = KeepAlivePool(MAX_CONNECTIONS)
+
+
+class FetchError(RuntimeError):
+    """A page could not be fetched, even after retrying."""
+
+
+class RobotsDisallowed(FetchError):
+    """robots.txt forbids fetching the URL."""
+
+
+def _header(headers, name):
+    """Return response header ``name`` from ``headers``, matching case-insensitively."""
+    name = name.lower()
+    return next((v for k, v in (headers or {}).items() if k.lower() == name), None)
+
+
+def _retry_after(resp):
+    """Return the ``Retry-After`` delay of ``resp`` in seconds, or None."""
+    if resp is None:
+        return None
+    value = _header(resp.headers, "Retry-After")
+    if value is None:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def _fetch(url: str, headers=None):
+    """Rate-limited GET through the keep-alive pool, retrying transient failures.
+
+    Network errors and :data:`RETRY_STATUSES` responses are retried up to
+    :data:`MAX_RETRIES` times with jittered exponential backoff, honouring
+    ``Retry-After``.
+
+    Returns:
+        Response | None: The final response (possibly a 429/5xx once retries
+        run out), or None if the last attempt was a network error.
+
+    Raises:
+        RobotsDisallowed: If the active robots policy forbids ``url``.
+    """
+    policy = _ROBOTS
+    if policy is not None and not policy.allowed(url):
+        raise RobotsDisallowed(f"{url} is disallowed by robots.txt")
+    host = urlsplit(url).netloc
+    resp = None
+    for attempt in range(MAX_RETRIES + 1):
+        _RATE_LIMITER.acquire(host)
+        try:
+            resp = _HTTP_POOL.get(url, headers=headers)
+        except Exception:  # pylint: disable=broad-exception-caught
+            resp = None
+        _RATE_LIMITER.release(host, resp.status if resp is not None else None)
+        if resp is not None and resp.status not in RETRY_STATUSES:
+            return resp
+        if attempt < MAX_RETRIES:
+            time.sleep(_RATE_LIMITER.backoff(host, attempt, _retry_after(resp)))
+    return resp
+
+
+def _get_html(url: str, delay: float = 0.0, strict: bool = False) -> str:
+    """Fetch HTML over a pooled keep-alive connection.
+
+    Pacing comes from the shared :class:`AdaptiveLimiter`; ``delay`` adds an
+    optional extra pause for callers that want to be gentler still.
+
+    Args:
+        strict (bool): Raise :class:`FetchError` when the request was still
+            throttled or failing after its retries, or robots.txt forbids
+            it, instead of returning ``""`` as for a missing page.
+
+    Returns:
+        str: Page HTML, or ``""`` on a non-200 response or network error.
+    """
+    if delay:
+        time.sleep(delay)
+    try:
+        resp = _fetch(url)
+    except RobotsDisallowed:
+        if strict:
+            raise
+        return ""
+    if strict and (resp is None or resp.status in RETRY_STATUSES):
+        status = resp.status if resp is not None else "network error"
+        raise FetchError(f"{url} failed after {MAX_RETRIES} retries ({status})")
+    if resp is None or resp.status != 200:
+        return ""
+    return resp.body.decode("utf-8", errors="ignore")
+
+
+def _print_fetch_stats():
+    """Report response statuses, retries and the adaptive windows."""
+    limiter = _RATE_LIMITER
+    if not limiter.status_counts:
+        return
+    statuses = ", ".join(
+        f"{status}: {count}" for status, count in sorted(
+            limiter.status_counts.items(), key=lambda item: str(item[0])
+        )
+    )
+    windows = ", ".join(
+        f"{host} {limit:.1f}" for host, limit in sorted(limiter.windows().items())
+    )
+    print(f"  Fetch: {statuses}; {limiter.retries} retries; concurrency {windows}")
+
+
+# ---------------------------------------------------------------------------
+# robots.txt policy: cached on disk, matched per URL from a prefix trie
+# ---------------------------------------------------------------------------
+
+ROBOTS_URL = urljoin(BASE_URL, "robots.txt")
+ROBOTS_CACHE_FILE = os.path.join("module_2_1", "robots_cache.json")
+# How long a downloaded robots.txt is trusted before it is fetched again.
+ROBOTS_TTL = 24 * 60 * 60
+
+
+class RobotsPolicy:
+    """The robots.txt rules that apply to :data:`USER_AGENT`.
+
+    Rules come from the groups naming our agent, or the ``*`` groups if none
+    do. Plain path prefixes are stored in a character trie, so checking a
+    URL is one walk down its path; the rare rules with ``*`` or ``$`` are
+    matched as regular expressions. As in RFC 9309, the longest matching
+    rule wins and ``Allow`` wins a tie.
+
+    Args:
+        text (str): robots.txt body ("" allows everything).
+        disallow_all (bool): Refuse every URL (robots.txt unreachable).
+    """
+
+    _RULE = ""  # trie key marking "a rule ends here"; paths never contain it
+
+    def __init__(self, text="", disallow_all=False):
+        self.disallow_all = disallow_all
+        self.crawl_delay = None
+        self._trie = {}
+        self._patterns = []
+        for allow, path in self._select_rules(text):
+            self._add(allow, path)
+
+    def _select_rules(self, text):
+        """Parse ``text`` and return the (allow, path) rules for our agent."""
+        groups = []
+        current = None
+        in_agents = False  # consecutive User-agent lines share one group
+        for raw in text.splitlines():
+            line = raw.split("#", 1)[0]
+            field, sep, value = line.partition(":")
+            if not sep:
+                continue
+            field, value = field.strip().lower(), value.strip()
+            if field == "user-agent":
+                if not in_agents:
+                    current = {"agents": set(), "rules": [], "delay": None}
+                    groups.append(current)
+                    in_agents = True
+                current["agents"].add(value.lower())
+                continue
+            in_agents = False
+            if current is None:
+                continue
+            if field in ("allow", "disallow") and value:
+                current["rules"].append((field == "allow", value))
+            elif field == "crawl-delay":
+                try:
+                    current["delay"] = float(value)
+                except ValueError:
+                    pass
+
+        chosen = [g for g in groups if USER_AGENT.lower() in g["agents"]] or [
+            g for g in groups if "*" in g["agents"]
+        ]
+        delays = [g["delay"] for g in chosen if g["delay"] is not None]
+        self.crawl_delay = max(delays) if delays else None
+        return [rule for group in chosen for rule in group["rules"]]
+
+    def _add(self, allow, path):
+        if "*" in path or path.endswith("$"):
+            regex = ".*".join(re.escape(part) for part in path.rstrip("$").split("*"))
+            self._patterns.append(
+                (len(path), allow, re.compile(regex + ("$" if path.endswith("$") else "")))
+            )
+            return
+        node = self._trie
+        for char in path:
+            node = node.setdefault(char, {})
+        node[self._RULE] = node.get(self._RULE, False) or allow
+
+    def allowed(self, url):
+        """Return True if robots.txt lets :data:`USER_AGENT` fetch ``url``."""
+        if self.disallow_all:
+            return False
+        parts = urlsplit(url)
+        path = (parts.path or "/") + ("?" + parts.query if parts.query else "")
+
+        best_length, best = -1, True
+        node = self._trie
+        for depth, char in enumerate(path, 1):
+            node = node.get(char)
+            if node is None:
+                break
+            if self._RULE in node:
+                best_length, best = depth, node[self._RULE]
+        for length, allow, regex in self._patterns:
+            if (length > best_length or (length == best_length and allow)) and regex.match(
+                path
+            ):
+                best_length, best = length, allow
+        return best
+
+    @classmethod
+    def load(cls, path, ttl=ROBOTS_TTL, clock=time.time):
+        """Return the policy from the cache at ``path``, refetching it when stale.
+
+        A 4xx robots.txt means no rules. If robots.txt cannot be fetched
+        (network error or 5xx), a stale cached copy is used; with no copy
+        at all, everything is disallowed.
+        """
+        cached = None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            pass
+        if cached is not None and clock() - cached["fetched_at"] < ttl:
+            return cls(cached["text"])
+
+        resp = _fetch(ROBOTS_URL)
+        if resp is not None and resp.status < 500:
+            text = resp.body.decode("utf-8", errors="ignore") if resp.status == 200 else ""
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(path + ".tmp", "w", encoding="utf-8") as f:
+                json.dump({"fetched_at": clock(), "text": text}, f)
+            os.replace(path + ".tmp", path)
+            return cls(text)
+        if cached is not None:
+            return cls(cached["text"])
+        return cls(disallow_all=True)
+
+
+# Active robots policy; None (the default) means requests are not checked.
+_ROBOTS = None
+
+
+def configure_robots(path=None, **options):
+    """Load and enforce the robots policy cached at ``path`` (None disables).
+
+    Every :func:`_fetch` is checked against the policy, and its
+    ``Crawl-delay`` is applied to the site's host in the rate limiter.
+
+    Args:
+        path (str | None): JSON cache file for robots.txt.
+        **options: Passed to :meth:`RobotsPolicy.load` (``ttl``, ``clock``).
+
+    Returns:
+        RobotsPolicy | None: The active policy.
+    """
+    global _ROBOTS  # pylint: disable=global-statement
+    _ROBOTS = None
+    policy = RobotsPolicy.load(path, **options) if path is not None else None
+    _RATE_LIMITER.set_crawl_delay(
+        urlsplit(BASE_URL).netloc, policy.crawl_delay if policy is not None else None
+    )
+    _ROBOTS = policy
+    return policy
+
+
+__all__ = [
+    "TokenBucket",
+    "KeepAlivePool",
+    "AdaptiveLimiter",
+    "FetchError",
+    "RobotsDisallowed",
+    "RobotsPolicy",
+    "configure_robots",
+]
@@ -0,0 +1,134 @@
+"""
+jsonl_stream.py -- JSONL streams between the pipeline stages
+-------------------------------------------------------------
+``scrape.py --stream`` and ``clean.py --follow`` append one record per line
+while they run, and ``clean.py --follow`` / ``load_data.py --follow`` read
+those lines as they land, so the stages overlap.
+
+A writer creates ``<file>.done`` only after it finished successfully. A
+reader stops once that marker exists and everything before it has been
+read; if the writer failed or was interrupted, the reader times out
+instead of treating a partial stream as complete.
+"""
+
+import json
+import os
+import threading
+import time
+import zlib
+
+# Created next to a stream once its writer has completed it.
+STREAM_DONE_SUFFIX = ".done"
+
+
+class RecordStream:
+    """Append finished records to a JSONL file as soon as they complete.
+
+    A path ending in ``.gz`` is written as one gzip stream, sync-flushed
+    after every record, so a reader can decompress everything written so
+    far while the writer is still running.
+
+    Args:
+        path (str): Output file (replaced if it exists).
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.count = 0
+        self._lock = threading.Lock()
+        self._compressor = zlib.compressobj(wbits=31) if path.endswith(".gz") else None
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if os.path.exists(path + STREAM_DONE_SUFFIX):
+            os.remove(path + STREAM_DONE_SUFFIX)
+        self._file = open(path, "wb")  # pylint: disable=consider-using-with
+
+    def write(self, record):
+        """Append one record and flush it to the OS."""
+        data = (json.dumps(record, ensure_ascii=False) + "\n").encode("utf-8")
+        with self._lock:
+            if self._compressor is not None:
+                data = self._compressor.compress(data) + self._compressor.flush(
+                    zlib.Z_SYNC_FLUSH
+                )
+            self._file.write(data)
+            self._file.flush()
+            self.count += 1
+
+    def close(self, complete=True):
+        """Finish the file; create the ``.done`` marker only if ``complete``.
+
+        Args:
+            complete (bool): False after a failed or interrupted run, so
+                readers do not mistake the partial stream for a finished one.
+        """
+        with self._lock:
+            if self._file.closed:
+                return
+            if self._compressor is not None:
+                self._file.write(self._compressor.flush())
+            self._file.close()
+        if complete:
+            with open(self.path + STREAM_DONE_SUFFIX, "w", encoding="utf-8") as f:
+                f.write(f"{self.count}\n")
+
+
+def follow_records(path, poll_interval=0.5, idle_timeout=600.0, sleep=time.sleep):
+    """Yield records from a JSONL file while another process is still writing it.
+
+    Each complete line is yielded as soon as it lands. Stops once the
+    writer's ``<path>.done`` marker exists and everything before it has been
+    read. Files ending in ``.gz`` are decompressed incrementally.
+
+    Args:
+        path: JSONL file being written (it may not exist yet).
+        poll_interval: Seconds to wait when no new data is available.
+        idle_timeout: Give up after this many seconds without new data
+            (None waits forever).
+        sleep: Sleep function (injectable for tests).
+
+    Yields:
+        dict: One record per complete line.
+
+    Raises:
+        TimeoutError: If the writer stalls for longer than ``idle_timeout``.
+    """
+    path = str(path)
+    done_marker = path + STREAM_DONE_SUFFIX
+    decompress = zlib.decompressobj(wbits=31).decompress if path.endswith(".gz") else None
+
+    f = None
+    pending = b""
+    idle = 0.0
+    try:
+        while True:
+            # Check the marker before reading: if it already existed, this
+            # read sees everything the writer will ever write.
+            finished = os.path.exists(done_marker)
+            if f is None and os.path.exists(path):
+                f = open(path, "rb")  # pylint: disable=consider-using-with
+            chunk = f.read(1 << 16) if f is not None else b""
+            if chunk:
+                idle = 0.0
+                pending += decompress(chunk) if decompress else chunk
+                *lines, pending = pending.split(b"\n")
+                for line in lines:
+                    if line.strip():
+                        yield json.loads(line)
+                continue
+            if finished:
+                if pending.strip():
+                    yield json.loads(pending)
+                return
+            if idle_timeout is not None and idle >= idle_timeout:
+                raise TimeoutError(f"No new records in {path} for {idle_timeout}s")
+            sleep(poll_interval)
+            idle += poll_interval
+    finally:
+        if f is not None:
+            f.close()
+
+
+__all__ = ["STREAM_DONE_SUFFIX", "RecordStream", "follow_records"]
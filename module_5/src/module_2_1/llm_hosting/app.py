@@ -0,0 +1,791 @@
+# -*- coding: utf-8 -*-
+"""Flask + tiny local LLM standardizer with incremental JSONL CLI output."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, Iterator, List, Tuple
+
+from flask import Flask, jsonify, request
+from huggingface_hub import hf_hub_download
+from llama_cpp import Llama, LlamaRAMCache  # CPU-only by default if N_GPU_LAYERS=0
+
+from fuzzy_index import FuzzyIndex
+
+app = Flask(__name__)
+
+# ---------------- Model config ----------------
+MODEL_REPO = os.getenv(
+    "MODEL_REPO",
+    "TheBloke/TinyLlama-1.1B-Chat-v1.0-GGUF",
+)
+MODEL_FILE = os.getenv(
+    "MODEL_FILE",
+    # "tinyllama-1.1b-chat-v1.0.Q4_K_M.gguf",
+    "tinyllama-1.1b-chat-v1.0.Q3_K_M.gguf",  # Smaller quantized model for better CPU performance, with minimal quality loss for this task
+)
+
+N_THREADS = int(os.getenv("N_THREADS", str(os.cpu_count() or 2)))
+N_CTX = int(os.getenv("N_CTX", "2048"))  # room for a batch after the few-shot prefix
+N_GPU_LAYERS = int(
+    os.getenv("N_GPU_LAYERS", "-1")
+)  # Try using my RTX3090 to speed up; 0 → CPU-only
+# N_GPU_LAYERS = 999  # Large value to use GPU if available, but still run on CPU if no compatible GPU is detected
+
+CANON_UNIS_PATH = os.getenv("CANON_UNIS_PATH", "canon_universities.txt")
+CANON_PROGS_PATH = os.getenv("CANON_PROGS_PATH", "canon_programs.txt")
+# Persistent standardization results shared across runs ("" disables)
+LLM_CACHE_PATH = os.getenv(
+    "LLM_CACHE_PATH", os.path.join(os.path.dirname(__file__), "llm_cache.db")
+)
+
+# Distinct inputs standardized per chat completion (1 = one request per input)
+LLM_BATCH_SIZE = max(1, int(os.getenv("LLM_BATCH_SIZE", "8")))
+# RAM for llama.cpp's prompt (KV state) cache; 0 disables
+PROMPT_CACHE_MB = int(os.getenv("PROMPT_CACHE_MB", "256"))
+# Rows held back at most while their inputs wait for a full LLM batch
+MAX_BUFFERED_ROWS = 1000
+
+# Fuzzy score the rules fast path needs before it trusts a match without the LLM
+RULES_FUZZY_CUTOFF = float(os.getenv("RULES_FUZZY_CUTOFF", "0.94"))
+
+# Precompiled, non-greedy JSON object matcher to tolerate chatter around JSON
+JSON_OBJ_RE = re.compile(r"\{.*?\}", re.DOTALL)
+# Greedy JSON array matcher for batched replies
+JSON_LIST_RE = re.compile(r"\[.*\]", re.DOTALL)
+
+
+# ---------------- Canonical lists + abbrev maps ----------------
+def _read_lines(path: str) -> List[str]:
+    """Read non-empty, stripped lines from a file (UTF-8)."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return [ln.strip() for ln in f if ln.strip()]
+    except FileNotFoundError:
+        return []
+
+
+CANON_UNIS = _read_lines(CANON_UNIS_PATH)
+CANON_PROGS = _read_lines(CANON_PROGS_PATH)
+CANON_UNI_SET = frozenset(CANON_UNIS)
+CANON_PROG_SET = frozenset(CANON_PROGS)
+CANON_UNI_INDEX = FuzzyIndex(CANON_UNIS)
+CANON_PROG_INDEX = FuzzyIndex(CANON_PROGS)
+
+ABBREV_UNI: Dict[str, str] = {
+    r"(?i)^mcg(\.|ill)?$": "McGill University",
+    r"(?i)^(ubc|u\.?b\.?c\.?)$": "University of British Columbia",
+    r"(?i)^uoft$": "University of Toronto",
+}
+
+COMMON_UNI_FIXES: Dict[str, str] = {
+    "McGiill University": "McGill University",
+    "Mcgill University": "McGill University",
+    # Normalize 'Of' → 'of'
+    "University Of British Columbia": "University of British Columbia",
+}
+
+COMMON_PROG_FIXES: Dict[str, str] = {
+    "Mathematic": "Mathematics",
+    "Info Studies": "Information Studies",
+}
+
+# ---------------- Few-shot prompt ----------------
+SYSTEM_PROMPT = (
+    "You are a data cleaning assistant. Standardize degree program and university "
+    "names.\n\n"
+    "Rules:\n"
+    "- Input provides a single string under key `program` that may contain both "
+    "program and university.\n"
+    "- Split into (program name, university name).\n"
+    "- Trim extra spaces and commas.\n"
+    '- Expand obvious abbreviations (e.g., "McG" -> "McGill University", '
+    '"UBC" -> "University of British Columbia").\n'
+    "- Use Title Case for program; use official capitalization for university "
+    'names (e.g., "University of X").\n'
+    '- Ensure correct spelling (e.g., "McGill", not "McGiill").\n'
+    '- If university cannot be inferred, return "Unknown".\n\n'
+    "Return JSON ONLY with keys:\n"
+    " standardized_program, standardized_university\n"
+)
+
+FEW_SHOTS: List[Tuple[Dict[str, str], Dict[str, str]]] = [
+    (
+        {"program": "Information Studies, McGill University"},
+        {
+            "standardized_program": "Information Studies",
+            "standardized_university": "McGill University",
+        },
+    ),
+    (
+        {"program": "Information, McG"},
+        {
+            "standardized_program": "Information Studies",
+            "standardized_university": "McGill University",
+        },
+    ),
+    (
+        {"program": "Mathematics, University Of British Columbia"},
+        {
+            "standardized_program": "Mathematics",
+            "standardized_university": "University of British Columbia",
+        },
+    ),
+]
+
+
+def _few_shot_messages() -> List[Dict[str, str]]:
+    """System prompt and single-row few-shots: the fixed prefix of every request."""
+    messages = [{"role": "system", "content": SYSTEM_PROMPT}]
+    for x_in, x_out in FEW_SHOTS:
+        messages.append(
+            {"role": "user", "content": json.dumps(x_in, ensure_ascii=False)}
+        )
+        messages.append(
+            {
+                "role": "assistant",
+                "content": json.dumps(x_out, ensure_ascii=False),
+            }
+        )
+    return messages
+
+
+def _batch_request(program_texts: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+    """Number the inputs of a batch; the model echoes each ``id`` in its reply."""
+    return {
+        "programs": [
+            {"id": i, "program": program_text} for i, program_text in enumerate(program_texts)
+        ]
+    }
+
+
+def _batch_shot_messages() -> List[Dict[str, str]]:
+    """One more few-shot showing the batched form: numbered inputs, numbered replies."""
+    return [
+        {
+            "role": "user",
+            "content": json.dumps(
+                _batch_request([x_in["program"] for x_in, _ in FEW_SHOTS]),
+                ensure_ascii=False,
+            ),
+        },
+        {
+            "role": "assistant",
+            "content": json.dumps(
+                [{"id": i, **x_out} for i, (_, x_out) in enumerate(FEW_SHOTS)],
+                ensure_ascii=False,
+            ),
+        },
+    ]
+
+
+# Built once so every request starts with identical tokens; llama.cpp then
+# reuses the KV state of this prefix instead of re-evaluating it.
+PREFIX_MESSAGES = _few_shot_messages()
+BATCH_PREFIX_MESSAGES = PREFIX_MESSAGES + _batch_shot_messages()
+
+_LLM: Llama | None = None
+
+
+def _load_llm() -> Llama:
+    """Download (or reuse) the GGUF file and initialize llama.cpp."""
+    global _LLM
+    if _LLM is not None:
+        return _LLM
+
+    BASE_DIR = os.path.dirname(__file__)
+    model_path = os.path.join(BASE_DIR, "models", MODEL_FILE)
+
+    print("Loading model:", model_path)
+    print(f"Using {N_GPU_LAYERS} GPU layers")
+
+    # model_path = hf_hub_download(
+    #    repo_id=MODEL_REPO,
+    #    filename=MODEL_FILE,
+    #    local_dir="models",
+    #    local_dir_use_symlinks=False,
+    #    force_filename=MODEL_FILE,
+    # )
+
+    _LLM = Llama(
+        model_path=model_path,
+        n_ctx=N_CTX,
+        n_threads=N_THREADS,
+        n_gpu_layers=N_GPU_LAYERS,
+        n_batch=512,
+        verbose=True,  # CHANGE TO True to see GPU messages
+    )
+    print(f"Model loaded. GPU layers: {N_GPU_LAYERS}")  # ADD THIS LINE
+    if PROMPT_CACHE_MB > 0:
+        # Restore the evaluated few-shot prefix from RAM on every request
+        _LLM.set_cache(LlamaRAMCache(capacity_bytes=PROMPT_CACHE_MB << 20))
+
+    return _LLM
+
+
+def _split_fallback(text: str) -> Tuple[str, str]:
+    """Simple, rules-first parser if the model returns non-JSON."""
+    s = re.sub(r"\s+", " ", (text or "")).strip().strip(",")
+    parts = [p.strip() for p in re.split(r",| at | @ ", s) if p.strip()]
+    prog = parts[0] if parts else ""
+    uni = parts[1] if len(parts) > 1 else ""
+
+    # High-signal expansions
+    if re.fullmatch(r"(?i)mcg(ill)?(\.)?", uni or ""):
+        uni = "McGill University"
+    if re.fullmatch(
+        r"(?i)(ubc|u\.?b\.?c\.?|university of british columbia)",
+        uni or "",
+    ):
+        uni = "University of British Columbia"
+
+    # Title-case program; normalize 'Of' → 'of' for universities
+    prog = prog.title()
+    if uni:
+        uni = re.sub(r"\bOf\b", "of", uni.title())
+    else:
+        uni = "Unknown"
+    return prog, uni
+
+
+def _best_match(name: str, index: FuzzyIndex, cutoff: float = 0.86) -> str | None:
+    """Fuzzy match via the canonical list's index (same result as difflib)."""
+    if not name:
+        return None
+    return index.best(name, cutoff=cutoff)
+
+
+def _post_normalize_program(prog: str) -> str:
+    """Apply common fixes, title case, then canonical/fuzzy mapping."""
+    p = (prog or "").strip()
+    p = COMMON_PROG_FIXES.get(p, p)
+    p = p.title()
+    if p in CANON_PROG_SET:
+        return p
+    match = _best_match(p, CANON_PROG_INDEX, cutoff=0.84)
+    return match or p
+
+
+def _post_normalize_university(uni: str) -> str:
+    """Expand abbreviations, apply common fixes, capitalization, and canonical map."""
+    u = (uni or "").strip()
+
+    # Abbreviations
+    for pat, full in ABBREV_UNI.items():
+        if re.fullmatch(pat, u):
+            u = full
+            break
+
+    # Common spelling fixes
+    u = COMMON_UNI_FIXES.get(u, u)
+
+    # Normalize 'Of' → 'of'
+    if u:
+        u = re.sub(r"\bOf\b", "of", u.title())
+
+    # Canonical or fuzzy map
+    if u in CANON_UNI_SET:
+        return u
+    match = _best_match(u, CANON_UNI_INDEX, cutoff=0.86)
+    return match or u or "Unknown"
+
+
+def _finish_result(std_prog: str, std_uni: str) -> Dict[str, str]:
+    """Apply canonical post-normalization to the model's raw answer."""
+    return {
+        "standardized_program": _post_normalize_program(std_prog),
+        "standardized_university": _post_normalize_university(std_uni),
+    }
+
+
+def _call_llm(program_text: str) -> Dict[str, str]:
+    """Query the tiny LLM and return standardized fields."""
+    llm = _load_llm()
+
+    messages = PREFIX_MESSAGES + [
+        {
+            "role": "user",
+            "content": json.dumps({"program": program_text}, ensure_ascii=False),
+        }
+    ]
+
+    out = llm.create_chat_completion(
+        messages=messages,
+        temperature=0.0,
+        max_tokens=32,
+        top_p=1.0,
+    )
+
+    text = (out["choices"][0]["message"]["content"] or "").strip()
+    try:
+        match = JSON_OBJ_RE.search(text)
+        obj = json.loads(match.group(0) if match else text)
+        std_prog = str(obj.get("standardized_program", "")).strip()
+        std_uni = str(obj.get("standardized_university", "")).strip()
+    except Exception:
+        std_prog, std_uni = _split_fallback(program_text)
+
+    return _finish_result(std_prog, std_uni)
+
+
+def _replies_by_id(objs: List[Any], count: int) -> Dict[int, Dict[str, Any]]:
+    """Map each input id to its reply, dropping ids that are missing or repeated."""
+    valid = [
+        obj
+        for obj in objs
+        if isinstance(obj, dict)
+        and isinstance(obj.get("id"), int)
+        and 0 <= obj["id"] < count
+    ]
+    ids = Counter(obj["id"] for obj in valid)
+    return {obj["id"]: obj for obj in valid if ids[obj["id"]] == 1}
+
+
+def _call_llm_batch(program_texts: List[str]) -> List[Dict[str, str]]:
+    """Standardize several inputs with one chat completion.
+
+    The inputs go in as one JSON list, each with an ``id``, and the model
+    answers with a JSON array whose objects echo those ids, so the shared
+    prefix is evaluated once per batch and all inputs share one prompt-eval
+    pass. Replies are matched to inputs by id, not by position: an input
+    whose id is missing or repeated in the reply (or every input, if the
+    reply does not parse or the batch does not fit the context) is retried
+    on its own with :func:`_call_llm`.
+    """
+    if len(program_texts) == 1:
+        return [_call_llm(program_texts[0])]
+
+    llm = _load_llm()
+    messages = BATCH_PREFIX_MESSAGES + [
+        {
+            "role": "user",
+            "content": json.dumps(_batch_request(program_texts), ensure_ascii=False),
+        }
+    ]
+    try:
+        out = llm.create_chat_completion(
+            messages=messages,
+            temperature=0.0,
+            max_tokens=48 * len(program_texts),
+            top_p=1.0,
+        )
+        text = (out["choices"][0]["message"]["content"] or "").strip()
+        match = JSON_LIST_RE.search(text)
+        objs = json.loads(match.group(0) if match else text)
+        if not isinstance(objs, list):
+            raise ValueError("batched reply is not a JSON array")
+    except Exception:
+        return [_call_llm(program_text) for program_text in program_texts]
+
+    replies = _replies_by_id(objs, len(program_texts))
+    results = []
+    for i, program_text in enumerate(program_texts):
+        obj = replies.get(i)
+        if obj is None:
+            results.append(_call_llm(program_text))
+            continue
+        std_prog = str(obj.get("standardized_program", "")).strip()
+        std_uni = str(obj.get("standardized_university", "")).strip()
+        results.append(_finish_result(std_prog, std_uni))
+    return results
+
+
+# ---------------- Persistent result cache ----------------
+def _cache_fingerprint() -> str:
+    """Hash everything that shapes a result: model, batch size, prompt and tables."""
+    digest = hashlib.sha256()
+    for part in (
+        MODEL_FILE,
+        str(LLM_BATCH_SIZE),
+        json.dumps(BATCH_PREFIX_MESSAGES, sort_keys=True),
+        json.dumps([ABBREV_UNI, COMMON_UNI_FIXES, COMMON_PROG_FIXES], sort_keys=True),
+        "\n".join(CANON_UNIS),
+        "\n".join(CANON_PROGS),
+    ):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()[:16]
+
+
+class ResultCache:
+    """SQLite store of standardized results keyed by normalized input text.
+
+    Keys are scoped by a fingerprint of the model file, batch size, prompt
+    and normalization tables, so changing any of them starts a fresh cache;
+    rows from other fingerprints are dropped when the cache is opened.
+    """
+
+    def __init__(self, path: str, fingerprint: str) -> None:
+        self.fingerprint = fingerprint
+        self.hits = self.misses = 0
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.executescript(
+            """
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            CREATE TABLE IF NOT EXISTS results (
+                fingerprint TEXT NOT NULL,
+                key TEXT NOT NULL,
+                program TEXT NOT NULL,
+                university TEXT NOT NULL,
+                PRIMARY KEY (fingerprint, key)
+            ) WITHOUT ROWID;
+            """
+        )
+        with self._db:
+            self._db.execute("DELETE FROM results WHERE fingerprint != ?", (fingerprint,))
+
+    def get(self, key: str) -> Dict[str, str] | None:
+        """Return the stored result for ``key``, or None."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT program, university FROM results WHERE fingerprint = ? AND key = ?",
+                (self.fingerprint, key),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return {"standardized_program": row[0], "standardized_university": row[1]}
+
+    def put(self, key: str, result: Dict[str, str]) -> None:
+        """Store the result for ``key``."""
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)",
+                (
+                    self.fingerprint,
+                    key,
+                    result["standardized_program"],
+                    result["standardized_university"],
+                ),
+            )
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            self._db.close()
+
+
+_RESULT_CACHE: ResultCache | None = None
+# Serializes opening the cache, so concurrent first requests share one
+# connection instead of each opening (and migrating) the SQLite file.
+_RESULT_CACHE_LOCK = threading.Lock()
+
+
+def _result_cache() -> ResultCache | None:
+    """Open (or reuse) the persistent cache at LLM_CACHE_PATH, if enabled."""
+    global _RESULT_CACHE
+    if _RESULT_CACHE is None and LLM_CACHE_PATH:
+        with _RESULT_CACHE_LOCK:
+            if _RESULT_CACHE is None:
+                _RESULT_CACHE = ResultCache(LLM_CACHE_PATH, _cache_fingerprint())
+    return _RESULT_CACHE
+
+
+# ---------------- Tiered resolver ----------------
+# Rule tiers from most to least certain; a row's tier is its weaker field's.
+RULE_TIERS = ("exact", "abbrev", "fuzzy")
+
+# Distinct inputs resolved by each tier: the rule tiers, "cache" and "llm".
+TIER_HITS: Counter = Counter()
+
+
+def _clean_field(text: str | None) -> str:
+    """Collapse whitespace and trim stray commas."""
+    return re.sub(r"\s+", " ", text or "").strip(" ,")
+
+
+def _resolve_program_rules(prog: str | None) -> Tuple[str, str] | None:
+    """Map a program to its canonical name without the LLM, with the tier used."""
+    p = _clean_field(prog)
+    if not p:
+        return None
+    if p in CANON_PROG_SET:
+        return p, "exact"
+    if p in COMMON_PROG_FIXES:
+        return COMMON_PROG_FIXES[p], "abbrev"
+    titled = p.title()
+    if titled in CANON_PROG_SET:
+        return titled, "exact"
+    match = _best_match(titled, CANON_PROG_INDEX, cutoff=RULES_FUZZY_CUTOFF)
+    return (match, "fuzzy") if match else None
+
+
+def _resolve_university_rules(uni: str | None) -> Tuple[str, str] | None:
+    """Map a university to its canonical name without the LLM, with the tier used."""
+    u = _clean_field(uni)
+    if not u:
+        return None
+    if u in CANON_UNI_SET:
+        return u, "exact"
+    for pat, full in ABBREV_UNI.items():
+        if re.fullmatch(pat, u):
+            return full, "abbrev"
+    if u in COMMON_UNI_FIXES:
+        return COMMON_UNI_FIXES[u], "abbrev"
+    titled = re.sub(r"\bOf\b", "of", u.title())
+    if titled in CANON_UNI_SET:
+        return titled, "exact"
+    match = _best_match(titled, CANON_UNI_INDEX, cutoff=RULES_FUZZY_CUTOFF)
+    return (match, "fuzzy") if match else None
+
+
+def _resolve_rules(
+    program: str | None, university: str | None
+) -> Tuple[Dict[str, str], str] | None:
+    """Standardize a row from the canonical lists alone, if both fields resolve.
+
+    Returns:
+        The result and the weakest tier used, or None to defer to the LLM.
+    """
+    prog = _resolve_program_rules(program)
+    uni = _resolve_university_rules(university)
+    if prog is None or uni is None:
+        return None
+    tier = max(prog[1], uni[1], key=RULE_TIERS.index)
+    return {"standardized_program": prog[0], "standardized_university": uni[0]}, tier
+
+
+def _resolve_without_llm(row: Dict[str, Any], key: str) -> Dict[str, str] | None:
+    """Standardize one distinct input from the rule tiers or the persistent cache."""
+    ruled = _resolve_rules(row.get("program_name"), row.get("university"))
+    if ruled is not None:
+        result, tier = ruled
+        TIER_HITS[tier] += 1
+        return result
+
+    cache = _result_cache()
+    if cache is not None:
+        result = cache.get(key)
+        if result is not None:
+            TIER_HITS["cache"] += 1
+            return result
+    return None
+
+
+def _resolve_with_llm(pending: Dict[str, str]) -> Dict[str, Dict[str, str]]:
+    """Run the LLM over ``pending`` (key -> input text) in batches and cache the results."""
+    keys = list(pending)
+    cache = _result_cache()
+    results: Dict[str, Dict[str, str]] = {}
+    for start in range(0, len(keys), LLM_BATCH_SIZE):
+        batch = keys[start : start + LLM_BATCH_SIZE]
+        for key, result in zip(batch, _call_llm_batch([pending[k] for k in batch])):
+            results[key] = result
+            TIER_HITS["llm"] += 1
+            if cache is not None:
+                cache.put(key, result)
+    return results
+
+
+def _tier_summary() -> str:
+    """Describe how distinct inputs were resolved, e.g. ``exact 80% | llm 5%``."""
+    total = sum(TIER_HITS.values())
+    return " | ".join(
+        f"{tier} {TIER_HITS[tier] / total:.0%}"
+        for tier in RULE_TIERS + ("cache", "llm")
+        if TIER_HITS[tier]
+    )
+
+
+def _row_text(row: Dict[str, Any]) -> str:
+    """Build the "program, university" string sent to the model for a row."""
+    return f"{row.get('program_name', '')}, {row.get('university', '')}".strip(", ")
+
+
+def _dedup_key(text: str) -> str:
+    """Normalize input text so trivially different spellings share one result."""
+    return re.sub(r"\s+", " ", text).strip(" ,").casefold()
+
+
+def _standardize_rows(
+    rows: List[Dict[str, Any]],
+    results: Dict[str, Dict[str, str]] | None = None,
+) -> Iterator[Dict[str, Any]]:
+    """Standardize rows in order, calling the LLM once per distinct input.
+
+    GradCafe rows repeat the same program/university text thousands of
+    times, so each normalized input is resolved (by the rule tiers, the
+    persistent cache, then the model) only the first time it is seen and
+    the result is reused for every later row. Inputs that need the model
+    are collected into batches of :data:`LLM_BATCH_SIZE`; rows wait only
+    while one of their inputs is in an unfinished batch.
+
+    Args:
+        rows: Input rows with ``program_name`` and ``university``.
+        results: Memo of normalized input -> LLM result; pass a dict to
+            share it across calls or to count distinct inputs.
+
+    Yields:
+        Each row, in input order, with the two ``llm-generated-*`` fields set.
+    """
+    if results is None:
+        results = {}
+    waiting: List[Tuple[Dict[str, Any], str]] = []
+    pending: Dict[str, str] = {}
+
+    def flush() -> Iterator[Dict[str, Any]]:
+        if pending:
+            results.update(_resolve_with_llm(pending))
+            pending.clear()
+        for row, key in waiting:
+            result = results[key]
+            row["llm-generated-program"] = result["standardized_program"]
+            row["llm-generated-university"] = result["standardized_university"]
+            yield row
+        waiting.clear()
+
+    for row in rows:
+        program_text = _row_text(row)
+        key = _dedup_key(program_text)
+        if key not in results and key not in pending:
+            result = _resolve_without_llm(row, key)
+            if result is None:
+                pending[key] = program_text
+            else:
+                results[key] = result
+        waiting.append((row, key))
+        if (
+            not pending
+            or len(pending) >= LLM_BATCH_SIZE
+            or len(waiting) >= MAX_BUFFERED_ROWS
+        ):
+            yield from flush()
+    yield from flush()
+
+
+def _normalize_input(payload: Any) -> List[Dict[str, Any]]:
+    """Accept either a list of rows or {'rows': [...]}."""
+    if isinstance(payload, list):
+        return payload
+    if isinstance(payload, dict) and isinstance(payload.get("rows"), list):
+        return payload["rows"]
+    return []
+
+
+@app.get("/")
+def health() -> Any:
+    """Simple liveness check."""
+    return jsonify({"ok": True})
+
+
+@app.post("/standardize")
+def standardize() -> Any:
+    """Standardize rows from an HTTP request and return JSON."""
+    payload = request.get_json(force=True, silent=True)
+    rows = _normalize_input(payload)
+
+    out: List[Dict[str, Any]] = list(_standardize_rows(rows))
+
+    return jsonify({"rows": out})
+
+
+def _cli_process_file(
+    in_path: str,
+    out_path: str | None,
+    append: bool,
+    to_stdout: bool,
+) -> None:
+    """Process a JSON file and write JSONL incrementally, with progress reporting."""
+    with open(in_path, "r", encoding="utf-8") as f:
+        rows = _normalize_input(json.load(f))
+
+    total = len(rows)
+    count = 0
+    start_time = time.time()
+
+    sink = sys.stdout if to_stdout else None
+    if not to_stdout:
+        out_path = out_path or (in_path + ".jsonl")
+        mode = "a" if append else "w"
+        sink = open(out_path, mode, encoding="utf-8")
+    assert sink is not None
+    results: Dict[str, Dict[str, str]] = {}
+    try:
+        for row in _standardize_rows(rows, results):
+            count += 1
+            json.dump(row, sink, ensure_ascii=False)
+            sink.write("\n")
+            sink.flush()
+
+            # ---- Progress reporting ----
+            if count % 100 == 0 or count == total:
+                elapsed = time.time() - start_time
+                rate = count / elapsed if elapsed > 0 else 0
+                remaining = (total - count) / rate if rate > 0 else 0
+                print(
+                    f"[Progress] {count}/{total} rows "
+                    f"({count/total:.1%}) | "
+                    f"Distinct inputs: {len(results)} ({_tier_summary()}) | "
+                    f"Elapsed: {elapsed/60:.1f} min | "
+                    f"ETA: {remaining/60:.1f} min",
+                    flush=True,
+                )
+                # Write status.txt
+                with open("LLM_status.txt", "w", encoding="utf-8") as s:
+                    s.write(
+                        f"[Progress] {count}/{total} rows "
+                        f"({count/total:.1%}) | "
+                        f"Elapsed: {elapsed/60:.1f} min | "
+                        f"ETA: {remaining/60:.1f} min\n"
+                    )
+
+    finally:
+        if sink is not sys.stdout:
+            sink.close()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Standardize program/university with a tiny local LLM.",
+    )
+    parser.add_argument(
+        "--file",
+        help="Path to JSON input (list of rows or {'rows': [...]})",
+        default=None,
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Run the HTTP server instead of CLI.",
+    )
+    parser.add_argument(
+        "--out",
+        default=None,
+        help="Output path for JSON Lines (ndjson). "
+        "Defaults to <input>.jsonl when --file is set.",
+    )
+    parser.add_argument(
+        "--append",
+        action="store_true",
+        help="Append to the output file instead of overwriting.",
+    )
+    parser.add_argument(
+        "--stdout",
+        action="store_true",
+        help="Write JSON Lines to stdout instead of a file.",
+    )
+    args = parser.parse_args()
+
+    if args.serve or args.file is None:
+        port = int(os.getenv("PORT", "8000"))
+        app.run(host="0.0.0.0", port=port, debug=False)
+    else:
+        _cli_process_file(
+            in_path=args.file,
+            out_path=args.out,
+            append=bool(args.append),
+            to_stdout=bool(args.stdout),
+        )
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""Indexed drop-in for ``difflib.get_close_matches(name, candidates, n=1)``."""
+
+from __future__ import annotations
+
+import difflib
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from typing import Dict, Iterable, List, Tuple
+
+
+class FuzzyIndex:
+    """Best fuzzy match over a fixed candidate list, without scanning all of it.
+
+    ``difflib.SequenceMatcher.ratio`` is ``2*M/T``, where ``M`` can never
+    exceed the number of characters the two strings share as multisets
+    (``quick_ratio``). Each candidate is stored as a bitmask with one bit per
+    (character, occurrence) pair, so that bound is a single
+    ``(query & candidate).bit_count()``. Candidates are sorted by length so
+    only those whose length alone allows the cutoff are considered; those
+    are then scored best-bound-first, stopping once no remaining bound can
+    beat the best ratio found.
+
+    The bounds never cut a candidate that could win, so :meth:`best` returns
+    exactly what ``difflib.get_close_matches(name, candidates, n=1,
+    cutoff=cutoff)`` returns, ties included.
+    """
+
+    def __init__(self, candidates: Iterable[str]) -> None:
+        self.candidates: List[str] = sorted(dict.fromkeys(candidates), key=len)
+        self.members = frozenset(self.candidates)
+        self._bits: Dict[Tuple[str, int], int] = {}
+        self._lengths = [len(c) for c in self.candidates]
+        self._masks = [self._mask(c, grow=True) for c in self.candidates]
+
+    def _mask(self, text: str, grow: bool = False) -> int:
+        """Bitmask of ``text``'s (character, occurrence) pairs."""
+        seen: Counter = Counter()
+        mask = 0
+        for char in text:
+            key = (char, seen[char])
+            seen[char] += 1
+            bit = self._bits.get(key)
+            if bit is None:
+                if not grow:
+                    continue  # no candidate has it, so it cannot be shared
+                bit = self._bits[key] = len(self._bits)
+            mask |= 1 << bit
+        return mask
+
+    def best(self, name: str, cutoff: float = 0.6) -> str | None:
+        """Return the candidate most similar to ``name`` scoring >= ``cutoff``."""
+        if name in self.members:
+            return name
+        size = len(name)
+        if not size:
+            return None
+
+        # ratio <= 2*min(len)/T, so only this length range can reach the cutoff.
+        low = bisect_left(self._lengths, size * cutoff / (2 - cutoff) - 1e-9)
+        high = bisect_right(self._lengths, size * (2 - cutoff) / cutoff + 1e-9)
+        query = self._mask(name)
+        bounded = []
+        for i in range(low, high):
+            bound = 2.0 * (query & self._masks[i]).bit_count() / (size + self._lengths[i])
+            if bound >= cutoff:
+                bounded.append((bound, i))
+        bounded.sort(reverse=True)
+
+        # Same argument order as get_close_matches: seq2 is the query.
+        matcher = difflib.SequenceMatcher()
+        matcher.set_seq2(name)
+        best: Tuple[float, str] | None = None
+        for bound, i in bounded:
+            if best is not None and bound < best[0]:
+                break
+            candidate = self.candidates[i]
+            matcher.set_seq1(candidate)
+            score = matcher.ratio()
+            if score >= cutoff and (best is None or (score, candidate) > best):
+                best = (score, candidate)
+        return best[1] if best is not None else None
@@ -0,0 +1,249 @@
+"""
+page_cache.py -- SQLite cache of GradCafe pages
+-----------------------------------------------
+Stores raw detail pages keyed by result ID (plus their parsed fields) and
+listing pages with their validators, so re-runs and ``--offline`` runs skip
+the network.
+"""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+
+try:
+    from .fetch import _header
+except ImportError:  # pragma: no cover - run as a script: python src/module_2_1/scrape.py
+    from fetch import _header  # pylint: disable=import-error
+
+DETAIL_CACHE_FILE = os.path.join("module_2_1", "detail_cache.db")
+_RESULT_ID_RE = re.compile(r"/result/(\d+)")
+
+
+def _result_id(url):
+    """Return the numeric GradCafe result ID in ``url``, or None."""
+    match = _RESULT_ID_RE.search(url or "")
+    return int(match.group(1)) if match else None
+
+
+class PageCache:  # pylint: disable=too-many-instance-attributes
+    """SQLite cache of detail pages keyed by result ID, plus listing pages.
+
+    Detail entries keep the compressed raw HTML, the parsed fields and the
+    ``ETag``/``Last-Modified`` validators; listing pages keep the same, with
+    their parsed rows, and are always revalidated. Detail entries younger than
+    ``revalidate_after`` are served as-is; older ones are revalidated with a
+    conditional GET. Entries older than ``max_age`` and anything beyond the
+    newest ``max_entries`` are evicted when the cache is opened.
+
+    Args:
+        path (str): SQLite file location.
+        offline (bool): Never touch the network; re-parse cached HTML only.
+        revalidate_after (float): Seconds before an entry is revalidated.
+        max_age (float): Seconds before an entry is evicted.
+        max_entries (int): Maximum number of cached detail pages.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        path=DETAIL_CACHE_FILE,
+        *,
+        offline=False,
+        revalidate_after=7 * 86400,
+        max_age=180 * 86400,
+        max_entries=250_000,
+        clock=time.time,
+    ):
+        self.path = path
+        self.offline = offline
+        self.revalidate_after = revalidate_after
+        self.max_age = max_age
+        self.max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.executescript(
+            """
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            CREATE TABLE IF NOT EXISTS detail_pages (
+                result_id INTEGER PRIMARY KEY,
+                url TEXT NOT NULL,
+                html BLOB,
+                parsed TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS detail_pages_fetched_at
+                ON detail_pages (fetched_at);
+            CREATE TABLE IF NOT EXISTS listing_pages (
+                url TEXT PRIMARY KEY,
+                html BLOB,
+                fetched_at REAL NOT NULL,
+                parsed TEXT,
+                etag TEXT,
+                last_modified TEXT
+            );
+            """
+        )
+        self._migrate()
+        self.hits = self.misses = self.revalidated = 0
+        self.listings_not_modified = 0
+        self.evict()
+
+    def _migrate(self):
+        """Add the listing validator columns to caches created before them."""
+        columns = {row[1] for row in self._db.execute("PRAGMA table_info(listing_pages)")}
+        with self._db:
+            for column in ("parsed", "etag", "last_modified"):
+                if column not in columns:
+                    self._db.execute(f"ALTER TABLE listing_pages ADD COLUMN {column} TEXT")
+
+    def get(self, result_id):
+        """Return the cached detail entry for ``result_id``, or None."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT url, html, parsed, etag, last_modified, fetched_at "
+                "FROM detail_pages WHERE result_id = ?",
+                (result_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        url, html, parsed, etag, last_modified, fetched_at = row
+        return {
+            "url": url,
+            "html": zlib.decompress(html).decode("utf-8") if html else "",
+            "parsed": json.loads(parsed),
+            "etag": etag,
+            "last_modified": last_modified,
+            "fetched_at": fetched_at,
+        }
+
+    def is_fresh(self, entry):
+        """True if ``entry`` can be served without revalidation."""
+        return self._clock() - entry["fetched_at"] < self.revalidate_after
+
+    def put(self, result_id, url, html, parsed, headers=None):
+        """Store a freshly fetched detail page and its parsed fields."""
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO detail_pages "
+                "(result_id, url, html, parsed, etag, last_modified, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    result_id,
+                    url,
+                    zlib.compress(html.encode("utf-8")),
+                    json.dumps(parsed),
+                    _header(headers, "ETag"),
+                    _header(headers, "Last-Modified"),
+                    self._clock(),
+                ),
+            )
+
+    def touch(self, result_id):
+        """Mark an entry as revalidated (server answered 304)."""
+        with self._lock, self._db:
+            self._db.execute(
+                "UPDATE detail_pages SET fetched_at = ? WHERE result_id = ?",
+                (self._clock(), result_id),
+            )
+
+    def get_listing(self, url):
+        """Return cached listing-page HTML for ``url``, or None."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT html FROM listing_pages WHERE url = ?", (url,)
+            ).fetchone()
+        return zlib.decompress(row[0]).decode("utf-8") if row else None
+
+    def get_listing_entry(self, url):
+        """Return the cached listing page for ``url`` with its validators, or None.
+
+        ``parsed`` is None for pages stored without their rows.
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT parsed, etag, last_modified FROM listing_pages WHERE url = ?",
+                (url,),
+            ).fetchone()
+        if row is None:
+            return None
+        parsed, etag, last_modified = row
+        return {
+            "parsed": json.loads(parsed) if parsed is not None else None,
+            "etag": etag,
+            "last_modified": last_modified,
+        }
+
+    def put_listing(self, url, html, parsed=None, headers=None):
+        """Store listing-page HTML so offline runs can replay the crawl.
+
+        With ``parsed`` rows and response ``headers``, the page can later be
+        revalidated and its rows reused on a 304.
+        """
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO listing_pages "
+                "(url, html, fetched_at, parsed, etag, last_modified) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    url,
+                    zlib.compress(html.encode("utf-8")),
+                    self._clock(),
+                    json.dumps(parsed) if parsed is not None else None,
+                    _header(headers, "ETag"),
+                    _header(headers, "Last-Modified"),
+                ),
+            )
+
+    def touch_listing(self, url):
+        """Mark a listing page as revalidated (server answered 304)."""
+        with self._lock, self._db:
+            self._db.execute(
+                "UPDATE listing_pages SET fetched_at = ? WHERE url = ?", (self._clock(), url)
+            )
+
+    def evict(self):
+        """Drop entries older than ``max_age`` and trim to ``max_entries``.
+
+        Returns:
+            int: Number of detail pages removed.
+        """
+        cutoff = self._clock() - self.max_age
+        with self._lock, self._db:
+            removed = self._db.execute(
+                "DELETE FROM detail_pages WHERE fetched_at < ?", (cutoff,)
+            ).rowcount
+            self._db.execute(
+                "DELETE FROM listing_pages WHERE fetched_at < ?", (cutoff,)
+            )
+            removed += self._db.execute(
+                "DELETE FROM detail_pages WHERE result_id NOT IN ("
+                "SELECT result_id FROM detail_pages "
+                "ORDER BY fetched_at DESC LIMIT ?)",
+                (self.max_entries,),
+            ).rowcount
+        return removed
+
+    def __len__(self):
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM detail_pages").fetchone()[0]
+
+    def close(self):
+        """Close the SQLite connection."""
+        with self._lock:
+            self._db.close()
+
+
+__all__ = [
+    "DETAIL_CACHE_FILE",
+    "PageCache",
+]
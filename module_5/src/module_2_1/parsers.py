@@ -0,0 +1,580 @@
+"""
+parsers.py -- listing and detail page parsers
+---------------------------------------------
+Two interchangeable backends: a streaming ``HTMLParser`` ("fast", the
+default) and BeautifulSoup ("soup"). Detail pages can be parsed in a process
+pool (:func:`configure_parse_pool`) so parsing does not hold the GIL while
+fetch threads wait on the network.
+"""
+
+import multiprocessing
+import re
+from concurrent.futures import ProcessPoolExecutor
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup  # pylint: disable=import-error
+
+DETAIL_FIELDS = (
+    "comments",
+    "term",
+    "citizenship",
+    "gpa",
+    "gre_total",
+    "gre_v",
+    "gre_q",
+    "gre_aw",
+)
+
+
+def _empty_detail():
+    """Return a detail dict with every field set to None."""
+    return dict.fromkeys(DETAIL_FIELDS)
+
+
+# ---------------------------------------------------------------------------
+# Parser backends
+# ---------------------------------------------------------------------------
+
+# "fast" streams html.parser tokens and keeps only the text the extractors
+# read; "soup" builds a full BeautifulSoup tree. Both return the same fields.
+PARSER_BACKENDS = ("fast", "soup")
+PARSER_BACKEND = "fast"
+
+# Elements whose text the detail extractor scans, in document order.
+DETAIL_BLOCK_TAGS = frozenset(("div", "p", "li", "dd"))
+_VOID_TAGS = frozenset(
+    "area base br col embed hr img input link meta param source track wbr".split()
+)
+# BeautifulSoup leaves these out of get_text().
+_SKIPPED_TEXT_TAGS = frozenset(("script", "style", "template"))
+
+
+def configure_parser(backend):
+    """Select the HTML parser backend (``"fast"`` or ``"soup"``)."""
+    global PARSER_BACKEND  # pylint: disable=global-statement
+    if backend not in PARSER_BACKENDS:
+        raise ValueError(f"Unknown parser backend: {backend!r}")
+    PARSER_BACKEND = backend
+    return PARSER_BACKEND
+
+
+class _Capture:  # pylint: disable=too-few-public-methods
+    """Stripped text nodes of one element."""
+
+    __slots__ = ("texts",)
+
+    def __init__(self):
+        self.texts = []
+
+    def text(self, separator=""):
+        """Equivalent of ``get_text(separator, strip=True)``."""
+        return separator.join(self.texts)
+
+
+class _StreamingParser(HTMLParser):
+    """Walk html.parser tokens with a tag stack instead of building a tree.
+
+    End tags close the nearest open element of that name and stray end tags
+    are ignored, as in BeautifulSoup's html.parser tree builder. Subclasses
+    return the captures an element should collect text into from
+    :meth:`open_element`.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self._stack = []  # (tag, captures)
+        self._open = []  # captures of every open element, flattened
+        self._skip = 0
+
+    def open_element(self, tag, attrs):  # pylint: disable=unused-argument
+        """Return the captures to collect for a newly opened element."""
+        return ()
+
+    def close_element(self, tag):
+        """Hook called when an element is closed."""
+
+    def handle_starttag(self, tag, attrs):
+        if tag in _VOID_TAGS:
+            return
+        captures = self.open_element(tag, attrs)
+        self._stack.append((tag, captures))
+        self._open.extend(captures)
+        if tag in _SKIPPED_TEXT_TAGS:
+            self._skip += 1
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in _VOID_TAGS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        if not any(open_tag == tag for open_tag, _ in self._stack):
+            return
+        while True:
+            open_tag, captures = self._stack.pop()
+            if captures:
+                del self._open[-len(captures):]
+            if open_tag in _SKIPPED_TEXT_TAGS:
+                self._skip -= 1
+            self.close_element(open_tag)
+            if open_tag == tag:
+                return
+
+    def handle_data(self, data):
+        if self._skip:
+            return
+        text = data.strip()
+        if text:
+            for capture in self._open:
+                capture.texts.append(text)
+
+
+class _DetailTextParser(_StreamingParser):
+    """Collect the text of every div/p/li/dd block, in document order."""
+
+    def __init__(self):
+        super().__init__()
+        self.blocks = []
+
+    def open_element(self, tag, attrs):
+        if tag in DETAIL_BLOCK_TAGS:
+            capture = _Capture()
+            self.blocks.append(capture)
+            return (capture,)
+        return ()
+
+
+def _detail_blocks(html):
+    """Return the stripped text of each div/p/li/dd block in ``html``."""
+    if PARSER_BACKEND == "soup":
+        soup = BeautifulSoup(html, "html.parser")
+        return [el.get_text(strip=True) for el in soup.find_all(list(DETAIL_BLOCK_TAGS))]
+
+    parser = _DetailTextParser()
+    parser.feed(html)
+    parser.close()
+    return [block.text() for block in parser.blocks]
+
+
+def _parse_detail_html(html: str):
+    """Parse detail data from HTML - optimized version."""
+    return _extract_detail_fields(_detail_blocks(html))
+
+
+# ---------------------------------------------------------------------------
+# Parse stage: optional process pool for CPU-bound parsing
+# ---------------------------------------------------------------------------
+
+# Fetch threads hand downloaded HTML to this pool and wait on the result,
+# so parsing runs on every core instead of behind the GIL. None parses
+# in the fetching thread.
+_PARSE_POOL = None
+
+# The pool starts its workers on the first submit, from inside a running
+# fetch thread. Forking there could copy locks other threads hold, so
+# workers come from a fork server (or are spawned where there is none).
+_PARSE_START_METHOD = (
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+
+def configure_parse_pool(workers=None):
+    """Start (or stop, with ``workers`` falsy) the detail-page parse processes.
+
+    Args:
+        workers (int | None): Number of parse processes; usually
+            ``os.cpu_count()``.
+
+    Returns:
+        ProcessPoolExecutor | None: The active pool.
+    """
+    global _PARSE_POOL  # pylint: disable=global-statement
+    if _PARSE_POOL is not None:
+        _PARSE_POOL.shutdown(cancel_futures=True)
+    _PARSE_POOL = (
+        ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context(_PARSE_START_METHOD),
+        )
+        if workers
+        else None
+    )
+    return _PARSE_POOL
+
+
+def _parse_detail_worker(html, backend):
+    """Parse a detail page inside a parse process.
+
+    The backend is passed in because spawned workers re-import this module
+    with the default backend.
+    """
+    if PARSER_BACKEND != backend:
+        configure_parser(backend)
+    return _parse_detail_html(html)
+
+
+def _parse_detail_stage(html):
+    """Parse detail HTML in the parse pool when enabled, else in this thread."""
+    if _PARSE_POOL is None:
+        return _parse_detail_html(html)
+    return _PARSE_POOL.submit(_parse_detail_worker, html, PARSER_BACKEND).result()
+
+
+class DetailExtractor:
+    """Fill the detail fields from one combined-regex scan per text block.
+
+    At each position the alternatives are tried in order. Only the first
+    match of each field in a block is used, as with one ``re.search`` per
+    field. A labelled term ("Term: Fall 2026") beats a bare "Fall 2026" in
+    the same block. The first block with a usable match sets each field.
+    """
+
+    PATTERN = re.compile(
+        # Every alternative starts with one of these letters; the lookahead
+        # lets the scan skip other positions without trying each branch.
+        r"(?=[gtsfwvqaidu])(?:"
+        r"GPA[:\s]+(?P<gpa>\d+\.?\d*)"
+        r"|(?:Term|Season|Semester)[:\s]+(?P<term_season>Fall|Spring|Summer|Winter)"
+        r"\s+(?P<term_labelled>\d{4})"
+        r"|(?<!\w)(?P<season>Fall|Spring|Summer|Winter)\s+(?P<term>\d{4})\b"
+        r"|(?:GRE\s+V|V)(?:erbal)?[:\s]+(?P<gre_v>\d{3})"
+        r"|(?:GRE\s+Q|Q)(?:uant)?[:\s]+(?P<gre_q>\d{3})"
+        r"|(?:GRE\s+)?(?:AW|Writing)[:\s]+(?P<gre_aw>\d+\.?\d*)"
+        r"|(?<!\w)(?P<citizenship>International|Domestic|American|U\.?S\.?)\b"
+        r")",
+        re.I,
+    )
+    # m.lastgroup of each alternative (the last named group it contains).
+    KINDS = ("gpa", "term_labelled", "term", "gre_v", "gre_q", "gre_aw", "citizenship")
+    FIELDS = ("gpa", "citizenship", "term", "gre_v", "gre_q", "gre_aw")
+
+    def first_matches(self, text):
+        """Return the first match of each alternative in ``text``."""
+        first = {}
+        for m in self.PATTERN.finditer(text):
+            if m.lastgroup not in first:
+                first[m.lastgroup] = m
+                if len(first) == len(self.KINDS):
+                    break
+        return first
+
+    def extract(self, blocks):  # pylint: disable=too-many-branches
+        """Return the detail fields found in ``blocks`` (strings, in order)."""
+        result = _empty_detail()
+        scanned = set()
+
+        for text in blocks:
+            if all(result[field] for field in self.FIELDS):
+                break
+            if text in scanned:
+                continue
+            scanned.add(text)
+            first = self.first_matches(text)
+            if not first:
+                continue
+
+            m = first.get("gpa")
+            if m and not result["gpa"]:
+                value = float(m.group("gpa"))
+                if 0 < value <= 4.5:
+                    result["gpa"] = value
+
+            if "citizenship" in first and not result["citizenship"]:
+                result["citizenship"] = (
+                    "International" if "international" in text.lower() else "American"
+                )
+
+            m = first.get("term_labelled") or first.get("term")
+            if m and not result["term"]:
+                season = m.group("term_season") or m.group("season")
+                year = m.group("term_labelled") or m.group("term")
+                result["term"] = f"{season.capitalize()} {year}"
+
+            for field in ("gre_v", "gre_q"):
+                m = first.get(field)
+                if m and not result[field] and 130 <= int(m.group(field)) <= 170:
+                    result[field] = int(m.group(field))
+
+            m = first.get("gre_aw")
+            if m and not result["gre_aw"]:
+                value = float(m.group("gre_aw"))
+                if 0 <= value <= 6:
+                    result["gre_aw"] = value
+
+        # Calculate GRE total
+        if result["gre_v"] and result["gre_q"]:
+            result["gre_total"] = result["gre_v"] + result["gre_q"]
+
+        return result
+
+
+_DETAIL_EXTRACTOR = DetailExtractor()
+
+
+def _extract_detail_fields(blocks):
+    """Run the detail extractor over text blocks in document order."""
+    return _DETAIL_EXTRACTOR.extract(blocks)
+
+
+def parse_row(tr, base_url):
+    """Parse a single table row from the GradCafe listing page.
+
+    Args:
+        tr: BeautifulSoup ``<tr>`` element.
+        base_url (str): Base URL for resolving relative links.
+
+    Returns:
+        dict | None: Parsed entry with program, university, status, etc., or None if invalid.
+    """
+    return _parse_row(tr, base_url)
+
+
+def _parse_row(
+    tr, base_url: str
+) -> dict:
+    """Parse table row - returns basic info WITHOUT fetching detail page."""
+    # pylint: disable=too-many-locals,too-many-branches
+    link = tr.find("a", href=re.compile(r"^/result/"))
+    if not link:
+        return None
+
+    tds = tr.find_all("td", recursive=False)
+    if len(tds) < 4:
+        return None
+
+    entry_url = urljoin(base_url, link["href"])
+
+    def extract_university(td):
+        uni_div = (
+            td.find("div", class_="tw-font-medium")
+            or td.find("div", class_="font-medium")
+            or td.find("span", class_="font-medium")
+        )
+        if uni_div:
+            text = uni_div.get_text(strip=True)
+        else:
+            raw = td.get_text("\n", strip=True)
+            text = raw.split("\n")[0] if raw else None
+
+        if text:
+            text = re.sub(r"\s+", " ", text).strip()
+        return text or None
+
+    university = extract_university(tds[0]) if len(tds) > 0 else None
+
+    program = degree_level = None
+    if len(tds) > 1:
+        prog_div = tds[1].find("div")
+        if prog_div:
+            spans = prog_div.find_all("span")
+            if spans:
+                program = spans[0].get_text(strip=True)
+            if len(spans) > 1:
+                degree_level = spans[1].get_text(strip=True)
+        else:
+            text = tds[1].get_text(strip=True)
+            if text:
+                program = text
+
+    date_added = tds[2].get_text(strip=True) if len(tds) > 2 else None
+    status_block = tds[3].get_text(" ", strip=True) if len(tds) > 3 else None
+
+    return _listing_entry(
+        entry_url, university, program, degree_level, date_added, status_block
+    )
+
+
+def _listing_entry(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    entry_url, university, program, degree_level, date_added, status_block
+):
+    """Build a listing record from the cell values shared by both parsers."""
+    status = status_date = None
+    if status_block is not None:
+        m = re.match(
+            r"(Accepted|Rejected|Interview|Wait listed|Waitlisted|Other)\s+on\s+(.+)",
+            status_block,
+            re.I,
+        )
+        if m:
+            status = m.group(1).title()
+            if status.lower() == "wait listed":
+                status = "Waitlisted"
+            status_date = m.group(2)
+        else:
+            status_match = re.search(
+                r"(Accepted|Rejected|Interview|Wait listed|Waitlisted|Other)",
+                status_block,
+                re.I,
+            )
+            if status_match:
+                status = status_match.group(1).title()
+
+    return {
+        "program_name": program,
+        "university": university,
+        "date_added": date_added,
+        "entry_url": entry_url,
+        "status": status,
+        "status_date": status_date,
+        "degree_level": degree_level,
+        "comments": None,
+        "term": None,
+        "citizenship": None,
+        "gpa": None,
+        "gre_total": None,
+        "gre_v": None,
+        "gre_q": None,
+        "gre_aw": None,
+    }
+
+
+class _ListingCell:  # pylint: disable=too-few-public-methods
+    """Text captured from one ``<td>`` of a listing row."""
+
+    __slots__ = ("text", "university", "div", "spans")
+
+    def __init__(self):
+        self.text = _Capture()
+        # First div.tw-font-medium, div.font-medium and span.font-medium.
+        self.university = [None, None, None]
+        self.div = None
+        self.spans = []
+
+
+class _ListingRowParser(_StreamingParser):
+    """Collect the link and cell text of every ``table tr`` row."""
+
+    def __init__(self):
+        super().__init__()
+        self.rows = []
+        self._tables = 0
+        self._row_depth = None
+        self._cell_depth = None
+        self._div_depth = None
+
+    def open_element(self, tag, attrs):
+        # pylint: disable=too-many-return-statements,too-many-branches
+        depth = len(self._stack)
+        if tag == "table":
+            self._tables += 1
+            return ()
+        if tag == "tr" and self._tables and self._row_depth is None:
+            self._row_depth = depth
+            self.rows.append({"href": None, "cells": []})
+            return ()
+        if self._row_depth is None:
+            return ()
+
+        row = self.rows[-1]
+        if tag == "a" and row["href"] is None:
+            href = dict(attrs).get("href") or ""
+            if href.startswith("/result/"):
+                row["href"] = href
+        if tag == "td" and depth == self._row_depth + 1:
+            self._cell_depth = depth
+            cell = _ListingCell()
+            row["cells"].append(cell)
+            return (cell.text,)
+        if self._cell_depth is None:
+            return ()
+
+        cell = row["cells"][-1]
+        captures = []
+        if tag in ("div", "span"):
+            classes = (dict(attrs).get("class") or "").split()
+            slots = (
+                (0 if "tw-font-medium" in classes else None,
+                 1 if "font-medium" in classes else None)
+                if tag == "div"
+                else (2 if "font-medium" in classes else None,)
+            )
+            for slot in slots:
+                if slot is not None and cell.university[slot] is None:
+                    cell.university[slot] = _Capture()
+                    captures.append(cell.university[slot])
+        if tag == "div" and cell.div is None:
+            cell.div = _Capture()
+            self._div_depth = depth
+            captures.append(cell.div)
+        elif tag == "span" and self._div_depth is not None:
+            span = _Capture()
+            cell.spans.append(span)
+            captures.append(span)
+        return tuple(captures)
+
+    def close_element(self, tag):
+        depth = len(self._stack)
+        if tag == "table":
+            self._tables -= 1
+        if self._div_depth is not None and depth <= self._div_depth:
+            self._div_depth = None
+        if self._cell_depth is not None and depth <= self._cell_depth:
+            self._cell_depth = None
+        if self._row_depth is not None and depth <= self._row_depth:
+            self._row_depth = None
+
+
+def _entry_from_cells(row, base_url):
+    """Streaming-parser counterpart of :func:`_parse_row`."""
+    cells = row["cells"]
+    if not row["href"] or len(cells) < 4:
+        return None
+
+    first, second = cells[0], cells[1]
+    uni = next((c for c in first.university if c is not None), None)
+    if uni is not None:
+        university = uni.text()
+    else:
+        university = first.text.texts[0].split("\n")[0] if first.text.texts else None
+    if university:
+        university = re.sub(r"\s+", " ", university).strip()
+
+    program = degree_level = None
+    if second.div is not None:
+        if second.spans:
+            program = second.spans[0].text()
+        if len(second.spans) > 1:
+            degree_level = second.spans[1].text()
+    else:
+        program = second.text.text() or None
+
+    return _listing_entry(
+        urljoin(base_url, row["href"]),
+        university or None,
+        program,
+        degree_level,
+        cells[2].text.text(),
+        cells[3].text.text(" "),
+    )
+
+
+def _parse_listing_html(html, base_url):
+    """Parse the rows of a listing page.
+
+    Returns:
+        list[dict] | None: Parsed rows, or None if the page has no table rows.
+    """
+    if PARSER_BACKEND == "soup":
+        soup = BeautifulSoup(html, "html.parser")
+        rows = [tr for tr in soup.select("table tr") if tr.find("td")]
+        if not rows:
+            return None
+        return [entry for entry in (_parse_row(tr, base_url) for tr in rows) if entry]
+
+    parser = _ListingRowParser()
+    parser.feed(html)
+    parser.close()
+    rows = [row for row in parser.rows if row["cells"]]
+    if not rows:
+        return None
+    return [entry for entry in (_entry_from_cells(row, base_url) for row in rows) if entry]
+
+
+__all__ = [
+    "PARSER_BACKENDS",
+    "configure_parser",
+    "configure_parse_pool",
+    "DetailExtractor",
+    "parse_row",
+]
@@ -0,0 +1,968 @@
+#!/usr/bin/env python3
+"""
+GradCafe scraper - FAST VERSION with parallel processing
+Uses threading to fetch multiple detail pages simultaneously.
+All requests share one token-bucket rate limiter and a pool of keep-alive
+HTTP connections, so thousands of pages reuse a handful of sockets.
+An AIMD window per host adapts how many requests are in flight, and
+throttled (429) or failing (5xx) requests are retried with backoff.
+Fetching lives in fetch.py, page caching in page_cache.py, parsing in
+parsers.py and crawl checkpoints in checkpoint.py; this module orchestrates
+them.
+"""
+
+import argparse
+import json
+import os
+import threading
+import traceback
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from datetime import datetime
+from urllib import parse, request
+from urllib.parse import urljoin
+
+try:
+    from . import parsers
+    from .checkpoint import CHECKPOINT_FILE, CheckpointLog
+    from .fetch import (
+        BASE_URL,
+        MAX_RETRIES,
+        RETRY_STATUSES,
+        ROBOTS_CACHE_FILE,
+        USER_AGENT,
+        FetchError,
+        RobotsPolicy,
+        _fetch,
+        _get_html,
+        _print_fetch_stats,
+        configure_robots,
+    )
+    from .jsonl_stream import RecordStream
+    from .page_cache import DETAIL_CACHE_FILE, PageCache, _result_id
+    from .parsers import (
+        PARSER_BACKENDS,
+        DetailExtractor,
+        _empty_detail,
+        _parse_detail_stage,
+        _parse_listing_html,
+        configure_parse_pool,
+        configure_parser,
+        parse_row,
+    )
+except ImportError:  # pragma: no cover - run as a script: python src/module_2_1/scrape.py
+    # pylint: disable=import-error
+    import parsers
+    from checkpoint import CHECKPOINT_FILE, CheckpointLog
+    from fetch import (
+        BASE_URL,
+        MAX_RETRIES,
+        RETRY_STATUSES,
+        ROBOTS_CACHE_FILE,
+        USER_AGENT,
+        FetchError,
+        RobotsPolicy,
+        _fetch,
+        _get_html,
+        _print_fetch_stats,
+        configure_robots,
+    )
+    from jsonl_stream import RecordStream
+    from page_cache import DETAIL_CACHE_FILE, PageCache, _result_id
+    from parsers import (
+        PARSER_BACKENDS,
+        DetailExtractor,
+        _empty_detail,
+        _parse_detail_stage,
+        _parse_listing_html,
+        configure_parse_pool,
+        configure_parser,
+        parse_row,
+    )
+
+# Thread-safe opener
+_lock = threading.Lock()
+
+
+def get_opener():
+    """Get a thread-safe opener."""
+    opener = request.build_opener()
+    opener.addheaders = [("User-Agent", USER_AGENT)]
+    return opener
+
+
+SEARCH_URL = "https://www.thegradcafe.com/survey/"
+
+
+def check_robots(url=None):
+    """Load the robots.txt policy and verify that it allows scraping.
+
+    The policy stays active for the rest of the run, so every later request
+    is checked against it too (see :func:`configure_robots`).
+
+    Args:
+        url: Optional URL to check (defaults to survey page).
+
+    Returns:
+        bool: True if scraping is allowed. An unreachable robots.txt with no
+        cached copy disallows everything.
+    """
+    policy = configure_robots(ROBOTS_CACHE_FILE)
+    return policy.allowed(url or urljoin(BASE_URL, "survey/"))
+
+
+def get_html(url, opener=None, delay=0.1):
+    """Fetch HTML content from a URL.
+
+    Args:
+        url (str): Target URL to fetch.
+        opener: Optional urllib opener (used for testing).
+        delay (float): Rate-limiting delay in seconds.
+
+    Returns:
+        str | None: HTML content, or None on failure.
+    """
+    if opener is not None:
+        try:
+            resp = opener.open(url, timeout=10)
+            data = resp.read()
+            if isinstance(data, bytes):
+                return data.decode("utf-8", errors="ignore")
+            return str(data)
+        except Exception:  # pylint: disable=broad-exception-caught
+            return None
+    return _get_html(url, delay)
+
+
+# Active page cache; None (the default) means every page is fetched live.
+_PAGE_CACHE = None
+
+
+def configure_page_cache(path=None, offline=False, **options):
+    """Enable (or with ``path=None`` and ``offline=False``, disable) the page cache.
+
+    Args:
+        path (str | None): SQLite file; defaults to :data:`DETAIL_CACHE_FILE`.
+        offline (bool): Serve only from the cache, never from the network.
+        **options: Passed to :class:`PageCache` (ages and size limits).
+
+    Returns:
+        PageCache | None: The active cache.
+    """
+    global _PAGE_CACHE  # pylint: disable=global-statement
+    if _PAGE_CACHE is not None:
+        _PAGE_CACHE.close()
+        _PAGE_CACHE = None
+    if path is not None or offline:
+        _PAGE_CACHE = PageCache(path or DETAIL_CACHE_FILE, offline=offline, **options)
+    return _PAGE_CACHE
+
+
+def _cached_detail(entry_url, cache):
+    """Return parsed detail fields, using ``cache`` to avoid refetching.
+
+    Fresh entries are returned directly, stale ones are revalidated with
+    ``If-None-Match``/``If-Modified-Since``, and a network failure falls back
+    to whatever is cached. In offline mode the cached HTML is re-parsed so
+    parser fixes apply without refetching.
+    """
+    result_id = _result_id(entry_url)
+    entry = cache.get(result_id) if result_id is not None else None
+
+    if cache.offline:
+        if entry is None:
+            cache.misses += 1
+            return _empty_detail()
+        cache.hits += 1
+        return _parse_detail_stage(entry["html"])
+
+    if entry is not None and cache.is_fresh(entry):
+        cache.hits += 1
+        return entry["parsed"]
+
+    validators = {}
+    if entry is not None:
+        if entry["etag"]:
+            validators["If-None-Match"] = entry["etag"]
+        if entry["last_modified"]:
+            validators["If-Modified-Since"] = entry["last_modified"]
+
+    resp = _fetch(entry_url, headers=validators)
+    if resp is not None and resp.status == 304 and entry is not None:
+        cache.revalidated += 1
+        cache.touch(result_id)
+        return entry["parsed"]
+    if resp is None or resp.status != 200:
+        return entry["parsed"] if entry is not None else _empty_detail()
+
+    cache.misses += 1
+    html = resp.body.decode("utf-8", errors="ignore")
+    parsed = _parse_detail_stage(html)
+    if result_id is not None:
+        cache.put(result_id, entry_url, html, parsed, resp.headers)
+    return parsed
+
+
+# ---------------------------------------------------------------------------
+# Incremental mode: skip result IDs that are already loaded
+# ---------------------------------------------------------------------------
+
+KNOWN_IDS_FILE = os.path.join("module_2_1", "known_result_ids.txt")
+
+# Result IDs to skip; None (the default) means crawl everything.
+_KNOWN_IDS = None
+
+
+def load_known_ids(path=KNOWN_IDS_FILE):
+    """Read the result IDs already in the database.
+
+    ``load_data.py`` rewrites this file from the applicants table after
+    every load, so it never lists entries that failed to load.
+
+    Returns:
+        set[int]: Known result IDs (empty if the file does not exist yet).
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return {int(line) for line in f if line.strip().isdigit()}
+    except FileNotFoundError:
+        return set()
+
+
+def configure_incremental(path=None):
+    """Enable incremental crawling from the ID file at ``path`` (None disables).
+
+    Returns:
+        set[int] | None: The active set of known IDs.
+    """
+    global _KNOWN_IDS  # pylint: disable=global-statement
+    _KNOWN_IDS = load_known_ids(path) if path is not None else None
+    return _KNOWN_IDS
+
+
+def _get_listing_html(url):
+    """Fetch a listing page live, or replay it from an offline page cache."""
+    cache = _PAGE_CACHE
+    if cache is not None and cache.offline:
+        return cache.get_listing(url) or ""
+    return _get_html(url, strict=True)
+
+
+def _cached_listing(url, cache):
+    """Fetch and parse a listing page, revalidating it against ``cache``.
+
+    The request carries the stored ``If-None-Match``/``If-Modified-Since``
+    validators; on a 304 the cached rows are returned without downloading
+    or parsing the page again.
+
+    Returns:
+        list[dict] | None: Parsed rows, as :func:`_parse_listing_html`.
+
+    Raises:
+        FetchError: If the page is still throttled or failing after retries.
+    """
+    entry = cache.get_listing_entry(url)
+    validators = {}
+    if entry is not None and entry["parsed"] is not None:
+        if entry["etag"]:
+            validators["If-None-Match"] = entry["etag"]
+        if entry["last_modified"]:
+            validators["If-Modified-Since"] = entry["last_modified"]
+
+    resp = _fetch(url, headers=validators)
+    if resp is not None and resp.status == 304 and validators:
+        cache.listings_not_modified += 1
+        cache.touch_listing(url)
+        return entry["parsed"] or None
+    if resp is None or resp.status in RETRY_STATUSES:
+        status = resp.status if resp is not None else "network error"
+        raise FetchError(f"{url} failed after {MAX_RETRIES} retries ({status})")
+    if resp.status != 200:
+        return None
+
+    html = resp.body.decode("utf-8", errors="ignore")
+    entries = _parse_listing_html(html, url)
+    cache.put_listing(url, html, entries or [], resp.headers)
+    return entries
+
+
+def parse_detail_gre_total_calculation(detail):
+    """Return GRE total from detail dict; used only for tests."""
+    if not detail:
+        return None
+    v = detail.get("gre_v")
+    q = detail.get("gre_q")
+    if isinstance(v, int) and isinstance(q, int):
+        return v + q
+    return None
+
+
+def parse_detail_page_html(html, base_url=None):
+    """Parse GPA, GRE, citizenship, and term from a detail page.
+
+    Args:
+        html (str): Raw HTML content of the detail page.
+        base_url (str | None): If provided, sets ``entry_url`` in the result.
+
+    Returns:
+        dict: Parsed fields including gpa, gre_v, gre_q, gre_aw, citizenship, term.
+    """
+    result = _parse_detail_page_html(html)
+
+    # Tests expect entry_url to exist
+    if base_url is not None:
+        result["entry_url"] = base_url
+
+    return result
+
+
+def _parse_detail_page_html(entry_url: str):
+    """Fetch a detail page (through the page cache when enabled) and parse it."""
+    if not entry_url:
+        return _empty_detail()
+
+    try:
+        if _PAGE_CACHE is not None:
+            return _cached_detail(entry_url, _PAGE_CACHE)
+
+        html = _get_html(entry_url)
+        if not html:
+            return _empty_detail()
+        return _parse_detail_stage(html)
+
+    except Exception:  # pylint: disable=broad-exception-caught
+        return _empty_detail()
+
+
+def _print_cache_stats():
+    """Report page cache effectiveness when the cache is enabled."""
+    if _PAGE_CACHE is not None:
+        print(
+            f"  Page cache: {_PAGE_CACHE.hits} hits, {_PAGE_CACHE.misses} fetched, "
+            f"{_PAGE_CACHE.revalidated} revalidated, "
+            f"{_PAGE_CACHE.listings_not_modified} listing pages not modified"
+        )
+
+
+def _merge_detail(record, detail):
+    """Copy detail fields onto a listing record.
+
+    Only overwrite fields if the detail parser actually found real data.
+    """
+    for key, value in detail.items():
+        if value is not None:
+            record[key] = value
+    return record
+
+
+def _fetch_detail_into(record):
+    """Fetch and parse one record's detail page, merging the fields in place."""
+    return _merge_detail(record, _parse_detail_page_html(record["entry_url"]))
+
+
+def _entry_finished(future):
+    """Done-callback passing a finished record to the checkpoint log and stream."""
+    if future.cancelled() or future.exception() is not None:
+        return
+    record = future.result()
+    log, stream = _CHECKPOINT, _STREAM
+    if log is not None:
+        log.entry_done(record)
+    if stream is not None:
+        stream.write(record)
+
+
+def fetch_detail_batch(records, max_workers=10):
+    """
+    Fetch detail pages in parallel using threading.
+    max_workers: number of concurrent threads (default 10). Requests are
+    paced by the shared rate limiter and at most MAX_CONNECTIONS sockets
+    are open at once, so extra threads only overlap parsing with I/O.
+    Parsing moves to separate processes when configure_parse_pool() is set.
+    """
+    if not records:
+        return []
+
+    if isinstance(records[0], str):
+        records = [{"entry_url": url} for url in records]
+
+    print(f"\nFetching detail data with {max_workers} parallel threads...")
+
+    completed = 0
+    total = len(records)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Submit all detail page fetches
+        future_to_record = {
+            executor.submit(_parse_detail_page_html, rec["entry_url"]): rec
+            for rec in records
+        }
+
+        # Process as they complete
+        for future in as_completed(future_to_record):
+            record = future_to_record[future]
+            try:
+                _merge_detail(record, future.result())
+                completed += 1
+
+                if completed % 50 == 0:
+                    print(f"  {completed}/{total} detail pages fetched...")
+
+            except Exception:  # pylint: disable=broad-exception-caught
+                # If detail fetch fails, keep basic record
+                pass
+
+    print(f"  [OK] Completed {completed}/{total} detail pages")
+    _print_cache_stats()
+    return records
+
+
+_CHECKPOINT = None
+
+
+def configure_checkpoint(path=None, resume=False, **options):
+    """Enable (or, with ``path=None``, disable) the crawl progress log.
+
+    Args:
+        path (str | None): Log file, usually :data:`CHECKPOINT_FILE`.
+        resume (bool): Continue from the records already in the log.
+        **options: Passed to :class:`CheckpointLog`.
+
+    Returns:
+        CheckpointLog | None: The active log.
+    """
+    global _CHECKPOINT  # pylint: disable=global-statement
+    if _CHECKPOINT is not None:
+        _CHECKPOINT.close()
+    _CHECKPOINT = CheckpointLog(path, resume=resume, **options) if path else None
+    return _CHECKPOINT
+
+
+# ---------------------------------------------------------------------------
+# Streaming output: one JSONL line per finished record
+# ---------------------------------------------------------------------------
+
+RAW_STREAM_FILE = os.path.join("module_2_1", "raw_applicant_data.jsonl")
+# Active RecordStream (see jsonl_stream.py), or None when not streaming.
+_STREAM = None
+
+
+def configure_stream(path=None, complete=True):
+    """Stream finished records to ``path`` (disable with ``path=None``).
+
+    Args:
+        path (str | None): New stream file, or None to stop streaming.
+        complete (bool): Whether the previous stream finished; only then
+            is its ``.done`` marker written.
+
+    Returns:
+        RecordStream | None: The active stream.
+    """
+    global _STREAM  # pylint: disable=global-statement
+    if _STREAM is not None:
+        _STREAM.close(complete=complete)
+    _STREAM = RecordStream(path) if path else None
+    return _STREAM
+
+
+# Detail fetches allowed to queue per worker thread before the listing
+# crawl pauses (backpressure between the two stages).
+DETAIL_BACKLOG_PER_THREAD = 4
+# Listing pages fetched at once. All requests still share the rate limiter,
+# so this overlaps latency without raising the request rate.
+LISTING_CONCURRENCY = 4
+
+
+def _listing_url(page):
+    """Return the survey listing URL for ``page``."""
+    return SEARCH_URL + "?" + parse.urlencode({"page": page})
+
+
+def _fetch_listing_page(page):
+    """Fetch and parse one listing page.
+
+    Returns:
+        list[dict] | None: Parsed rows, or None if the page is missing or
+        has no table rows (i.e. the crawl is past the last page).
+    """
+    url = _listing_url(page)
+    cache = _PAGE_CACHE
+    if cache is not None and not cache.offline:
+        return _cached_listing(url, cache)
+    html = _get_listing_html(url)
+    if not html:
+        return None
+
+    return _parse_listing_html(html, url)
+
+
+def iter_listing_entries(  # pylint: disable=too-many-branches
+    max_entries, start_page=1, end_page=None
+):
+    """Yield listing rows in page order.
+
+    Up to :data:`LISTING_CONCURRENCY` pages are fetched ahead of the page
+    being consumed. The crawl stops after ``max_entries`` rows, after
+    ``end_page``, at the first empty or missing page, or (in incremental
+    mode) at the first page made up of known entries.
+
+    Args:
+        max_entries (int): Maximum number of rows to yield.
+        start_page (int): First listing page to fetch.
+        end_page (int | None): Last listing page to fetch (inclusive).
+
+    Yields:
+        dict: Parsed listing row (detail fields still None).
+    """
+    collected = 0
+    next_page = start_page
+    window = deque()
+
+    with ThreadPoolExecutor(max_workers=LISTING_CONCURRENCY) as executor:
+
+        def fill():
+            nonlocal next_page
+            while len(window) < LISTING_CONCURRENCY and (
+                end_page is None or next_page <= end_page
+            ):
+                window.append((next_page, executor.submit(_fetch_listing_page, next_page)))
+                next_page += 1
+
+        fill()
+        while window and collected < max_entries:
+            page, future = window.popleft()
+            try:
+                entries = future.result()
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                print(f"  Error on page {page}: {e}")
+                break
+            if entries is None:
+                break
+
+            new = 0
+            finished = True
+            for entry in entries:
+                if _KNOWN_IDS is not None and _result_id(entry["entry_url"]) in _KNOWN_IDS:
+                    continue
+                new += 1
+                if _CHECKPOINT is not None and entry["entry_url"] in _CHECKPOINT.entries:
+                    continue
+                collected += 1
+                yield entry
+                if collected >= max_entries:
+                    finished = entry is entries[-1]
+                    break
+
+            if _CHECKPOINT is not None and finished:
+                _CHECKPOINT.page_done(page, [entry["entry_url"] for entry in entries])
+            print(f"  Page {page}: {collected} total entries collected")
+            if _KNOWN_IDS is not None and entries and not new:
+                # Listings are newest first: a page of known entries means the
+                # rest of the crawl was loaded by an earlier pull.
+                print(f"  Page {page} holds only known entries; stopping")
+                break
+            fill()
+
+        for _, future in window:
+            future.cancel()
+
+
+def find_last_page():
+    """Find the last listing page with rows.
+
+    Probes pages 1, 2, 4, 8, ... until one is empty, then binary-searches
+    between the last full and first empty page: about ``2 * log2(pages)``
+    requests instead of walking every page.
+
+    Returns:
+        int: Last page number with rows (0 if even page 1 is empty).
+    """
+    if _fetch_listing_page(1) is None:
+        return 0
+    low, high = 1, 2
+    while _fetch_listing_page(high) is not None:
+        low, high = high, high * 2
+    while high - low > 1:
+        mid = (low + high) // 2
+        if _fetch_listing_page(mid) is not None:
+            low = mid
+        else:
+            high = mid
+    return low
+
+
+def plan_shards(last_page, shards):
+    """Split pages ``1..last_page`` into contiguous ranges for parallel crawls.
+
+    Args:
+        last_page (int): Highest page to cover.
+        shards (int): Number of ranges wanted.
+
+    Returns:
+        list[tuple[int, int]]: ``(start_page, end_page)`` pairs, inclusive.
+    """
+    shards = max(1, min(shards, last_page))
+    size, extra = divmod(last_page, shards)
+    ranges = []
+    start = 1
+    for i in range(shards):
+        end = start + size - 1 + (1 if i < extra else 0)
+        ranges.append((start, end))
+        start = end + 1
+    return ranges
+
+
+def merge_shards(paths, output_file):
+    """Merge shard output files into one, dropping duplicate entries.
+
+    Args:
+        paths (list[str]): JSON files written by sharded runs.
+        output_file (str): Merged output location.
+
+    Returns:
+        int: Number of unique entries written.
+    """
+    merged = {}
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            for entry in json.load(f):
+                merged.setdefault(entry.get("entry_url"), entry)
+
+    _write_entries(list(merged.values()), output_file)
+    return len(merged)
+
+
+def scrape_data(  # pylint: disable=too-many-locals,too-many-branches,too-many-statements
+    max_entries: int = 1000,
+    start_page: int = 1,
+    parallel_threads: int = 10,
+    end_page: int = None,
+):
+    """
+    Main scraping function with parallel processing.
+
+    Listing and detail stages run as a pipeline: detail pages are fetched
+    as soon as their listing row is parsed, so total time approaches the
+    slower of the two stages rather than their sum.
+
+    Args:
+        max_entries: Total number of entries to collect
+        start_page: Starting page number
+        parallel_threads: Number of concurrent threads for detail pages (default 10)
+        end_page: Last page number to crawl (inclusive); None crawls to the end
+    """
+    print("Starting FAST GradCafe scraper")
+    print(f"Target: {max_entries} entries")
+    print(f"Parallel threads: {parallel_threads}")
+    print("-" * 60)
+
+    # Listing pages are crawled in this thread while the pool fetches detail
+    # pages for rows already seen. At most `backlog` detail fetches may be
+    # queued; beyond that the crawl waits for workers to catch up.
+    print("\nCrawling listings and fetching detail pages concurrently...")
+    all_entries = []
+    backlog = parallel_threads * DETAIL_BACKLOG_PER_THREAD
+
+    if _CHECKPOINT is not None and _CHECKPOINT.entries:
+        all_entries.extend(_CHECKPOINT.entries.values())
+        start_page = _CHECKPOINT.resume_page(start_page)
+        print(f"Resuming at page {start_page} with {len(all_entries)} entries already scraped")
+        if _STREAM is not None:
+            for entry in all_entries:
+                _STREAM.write(entry)
+
+    with ThreadPoolExecutor(max_workers=parallel_threads) as executor:
+        pending = set()
+        listing = iter_listing_entries(max_entries - len(all_entries), start_page, end_page)
+        for entry in listing:
+            all_entries.append(entry)
+            future = executor.submit(_fetch_detail_into, entry)
+            if _CHECKPOINT is not None or _STREAM is not None:
+                future.add_done_callback(_entry_finished)
+            pending.add(future)
+            if len(pending) >= backlog:
+                _, pending = wait(pending, return_when=FIRST_COMPLETED)
+        wait(pending)
+
+    print(f"\n[OK] Collected {len(all_entries)} entries with detail data")
+    _print_cache_stats()
+    _print_fetch_stats()
+
+    # Final stats
+    print("\n" + "=" * 60)
+    print("SCRAPING COMPLETE!")
+    print("=" * 60)
+    n = len(all_entries)
+    fields = [
+        "comments",
+        "gpa",
+        "gre_v",
+        "gre_q",
+        "gre_aw",
+        "gre_total",
+        "term",
+        "citizenship",
+    ]
+
+    for field in fields:
+        if field == "gpa":
+            count = sum(1 for e in all_entries if e.get(field) and e.get(field) > 0)
+        elif field in ["gre_v", "gre_q", "gre_aw", "gre_total"]:
+            count = sum(1 for e in all_entries if e.get(field) and e.get(field) > 0)
+        else:
+            count = sum(1 for e in all_entries if e.get(field))
+        pct = count * 100 // n if n > 0 else 0
+        print(f"  {field:15s}: {count:4d} / {n:4d} ({pct:3d}%)")
+
+    # Show samples
+    print("\nSample entries with details:")
+    count = 0
+    for entry in all_entries:
+        if entry.get("term") or (entry.get("gpa") and entry.get("gpa") > 0):
+            print(f"\n  {entry.get('university')} - {entry.get('program_name')}")
+            if entry.get("term"):
+                print(f"    Term: {entry.get('term')}")
+            print(f"    GPA={entry.get('gpa')}, Cit={entry.get('citizenship')}")
+            count += 1
+            if count >= 3:
+                break
+
+    return all_entries[:max_entries]
+
+
+RAW_OUTPUT_FILE = os.path.join("module_2_1", "raw_applicant_data.json")
+
+
+def _write_entries(data, output_file):
+    """Atomically write scraped entries as a JSON array, creating the directory."""
+    output_dir = os.path.dirname(output_file)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+    tmp_file = output_file + ".tmp"
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_file, output_file)
+
+
+def main(start_page=1, end_page=None, output_file=RAW_OUTPUT_FILE, max_entries=35000):
+    """Run the full scraping pipeline.
+
+    Checks robots.txt, scrapes GradCafe listing and detail pages in parallel,
+    and saves results to ``module_2_1/raw_applicant_data.json`` (or, with
+    :func:`configure_stream`, leaves them in the JSONL stream).
+
+    Args:
+        start_page (int): First listing page (for sharded crawls).
+        end_page (int | None): Last listing page, inclusive (for sharded crawls).
+        output_file (str): Where to save the scraped entries.
+        max_entries (int): Stop after this many entries.
+
+    Raises:
+        SystemExit: If robots.txt check fails.
+    """
+    if not check_robots():
+        raise SystemExit("[ERROR] robots.txt check failed")
+
+    print("[OK] robots.txt OK\n")
+
+    # FAST scrape with parallel processing
+    # Requests in flight are capped by the adaptive limiter's window (at most
+    # MAX_CONNECTIONS); extra threads only overlap parsing with I/O.
+    data = scrape_data(
+        max_entries=max_entries,
+        start_page=start_page,
+        parallel_threads=15,
+        end_page=end_page,
+    )
+
+    if _STREAM is not None:
+        # Records were written as they finished; no end-of-run dump needed.
+        print(f"\n[OK] Streamed {_STREAM.count} entries to {_STREAM.path}")
+        return
+
+    # Save to file
+    _write_entries(data, output_file)
+
+    print(f"\n[OK] Saved {len(data)} entries to {output_file}")
+
+
+def cli_main(args=None):
+    """CLI entry point with timing and error handling.
+
+    Runs the full scraping pipeline, prints elapsed time on success,
+    and handles KeyboardInterrupt and unexpected errors gracefully.
+
+    Args:
+        args: Optional list of CLI arguments (for testing). Defaults to sys.argv.
+    """
+    parsed = _build_arg_parser().parse_args(args)
+
+    if parsed.merge:
+        count = merge_shards(parsed.merge, parsed.output)
+        print(f"[OK] Merged {count} unique entries into {parsed.output}")
+        return
+    if parsed.plan_shards:
+        last_page = find_last_page()
+        print(f"Last listing page: {last_page}")
+        for start, end in plan_shards(last_page, parsed.plan_shards) if last_page else []:
+            print(f"  --start-page {start} --end-page {end} --output shard_{start}_{end}.json")
+        return
+
+    previous_parser = parsers.PARSER_BACKEND
+    configure_parser(parsed.parser)
+    configure_page_cache(parsed.cache, offline=parsed.offline)
+    configure_parse_pool(parsed.parse_processes)
+    if parsed.resume or parsed.checkpoint:
+        configure_checkpoint(parsed.checkpoint or CHECKPOINT_FILE, resume=parsed.resume)
+    configure_stream(parsed.stream)
+    known = configure_incremental(parsed.incremental)
+    if known is not None:
+        print(f"Incremental mode: {len(known)} known entries will be skipped")
+
+    completed = False
+    try:
+        start_time = datetime.now()
+        main(
+            start_page=parsed.start_page,
+            end_page=parsed.end_page,
+            output_file=parsed.output,
+            max_entries=parsed.max_entries,
+        )
+        completed = True
+        end_time = datetime.now()
+        duration = (end_time - start_time).total_seconds()
+        print(f"\nTotal time: {duration:.1f} seconds ({duration/60:.1f} minutes)")
+    except KeyboardInterrupt:
+        print("\nInterrupted by user")
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        print(f"\nError: {e}")
+        traceback.print_exc()
+    finally:
+        configure_page_cache(None)
+        configure_incremental(None)
+        configure_parser(previous_parser)
+        configure_parse_pool(None)
+        configure_checkpoint(None)
+        configure_stream(None, complete=completed)
+        configure_robots(None)
+
+
+def _build_arg_parser():
+    """Return the argument parser for :func:`cli_main`."""
+    parser = argparse.ArgumentParser(description="Scrape GradCafe applicant data.")
+    parser.add_argument(
+        "--cache",
+        nargs="?",
+        const=DETAIL_CACHE_FILE,
+        default=None,
+        metavar="PATH",
+        help="Reuse fetched pages from a SQLite cache and revalidate listing pages "
+        f"with conditional GETs (default {DETAIL_CACHE_FILE}).",
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Parse only from the page cache; make no network requests.",
+    )
+    parser.add_argument(
+        "--incremental",
+        nargs="?",
+        const=KNOWN_IDS_FILE,
+        default=None,
+        metavar="PATH",
+        help="Skip result IDs listed in PATH (written by load_data.py) and stop "
+        f"at the first fully known page (default {KNOWN_IDS_FILE}).",
+    )
+    parser.add_argument(
+        "--parser",
+        choices=PARSER_BACKENDS,
+        default=parsers.PARSER_BACKEND,
+        help=f"HTML parser backend (default {parsers.PARSER_BACKEND}).",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        nargs="?",
+        const=CHECKPOINT_FILE,
+        default=None,
+        metavar="PATH",
+        help=f"Log finished pages and entries to PATH (default {CHECKPOINT_FILE}).",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue the crawl recorded in the checkpoint log.",
+    )
+    parser.add_argument(
+        "--stream",
+        nargs="?",
+        const=RAW_STREAM_FILE,
+        default=None,
+        metavar="PATH",
+        help="Write each finished record to PATH as a JSON line instead of one JSON "
+        f"array at the end; a .gz PATH is gzip-compressed (default {RAW_STREAM_FILE}).",
+    )
+    parser.add_argument(
+        "--parse-processes",
+        nargs="?",
+        type=int,
+        const=os.cpu_count(),
+        default=0,
+        metavar="N",
+        help="Parse detail pages in N processes (default: one per core when given "
+        "without N; 0 parses in the fetch threads).",
+    )
+    parser.add_argument("--start-page", type=int, default=1, help="First listing page.")
+    parser.add_argument(
+        "--end-page", type=int, default=None, help="Last listing page (inclusive)."
+    )
+    parser.add_argument("--max-entries", type=int, default=35000)
+    parser.add_argument(
+        "--output", default=RAW_OUTPUT_FILE, help=f"Output file (default {RAW_OUTPUT_FILE})."
+    )
+    parser.add_argument(
+        "--plan-shards",
+        type=int,
+        metavar="N",
+        help="Find the last listing page, print N --start-page/--end-page ranges and exit.",
+    )
+    parser.add_argument(
+        "--merge",
+        nargs="+",
+        metavar="FILE",
+        help="Merge shard output files into --output and exit.",
+    )
+    return parser
+
+
+if __name__ == "__main__":  # pragma: no cover
+    cli_main()
+
+__all__ = [
+    "cli_main",
+    "get_html",
+    "check_robots",
+    "parse_detail_page_html",
+    "parse_detail_gre_total_calculation",
+    "parse_row",
+    "fetch_detail_batch",
+    "iter_listing_entries",
+    "find_last_page",
+    "plan_shards",
+    "merge_shards",
+    "scrape_data",
+    "main",
+    "PageCache",
+    "configure_page_cache",
+    "configure_incremental",
+    "configure_parser",
+    "configure_parse_pool",
+    "CheckpointLog",
+    "configure_checkpoint",
+    "RecordStream",
+    "configure_stream",
+    "RobotsPolicy",
+    "configure_robots",
+    "DetailExtractor",
+    "load_known_ids",
+]
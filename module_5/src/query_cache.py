@@ -0,0 +1,151 @@
+"""
+query_cache.py — In-process Analysis Result Cache
+-------------------------------------------------
+A small TTL + LRU memoization layer for the analysis queries.
+
+Key responsibilities:
+• Cache results keyed by function and arguments (e.g. ``q10_custom(limit)``).
+• Expire entries after ``ttl`` seconds and evict the least recently used
+  entry once ``maxsize`` results are held.
+• Drop every entry when the data version changes, so rows inserted by the
+  loader (a separate process) are visible on the next query.
+• Count hits, misses and evictions so the cache can be sized.
+
+Cached values are shared between callers and must be treated as read-only.
+"""
+
+import functools
+import threading
+import time
+from collections import Counter, OrderedDict, namedtuple
+
+# Size and lifetime bounds of a QueryCache; either being 0 disables caching.
+CacheLimits = namedtuple("CacheLimits", ["maxsize", "ttl"])
+
+
+class QueryCache:
+    """Thread-safe TTL/LRU cache invalidated by a data-version callable.
+
+    Args:
+        maxsize (int): Maximum number of cached results (0 disables caching).
+        ttl (float): Seconds a result stays valid (0 disables caching).
+        version (Callable[[], object]): Returns the current data version;
+            any change clears the cache. Defaults to a constant.
+        clock (Callable[[], float]): Monotonic time source.
+    """
+
+    def __init__(self, maxsize=128, ttl=300.0, version=None, clock=time.monotonic):
+        self.limits = CacheLimits(maxsize, ttl)
+        self._version = version or (lambda: None)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._seen_version = None
+        self._counts = Counter()
+
+    @property
+    def maxsize(self):
+        """Maximum number of cached results."""
+        return self.limits.maxsize
+
+    @property
+    def ttl(self):
+        """Seconds a cached result stays valid."""
+        return self.limits.ttl
+
+    @property
+    def enabled(self):
+        """True when both ``maxsize`` and ``ttl`` allow results to be kept."""
+        return self.maxsize > 0 and self.ttl > 0
+
+    def _sync_version(self):
+        """Clear all entries if the data version moved. Caller holds the lock."""
+        current = self._version()
+        if current != self._seen_version:
+            self._entries.clear()
+            self._seen_version = current
+
+    def get(self, key):
+        """Return ``(True, value)`` for a fresh cached result, else ``(False, None)``."""
+        found, value, _ = self._lookup(key)
+        return found, value
+
+    def put(self, key, value):
+        """Store a result, evicting the least recently used entry if full."""
+        self._store(key, value, None)
+
+    def _lookup(self, key):
+        """Look ``key`` up; also return the data version the lookup saw."""
+        with self._lock:
+            self._sync_version()
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > self._clock():
+                self._entries.move_to_end(key)
+                self._counts["hits"] += 1
+                return True, entry[1], self._seen_version
+            if entry is not None:
+                del self._entries[key]
+            self._counts["misses"] += 1
+            return False, None, self._seen_version
+
+    def _store(self, key, value, version):
+        """Store ``value`` unless the data version moved away from ``version``.
+
+        A ``version`` of None stores unconditionally. Otherwise a result
+        computed while the loader bumped the version may predate the new rows,
+        so it is dropped rather than cached under the new version.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self._sync_version()
+            if version is not None and version != self._seen_version:
+                return
+            self._entries[key] = (self._clock() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._counts["evictions"] += 1
+
+    def clear(self):
+        """Drop all cached results and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._counts.clear()
+
+    def stats(self):
+        """Return cache counters and sizing.
+
+        Returns:
+            dict: ``hits``, ``misses``, ``evictions``, ``size``, ``maxsize``,
+            ``ttl`` and ``hit_rate`` (0.0 when nothing was looked up yet).
+        """
+        with self._lock:
+            hits, misses = self._counts["hits"], self._counts["misses"]
+            lookups = hits + misses
+            return {
+                "hits": hits,
+                "misses": misses,
+                "evictions": self._counts["evictions"],
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hit_rate": hits / lookups if lookups else 0.0,
+            }
+
+    def memoize(self, func):
+        """Decorator caching ``func`` results by positional and keyword arguments."""
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not self.enabled:
+                return func(*args, **kwargs)
+            key = (func.__qualname__, args, tuple(sorted(kwargs.items())))
+            found, value, version = self._lookup(key)
+            if found:
+                return value
+            value = func(*args, **kwargs)
+            self._store(key, value, version)
+            return value
+
+        return wrapper
@@ -6,15 +6,26 @@ Database query functions used by the Flask dashboard.
 Provides SQL-backed analysis functions for the Grad Café dashboard.
 
 Each ``q*`` function executes a single query against the applicants table
-and returns a formatted result. :func:`get_all_analysis` aggregates all
-queries into a single dictionary consumed by the Flask routes.
+and returns a formatted result. Queries borrow connections from a
+process-wide :class:`src.db_pool.ConnectionPool` and return them when done.
+Results are memoized in a :class:`src.query_cache.QueryCache` until they
+expire or the loader bumps the data version.
+:func:`get_all_analysis` builds the same results from two table scans
+(:func:`summary_metrics` and :func:`grouped_summaries`) into a single
+dictionary consumed by the Flask routes.
 """
 
+import os
 import sys
+import threading
+from contextlib import contextmanager
 
 # at top of src/query_data.py
 from psycopg2 import sql
+from src.db_pool import ConnectionPool
 from src.load_data import get_connection as _real_get_connection
+from src.load_data import create_table, read_data_version
+from src.query_cache import QueryCache
 
 # Ensure module is not imported twice under different names
 sys.modules["src.query_data"] = sys.modules[__name__]
@@ -22,10 +33,27 @@ sys.modules["src.query_data"] = sys.modules[__name__]
 # Maximum rows any multi-row query may return (enforced via LIMIT clamping)
 _MAX_LIMIT = 100
 
+# Process-wide connection pool (created lazily by get_pool)
+_POOL = None
+_POOL_PID = None
+_POOL_LOCK = threading.Lock()
+_SCHEMA_READY = False
+
+# Memoized query results, dropped whenever the loader bumps the data version.
+# QUERY_CACHE_TTL=0 or QUERY_CACHE_SIZE=0 turns caching off.
+_CACHE = QueryCache(
+    maxsize=int(os.environ.get("QUERY_CACHE_SIZE", "128")),
+    ttl=float(os.environ.get("QUERY_CACHE_TTL", "300")),
+    version=read_data_version,
+)
+
 
 def ensure_table_exists(conn):
     """Create the applicants table if it does not already exist.
 
+    Runs :func:`src.load_data.create_table`, which also adds the indexes
+    the analysis filters rely on.
+
     Args:
         conn: Active psycopg database connection.
 
@@ -34,48 +62,117 @@ def ensure_table_exists(conn):
         created by a superuser with appropriate privileges.
     """
     try:
-        with conn.cursor() as cur:
-            cur.execute("""
-                CREATE TABLE IF NOT EXISTS applicants (
-                    p_id SERIAL PRIMARY KEY,
-                    program TEXT,
-                    comments TEXT,
-                    date_added DATE,
-                    url TEXT UNIQUE,
-                    status TEXT,
-                    status_date TEXT,
-                    term TEXT,
-                    us_or_international TEXT,
-                    gpa FLOAT,
-                    gre_total_score FLOAT,
-                    gre_verbal_score FLOAT,
-                    gre_aw_score FLOAT,
-                    degree TEXT,
-                    llm_generated_program TEXT,
-                    llm_generated_university TEXT
-                );
-            """)
-        conn.commit()
+        create_table(conn)
     except Exception:  # pylint: disable=broad-exception-caught
         # Table may already exist or user lacks CREATE privilege
         # Ignore the error and proceed
         conn.rollback()
 
 
-def get_connection():
-    """Get a database connection with table initialization.
+def _open_pooled_connection():
+    """Open a new connection for the pool, bootstrapping the table once.
 
-    Delegates to :func:`src.load_data.get_connection` and ensures the
-    applicants table exists before returning.
+    The ``CREATE TABLE IF NOT EXISTS`` check runs only for the first
+    connection a process opens rather than on every query.
 
     Returns:
-        psycopg.Connection: Ready-to-use database connection.
+        psycopg.Connection: New database connection.
     """
+    global _SCHEMA_READY  # pylint: disable=global-statement
     conn = _real_get_connection()
-    ensure_table_exists(conn)
+    if not _SCHEMA_READY:
+        ensure_table_exists(conn)
+        _SCHEMA_READY = True
     return conn
 
 
+def get_pool():
+    """Return the process-wide connection pool, creating it on first use.
+
+    Pool bounds come from ``DB_POOL_MIN`` (default 1) and ``DB_POOL_MAX``
+    (default 10); ``DB_POOL_TIMEOUT`` (default 30) caps how long a request
+    waits for a free connection. A pool inherited across ``fork()`` is
+    replaced so worker processes never share sockets.
+
+    Returns:
+        ConnectionPool: Shared pool for this process.
+    """
+    global _POOL, _POOL_PID  # pylint: disable=global-statement
+    with _POOL_LOCK:
+        if _POOL is None or _POOL_PID != os.getpid():
+            _POOL = ConnectionPool(
+                _open_pooled_connection,
+                minconn=int(os.environ.get("DB_POOL_MIN", "1")),
+                maxconn=int(os.environ.get("DB_POOL_MAX", "10")),
+                timeout=float(os.environ.get("DB_POOL_TIMEOUT", "30")),
+            )
+            _POOL_PID = os.getpid()
+        return _POOL
+
+
+def close_pool():
+    """Close the process-wide pool; the next query opens a fresh one."""
+    global _POOL  # pylint: disable=global-statement
+    with _POOL_LOCK:
+        pool, _POOL = _POOL, None
+    if pool is not None:
+        pool.closeall()
+
+
+def get_connection():
+    """Check out a pooled database connection.
+
+    The first connection a process opens also ensures the applicants table
+    exists. Hand the connection back with :func:`release_connection`, or use
+    :func:`connection` to do both automatically.
+
+    Returns:
+        psycopg.Connection: Ready-to-use database connection.
+    """
+    return get_pool().getconn()
+
+
+def release_connection(conn):
+    """Return a connection obtained from :func:`get_connection` to the pool.
+
+    Connections that did not come from the pool are left untouched.
+
+    Args:
+        conn: Connection to return.
+    """
+    pool = _POOL
+    if pool is not None and pool.owns(conn):
+        pool.putconn(conn)
+
+
+@contextmanager
+def connection():
+    """Context manager yielding a pooled connection and always returning it.
+
+    Yields:
+        psycopg.Connection: Connection checked out via :func:`get_connection`.
+    """
+    conn = get_connection()
+    try:
+        yield conn
+    finally:
+        release_connection(conn)
+
+
+def cache_stats():
+    """Return hit/miss counters and sizing for the query result cache.
+
+    Returns:
+        dict: See :meth:`src.query_cache.QueryCache.stats`.
+    """
+    return _CACHE.stats()
+
+
+def clear_query_cache():
+    """Drop all cached query results and reset the cache counters."""
+    _CACHE.clear()
+
+
 def _format_or_passthrough(val):
     """Format a numeric value to two decimal places.
 
@@ -106,14 +203,14 @@ def _format_or_passthrough(val):
         return val
 
 
+@_CACHE.memoize
 def q1_fall_2026_count():
     """Count applicants for Fall 2026 term.
 
     Returns:
         int: Number of applicants with term 'Fall 2026'.
     """
-    conn = get_connection()
-    with conn.cursor() as cur:
+    with connection() as conn, conn.cursor() as cur:
         cur.execute("""
             SELECT COUNT(*)
             FROM applicants
@@ -124,14 +221,14 @@ def q1_fall_2026_count():
         return count or 0
 
 
+@_CACHE.memoize
 def q2_percent_international():
     """Calculate percentage of international applicants.
 
     Returns:
         float: Percentage of non-American applicants.
     """
-    conn = get_connection()
-    with conn.cursor() as cur:
+    with connection() as conn, conn.cursor() as cur:
         cur.execute("""
             SELECT AVG(CASE WHEN us_or_international != 'American' THEN 1 ELSE 0 END) * 100
             FROM applicants
@@ -141,14 +238,14 @@ def q2_percent_international():
         return pct or 0
 
 
+@_CACHE.memoize
 def q3_average_metrics():
     """Compute average GPA and GRE scores across all applicants.
 
     Returns:
         dict: Keys ``avg_gpa``, ``avg_gre``, ``avg_gre_v``, ``avg_gre_aw``.
     """
-    conn = get_connection()
-    with conn.cursor() as cur:
+    with connection() as conn, conn.cursor() as cur:
         cur.execute("""
             SELECT AVG(gpa),
                    AVG(gre_total_score),
@@ -167,14 +264,14 @@ def q3_average_metrics():
         }
 
 
+@_CACHE.memoize
 def q4_avg_gpa_american_fall_2026():
     """Average GPA of American applicants for Fall 2026.
 
     Returns:
         str: Formatted GPA to two decimals, or ``'N/A'``.
     """
-    conn = get_connection()
-    with conn.cursor() as cur:
+    with connection() as conn, conn.cursor() as cur:
         cur.execute("""
             SELECT AVG(gpa)
             FROM applicants
@@ -185,14 +282,14 @@ def q4_avg_gpa_american_fall_2026():
         return _format_or_passthrough(val)
 
 
+@_CACHE.memoize
 def q5_percent_accept_fall_2026():
     """Acceptance rate for Fall 2026 applicants.
 
     Returns:
         str: Percentage formatted to two decimals, or ``'N/A'``.
     """
-    conn = get_connection()
-    with conn.cursor() as cur:
+    with connection() as conn, conn.cursor() as cur:
         cur.execute("""
             SELECT AVG(CASE WHEN status='Accepted' THEN 1 ELSE 0 END) * 100
             FROM applicants
@@ -203,14 +300,14 @@ def q5_percent_accept_fall_2026():
         return _format_or_passthrough(val)
 
 
+@_CACHE.memoize
 def q6_avg_gpa_accept_fall_2026():
     """Average GPA of accepted Fall 2026 applicants.
 
     Returns:
         str: Formatted GPA to two decimals, or ``'N/A'``.
     """
-    conn = get_connection()
-    with conn.cursor() as cur:
+    with connection() as conn, conn.cursor() as cur:
         cur.execute("""
             SELECT AVG(gpa)
             FROM applicants
@@ -221,14 +318,14 @@ def q6_avg_gpa_accept_fall_2026():
         return _format_or_passthrough(val)
 
 
+@_CACHE.memoize
 def q7_jhu_cs_masters_count():
     """Count JHU Computer Science Masters applicants.
 
     Returns:
         int: Number of matching applicants.
     """
-    conn = get_connection()
-    with conn.cursor() as cur:
+    with connection() as conn, conn.cursor() as cur:
         cur.execute("""
             SELECT COUNT(*)
             FROM applicants
@@ -241,6 +338,7 @@ def q7_jhu_cs_masters_count():
         return count or 0
 
 
+@_CACHE.memoize
 def q8_elite_cs_phd_accepts_2026():
     """Count accepted CS PhD applicants at elite universities for Fall 2026.
 
@@ -249,8 +347,7 @@ def q8_elite_cs_phd_accepts_2026():
     Returns:
         int: Number of accepted PhD applicants.
     """
-    conn = get_connection()
-    with conn.cursor() as cur:
+    with connection() as conn, conn.cursor() as cur:
         cur.execute("""
             SELECT COUNT(*)
             FROM applicants
@@ -265,6 +362,7 @@ def q8_elite_cs_phd_accepts_2026():
         return count or 0
 
 
+@_CACHE.memoize
 def q9_elite_cs_phd_llm_accepts_2026():
     """Count accepted CS applicants (all degrees) at elite universities for Fall 2026.
 
@@ -274,8 +372,7 @@ def q9_elite_cs_phd_llm_accepts_2026():
     Returns:
         int: Number of accepted applicants.
     """
-    conn = get_connection()
-    with conn.cursor() as cur:
+    with connection() as conn, conn.cursor() as cur:
         cur.execute("""
             SELECT COUNT(*)
             FROM applicants
@@ -289,6 +386,7 @@ def q9_elite_cs_phd_llm_accepts_2026():
         return count or 0
 
 
+@_CACHE.memoize
 def q10_custom(limit=10):
     """Top universities by total application count.
 
@@ -299,8 +397,7 @@ def q10_custom(limit=10):
         list[tuple]: Rows of (university, count) ordered by count descending.
     """
     limit = max(1, min(int(limit), _MAX_LIMIT))
-    conn = get_connection()
-    with conn.cursor() as cur:
+    with connection() as conn, conn.cursor() as cur:
         stmt = sql.SQL("""
             SELECT llm_generated_university,
                    COUNT(*) AS total_applications
@@ -313,6 +410,7 @@ def q10_custom(limit=10):
         return cur.fetchall()
 
 
+@_CACHE.memoize
 def q11_custom(limit=50):
     """Acceptance rate breakdown by degree level.
 
@@ -323,8 +421,7 @@ def q11_custom(limit=50):
         list[tuple]: Rows of (degree, total, accepted, rate) ordered by rate descending.
     """
     limit = max(1, min(int(limit), _MAX_LIMIT))
-    conn = get_connection()
-    with conn.cursor() as cur:
+    with connection() as conn, conn.cursor() as cur:
         stmt = sql.SQL("""
             SELECT degree,
                 COUNT(*) AS total_entries,
@@ -345,38 +442,166 @@ def q11_custom(limit=50):
         return cur.fetchall()
 
 
+@_CACHE.memoize
+def summary_metrics():
+    """Compute every scalar dashboard metric in a single table scan.
+
+    Each of q1–q9 becomes one aggregate column, restricted with
+    ``FILTER (WHERE ...)`` where the standalone query had a ``WHERE``
+    clause, so the result matches running the nine queries separately.
+
+    Returns:
+        dict: Keys ``fall_2026_count``, ``pct_international``,
+        ``avg_metrics``, ``avg_gpa_american_fall_2026``,
+        ``pct_accept_fall_2026``, ``avg_gpa_accept_fall_2026``,
+        ``jhu_cs_masters_count``, ``elite_cs_phd_accepts_2026`` and
+        ``elite_cs_phd_llm_accepts_2026``, formatted like the q* functions.
+    """
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute("""
+            SELECT
+                COUNT(*) FILTER (WHERE term='Fall 2026'),
+                AVG(CASE WHEN us_or_international != 'American' THEN 1 ELSE 0 END) * 100,
+                AVG(gpa),
+                AVG(gre_total_score),
+                AVG(gre_verbal_score),
+                AVG(gre_aw_score),
+                AVG(gpa) FILTER (
+                    WHERE us_or_international='American' AND term='Fall 2026'
+                ),
+                AVG(CASE WHEN status='Accepted' THEN 1 ELSE 0 END)
+                    FILTER (WHERE term='Fall 2026') * 100,
+                AVG(gpa) FILTER (WHERE status='Accepted' AND term='Fall 2026'),
+                COUNT(*) FILTER (
+                    WHERE llm_generated_university ILIKE '%Hopkins%'
+                      AND llm_generated_program ILIKE '%Computer%'
+                      AND degree ILIKE '%Master%'
+                ),
+                COUNT(*) FILTER (
+                    WHERE term='Fall 2026'
+                      AND degree ILIKE '%PhD%'
+                      AND llm_generated_program ILIKE '%Computer%'
+                      AND llm_generated_university IN ('Georgetown','MIT','Stanford','Carnegie Mellon')
+                      AND status='Accepted'
+                ),
+                COUNT(*) FILTER (
+                    WHERE term='Fall 2026'
+                      AND llm_generated_program ILIKE '%Computer%'
+                      AND llm_generated_university IN ('Georgetown','MIT','Stanford','Carnegie Mellon')
+                      AND status='Accepted'
+                )
+            FROM applicants
+        """)
+        (
+            fall_2026_count,
+            pct_international,
+            avg_gpa,
+            avg_gre,
+            avg_gre_v,
+            avg_gre_aw,
+            avg_gpa_american,
+            pct_accept_fall_2026,
+            avg_gpa_accept_fall_2026,
+            jhu_cs_masters,
+            elite_cs_phd,
+            elite_cs_phd_llm,
+        ) = cur.fetchone()
+
+    return {
+        "fall_2026_count": fall_2026_count or 0,
+        "pct_international": pct_international or 0,
+        "avg_metrics": {
+            "avg_gpa": avg_gpa,
+            "avg_gre": avg_gre,
+            "avg_gre_v": avg_gre_v,
+            "avg_gre_aw": avg_gre_aw,
+        },
+        "avg_gpa_american_fall_2026": _format_or_passthrough(avg_gpa_american),
+        "pct_accept_fall_2026": _format_or_passthrough(pct_accept_fall_2026),
+        "avg_gpa_accept_fall_2026": _format_or_passthrough(avg_gpa_accept_fall_2026),
+        "jhu_cs_masters_count": jhu_cs_masters or 0,
+        "elite_cs_phd_accepts_2026": elite_cs_phd or 0,
+        "elite_cs_phd_llm_accepts_2026": elite_cs_phd_llm or 0,
+    }
+
+
+@_CACHE.memoize
+def grouped_summaries(university_limit=10, degree_limit=50):
+    """Compute the q10 and q11 breakdowns in a single grouped scan.
+
+    ``GROUPING SETS`` aggregates by university and by degree in one pass;
+    each grouping is then ordered and truncated exactly like
+    :func:`q10_custom` and :func:`q11_custom`.
+
+    Args:
+        university_limit (int): Rows for the university ranking, clamped to 1–100.
+        degree_limit (int): Rows for the degree breakdown, clamped to 1–100.
+
+    Returns:
+        tuple[list[tuple], list[tuple]]: ``(top_universities, degree_summary)``
+        in the same row shapes as :func:`q10_custom` and :func:`q11_custom`.
+    """
+    university_limit = max(1, min(int(university_limit), _MAX_LIMIT))
+    degree_limit = max(1, min(int(degree_limit), _MAX_LIMIT))
+    with connection() as conn, conn.cursor() as cur:
+        cur.execute("""
+            SELECT GROUPING(llm_generated_university) AS by_degree,
+                   llm_generated_university,
+                   degree,
+                   COUNT(*) AS total_entries,
+                   SUM(CASE WHEN status = 'Accepted' THEN 1 ELSE 0 END) AS total_acceptances,
+                   ROUND(
+                       SUM(CASE WHEN status = 'Accepted' THEN 1 ELSE 0 END)::numeric
+                       / COUNT(*) * 100, 2
+                   )::float AS acceptance_rate
+            FROM applicants
+            GROUP BY GROUPING SETS ((llm_generated_university), (degree))
+        """)
+        rows = cur.fetchall()
+
+    universities = sorted(
+        ((uni, total) for by_degree, uni, _, total, _, _ in rows if not by_degree),
+        key=lambda row: row[1],
+        reverse=True,
+    )
+    degrees = sorted(
+        (
+            (degree, total, accepted, rate)
+            for by_degree, _, degree, total, accepted, rate in rows
+            if by_degree
+        ),
+        key=lambda row: row[3],
+        reverse=True,
+    )
+    return universities[:university_limit], degrees[:degree_limit]
+
+
 def get_all_analysis():
     """Run all analysis queries and return combined results.
 
+    Uses two table scans in total: :func:`summary_metrics` for the scalar
+    metrics and :func:`grouped_summaries` for the two breakdown tables.
+
     Returns:
         dict: All query results keyed by analysis name. Includes both canonical
         keys and template-facing aliases for backward compatibility.
     """
-    fall_2026_count = q1_fall_2026_count()
-    pct_international = q2_percent_international()
-    avg_metrics = q3_average_metrics()
-    avg_gpa_american = q4_avg_gpa_american_fall_2026()
-    pct_accept_fall_2026 = q5_percent_accept_fall_2026()
-    avg_gpa_accept_fall_2026 = q6_avg_gpa_accept_fall_2026()
-    jhu_cs_masters = q7_jhu_cs_masters_count()
-    elite_cs_phd = q8_elite_cs_phd_accepts_2026()
-    elite_cs_phd_llm = q9_elite_cs_phd_llm_accepts_2026()
-    top_universities = q10_custom()
-    degree_summary = q11_custom()
+    metrics = summary_metrics()
+    top_universities, degree_summary = grouped_summaries()
     return {
-        "fall_2026_count": fall_2026_count,
-        "pct_international": pct_international,
-        "avg_metrics": avg_metrics,
-        "avg_gpa_american_fall_2026": avg_gpa_american,
-        "avg_gpa_american": avg_gpa_american,
-        "pct_accept_fall_2026": pct_accept_fall_2026,
-        "avg_gpa_accept_fall_2026": avg_gpa_accept_fall_2026,
-        "jhu_cs_masters_count": jhu_cs_masters,
-        "jhu_cs_masters": jhu_cs_masters,
-        "elite_cs_phd_accepts_2026": elite_cs_phd,
-        "top_schools_accept": elite_cs_phd,
-        "elite_cs_phd_llm_accepts_2026": elite_cs_phd_llm,
-        "top_schools_accept_llm": elite_cs_phd_llm,
+        "fall_2026_count": metrics["fall_2026_count"],
+        "pct_international": metrics["pct_international"],
+        "avg_metrics": metrics["avg_metrics"],
+        "avg_gpa_american_fall_2026": metrics["avg_gpa_american_fall_2026"],
+        "avg_gpa_american": metrics["avg_gpa_american_fall_2026"],
+        "pct_accept_fall_2026": metrics["pct_accept_fall_2026"],
+        "avg_gpa_accept_fall_2026": metrics["avg_gpa_accept_fall_2026"],
+        "jhu_cs_masters_count": metrics["jhu_cs_masters_count"],
+        "jhu_cs_masters": metrics["jhu_cs_masters_count"],
+        "elite_cs_phd_accepts_2026": metrics["elite_cs_phd_accepts_2026"],
+        "top_schools_accept": metrics["elite_cs_phd_accepts_2026"],
+        "elite_cs_phd_llm_accepts_2026": metrics["elite_cs_phd_llm_accepts_2026"],
+        "top_schools_accept_llm": metrics["elite_cs_phd_llm_accepts_2026"],
         "top_universities": top_universities,
         "degree_acceptance_summary": degree_summary,
         "acceptance_by_degree": degree_summary,
@@ -384,6 +609,13 @@ def get_all_analysis():
 
 
 __all__ = [
+    "get_pool",
+    "close_pool",
+    "get_connection",
+    "release_connection",
+    "connection",
+    "cache_stats",
+    "clear_query_cache",
     "q1_fall_2026_count",
     "q2_percent_international",
     "q3_average_metrics",
@@ -395,5 +627,7 @@ __all__ = [
     "q9_elite_cs_phd_llm_accepts_2026",
     "q10_custom",
     "q11_custom",
+    "summary_metrics",
+    "grouped_summaries",
     "get_all_analysis",
 ]
@@ -34,6 +34,37 @@ def client(app):
     return app.test_client()
 
 
+@pytest.fixture(autouse=True)
+def isolated_analysis_snapshot(tmp_path, monkeypatch):
+    """Keep each test's dashboard snapshot out of the project directory."""
+    from src.app import routes
+
+    monkeypatch.setattr(routes, "SNAPSHOT_FILE", str(tmp_path / "analysis_snapshot.json"))
+
+
+@pytest.fixture(autouse=True)
+def isolated_query_cache(tmp_path, monkeypatch):
+    """Start each test with an empty query cache and its own data files."""
+    from src import load_data, query_data
+
+    monkeypatch.setattr(load_data, "DATA_VERSION_FILE", tmp_path / "data_version.txt")
+    monkeypatch.setattr(load_data, "KNOWN_IDS_FILE", tmp_path / "known_result_ids.txt")
+    query_data.clear_query_cache()
+    yield
+    query_data.clear_query_cache()
+
+
+@pytest.fixture(autouse=True)
+def isolated_robots_cache(tmp_path, monkeypatch):
+    """Keep the robots.txt cache out of the project and reset the policy."""
+    from src.module_2_1 import fetch, scrape
+
+    monkeypatch.setattr(scrape, "ROBOTS_CACHE_FILE", str(tmp_path / "robots_cache.json"))
+    yield
+    fetch._ROBOTS = None
+    fetch._RATE_LIMITER.set_crawl_delay("www.thegradcafe.com", None)
+
+
 @pytest.fixture
 def sample_applicant_data():
     return [
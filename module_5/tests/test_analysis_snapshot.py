@@ -0,0 +1,213 @@
+"""
+Tests for the on-disk analysis snapshot served by the dashboard.
+"""
+
+import json
+import os
+import subprocess
+from decimal import Decimal
+
+import pytest
+
+from src.app import queries, routes
+
+
+@pytest.mark.analysis
+def test_snapshot_round_trip_serializes_decimals_and_tuples(tmp_path):
+    path = str(tmp_path / "snap.json")
+    results = {
+        "pct_international": Decimal("42.5"),
+        "top_universities": [("MIT", 5)],
+        "avg_metrics": {"avg_gpa": 3.7},
+    }
+
+    queries.save_analysis_snapshot(results, path)
+    loaded = queries.load_analysis_snapshot(path)
+
+    assert loaded == {
+        "pct_international": 42.5,
+        "top_universities": [["MIT", 5]],
+        "avg_metrics": {"avg_gpa": 3.7},
+    }
+    assert os.listdir(tmp_path) == ["snap.json"]
+
+
+@pytest.mark.analysis
+def test_snapshot_write_failure_leaves_no_temp_file(tmp_path):
+    path = str(tmp_path / "snap.json")
+
+    with pytest.raises(TypeError):
+        queries.save_analysis_snapshot({"bad": object()}, path)
+
+    assert os.listdir(tmp_path) == []
+
+
+@pytest.mark.analysis
+def test_snapshot_load_reuses_parsed_copy_until_file_changes(tmp_path, monkeypatch):
+    path = str(tmp_path / "snap.json")
+    queries.save_analysis_snapshot({"v": 1}, path)
+    first = queries.load_analysis_snapshot(path)
+
+    def fail_open(*args, **kwargs):
+        raise AssertionError("snapshot should not be re-read")
+
+    monkeypatch.setattr("builtins.open", fail_open)
+    assert queries.load_analysis_snapshot(path) is first
+    monkeypatch.undo()
+
+    queries.save_analysis_snapshot({"v": 2}, path)
+    os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1))
+    assert queries.load_analysis_snapshot(path) == {"v": 2}
+
+
+@pytest.mark.analysis
+@pytest.mark.parametrize("content", ["not json", "[1, 2]"])
+def test_snapshot_load_rejects_corrupt_file(tmp_path, content):
+    path = tmp_path / "snap.json"
+    path.write_text(content)
+
+    assert queries.load_analysis_snapshot(str(path)) is None
+
+
+@pytest.mark.analysis
+def test_snapshot_invalidate_removes_file(tmp_path):
+    path = str(tmp_path / "snap.json")
+    queries.save_analysis_snapshot({"v": 1}, path)
+    queries.load_analysis_snapshot(path)
+
+    queries.invalidate_analysis_snapshot(path)
+    queries.invalidate_analysis_snapshot(path)
+
+    assert queries.load_analysis_snapshot(path) is None
+
+
+@pytest.mark.web
+def test_analysis_page_served_from_snapshot(client, monkeypatch):
+    calls = []
+
+    def fake_results():
+        calls.append(1)
+        return {"avg_metrics": {}, "fall_2026_count": 1234}
+
+    monkeypatch.setattr(routes, "get_all_results", fake_results)
+
+    first = client.get("/analysis")
+    second = client.get("/analysis")
+
+    assert calls == [1]
+    assert b"1234" in first.data and b"1234" in second.data
+    assert json.loads(open(routes.SNAPSHOT_FILE, encoding="utf-8").read())[
+        "fall_2026_count"
+    ] == 1234
+
+
+@pytest.mark.buttons
+def test_update_analysis_refreshes_snapshot(client, monkeypatch):
+    monkeypatch.setattr(routes, "pull_running", False)
+    queries.save_analysis_snapshot({"avg_metrics": {}, "fall_2026_count": 1}, routes.SNAPSHOT_FILE)
+    monkeypatch.setattr(
+        routes, "get_all_results", lambda: {"avg_metrics": {}, "fall_2026_count": 2}
+    )
+
+    client.post("/update-analysis", json={})
+
+    assert routes.cached_analysis_results()["fall_2026_count"] == 2
+
+
+@pytest.mark.buttons
+def test_update_analysis_ignores_snapshot_write_error(client, monkeypatch):
+    monkeypatch.setattr(routes, "pull_running", False)
+    monkeypatch.setattr(routes, "get_all_results", lambda: {"avg_metrics": {}})
+
+    def fail_save(results, path):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(routes, "save_analysis_snapshot", fail_save)
+
+    response = client.post("/update-analysis", json={})
+    assert response.status_code == 200
+
+
+@pytest.mark.buttons
+def test_pull_data_rebuilds_snapshot_after_load(client, monkeypatch):
+    monkeypatch.setattr(routes, "pull_running", False)
+    monkeypatch.setattr(subprocess, "run", lambda *a, **k: None)
+    monkeypatch.setattr(
+        routes, "get_all_results", lambda: {"avg_metrics": {}, "fall_2026_count": 7}
+    )
+
+    response = client.post("/pull-data", json={})
+
+    assert response.status_code == 200
+    assert queries.load_analysis_snapshot(routes.SNAPSHOT_FILE)["fall_2026_count"] == 7
+
+
+@pytest.mark.buttons
+def test_pull_data_drops_stale_snapshot_when_refresh_fails(client, monkeypatch):
+    monkeypatch.setattr(routes, "pull_running", False)
+    monkeypatch.setattr(subprocess, "run", lambda *a, **k: None)
+    queries.save_analysis_snapshot({"avg_metrics": {}}, routes.SNAPSHOT_FILE)
+
+    def db_down():
+        raise RuntimeError("database unavailable")
+
+    monkeypatch.setattr(routes, "get_all_results", db_down)
+
+    response = client.post("/pull-data", json={})
+
+    assert response.status_code == 200
+    assert not os.path.exists(routes.SNAPSHOT_FILE)
+
+
+@pytest.mark.web
+def test_page_views_read_diagnostics_from_snapshot(client, monkeypatch):
+    streamed = []
+
+    def fake_records():
+        streamed.append(1)
+        return iter([{"gpa": 3.9}, {"gpa": None}])
+
+    monkeypatch.setattr(routes, "iter_scraped_records", fake_records)
+    monkeypatch.setattr(routes, "get_all_results", lambda: {"avg_metrics": {}})
+
+    client.get("/analysis")
+    client.get("/analysis")
+
+    snapshot = queries.load_analysis_snapshot(routes.SNAPSHOT_FILE)
+    assert streamed == [1]
+    assert snapshot["scraper_diag"]["GPA present"] == 1
+    assert snapshot["data_version"] == 0
+
+
+@pytest.mark.web
+def test_snapshot_rebuilt_after_cli_load_bumps_data_version(monkeypatch):
+    from src import load_data
+
+    counts = iter([1, 2])
+    monkeypatch.setattr(routes, "iter_scraped_records", lambda: iter(()))
+    monkeypatch.setattr(
+        routes, "get_all_results", lambda: {"avg_metrics": {}, "fall_2026_count": next(counts)}
+    )
+
+    assert routes.cached_analysis_results()["fall_2026_count"] == 1
+    assert routes.cached_analysis_results()["fall_2026_count"] == 1
+    load_data.bump_data_version()
+
+    rebuilt = routes.cached_analysis_results()
+    assert rebuilt["fall_2026_count"] == 2
+    assert rebuilt["data_version"] == 1
+
+
+@pytest.mark.web
+def test_stale_snapshot_served_when_rebuild_fails(monkeypatch):
+    queries.save_analysis_snapshot({"avg_metrics": {}, "data_version": -1}, routes.SNAPSHOT_FILE)
+
+    def db_down():
+        raise RuntimeError("database unavailable")
+
+    monkeypatch.setattr(routes, "get_all_results", db_down)
+
+    assert routes.cached_analysis_results()["data_version"] == -1
+    queries.invalidate_analysis_snapshot(routes.SNAPSHOT_FILE)
+    with pytest.raises(RuntimeError):
+        routes.cached_analysis_results()
@@ -145,6 +145,38 @@ def test_load_data(tmp_path):
     assert result == data
 
 
+@pytest.mark.analysis
+def test_merge_records_replaces_by_url_and_appends_new():
+    """New rows replace same-URL rows in place; unseen rows are appended"""
+    existing = [{"entry_url": "u1", "gpa": 3.0}, {"entry_url": "u2"}, {"entry_url": None}]
+    new = [{"entry_url": "u2", "gpa": 3.9}, {"entry_url": "u3"}, {"entry_url": None}]
+
+    merged = clean.merge_records(existing, new)
+
+    assert merged == [
+        {"entry_url": "u1", "gpa": 3.0},
+        {"entry_url": "u2", "gpa": 3.9},
+        {"entry_url": None},
+        {"entry_url": "u3"},
+        {"entry_url": None},
+    ]
+
+
+@pytest.mark.analysis
+def test_main_merge_keeps_previous_rows(tmp_path, monkeypatch):
+    """main(merge=True) adds an incremental scrape to the existing output"""
+    (tmp_path / "module_2_1").mkdir()
+    out = tmp_path / "module_2_1" / "llm_extend_applicant_data.json"
+    out.write_text(json.dumps([{"entry_url": "u1"}]))
+    (tmp_path / "module_2_1" / "raw_applicant_data.json").write_text("[]")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(clean, "clean_data", lambda raw: [{"entry_url": "u2"}])
+
+    clean.main(merge=True)
+
+    assert json.loads(out.read_text()) == [{"entry_url": "u1"}, {"entry_url": "u2"}]
+
+
 @pytest.mark.analysis
 @patch("subprocess.run", side_effect=Exception("LLM failed"))
 def test_llm_clean_batch_failure_returns_original(mock_subprocess):
@@ -143,7 +143,7 @@ class TestScrapeEdgeCases:
 
     def test_parse_row_no_link(self):
         """_parse_row with no link"""
-        from src.module_2_1.scrape import _parse_row
+        from src.module_2_1.parsers import _parse_row
         from bs4 import BeautifulSoup
 
         html = "<tr><td>No link</td></tr>"
@@ -0,0 +1,202 @@
+"""
+Tests for db_pool.py and the pooled connection helpers in query_data.py
+"""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import psycopg2
+import pytest
+from psycopg2.pool import PoolError
+
+from src import query_data
+from src.db_pool import ConnectionPool
+
+
+def make_conn():
+    """Fake psycopg connection that starts open."""
+    conn = MagicMock()
+    conn.closed = 0
+    return conn
+
+
+@pytest.fixture
+def fresh_query_pool(monkeypatch):
+    """Give each test its own process-wide pool state in query_data."""
+    monkeypatch.setattr(query_data, "_POOL", None)
+    monkeypatch.setattr(query_data, "_POOL_PID", None)
+    monkeypatch.setattr(query_data, "_SCHEMA_READY", False)
+    yield
+    query_data.close_pool()
+
+
+@pytest.mark.db
+def test_pool_opens_minconn_up_front():
+    connect = MagicMock(side_effect=make_conn)
+
+    ConnectionPool(connect, minconn=2, maxconn=4)
+
+    assert connect.call_count == 2
+
+
+@pytest.mark.db
+@pytest.mark.parametrize("minconn,maxconn", [(-1, 2), (0, 0), (3, 2)])
+def test_pool_rejects_invalid_bounds(minconn, maxconn):
+    with pytest.raises(ValueError):
+        ConnectionPool(make_conn, minconn=minconn, maxconn=maxconn)
+
+
+@pytest.mark.db
+def test_pool_reuses_returned_connection_and_rolls_back():
+    connect = MagicMock(side_effect=make_conn)
+    pool = ConnectionPool(connect, minconn=0, maxconn=2)
+
+    with pool.connection() as first:
+        pass
+    with pool.connection() as second:
+        pass
+
+    assert first is second
+    assert connect.call_count == 1
+    assert first.rollback.call_count == 2
+
+
+@pytest.mark.db
+def test_pool_blocks_then_times_out_when_exhausted():
+    pool = ConnectionPool(make_conn, minconn=0, maxconn=1, timeout=0.01)
+    held = pool.getconn()
+
+    with pytest.raises(PoolError, match="exhausted"):
+        pool.getconn()
+
+    pool.putconn(held)
+    assert pool.getconn() is held
+
+
+@pytest.mark.db
+def test_pool_waiter_gets_connection_when_one_is_returned():
+    pool = ConnectionPool(make_conn, minconn=0, maxconn=1, timeout=5)
+    held = pool.getconn()
+    got = []
+
+    waiter = threading.Thread(target=lambda: got.append(pool.getconn()))
+    waiter.start()
+    pool.putconn(held)
+    waiter.join(timeout=5)
+
+    assert got == [held]
+
+
+@pytest.mark.db
+def test_pool_replaces_connections_closed_while_idle():
+    pool = ConnectionPool(make_conn, minconn=1, maxconn=1)
+    stale = pool.getconn()
+    pool.putconn(stale)
+    stale.closed = 1
+
+    fresh = pool.getconn()
+
+    assert fresh is not stale
+    assert not pool.owns(stale)
+    stale.close.assert_called_once()
+
+
+@pytest.mark.db
+def test_pool_drops_connection_that_fails_rollback():
+    pool = ConnectionPool(make_conn, minconn=0, maxconn=1)
+    conn = pool.getconn()
+    conn.rollback.side_effect = psycopg2.OperationalError("server closed")
+    conn.close.side_effect = psycopg2.InterfaceError("already closed")
+
+    pool.putconn(conn)
+
+    assert not pool.owns(conn)
+    assert pool.getconn() is not conn
+
+
+@pytest.mark.db
+def test_pool_rejects_foreign_connection():
+    pool = ConnectionPool(make_conn, minconn=0, maxconn=1)
+
+    with pytest.raises(PoolError):
+        pool.putconn(make_conn())
+
+
+@pytest.mark.db
+def test_pool_factory_error_frees_slot():
+    connect = MagicMock(side_effect=[psycopg2.OperationalError("down"), make_conn()])
+    pool = ConnectionPool(connect, minconn=0, maxconn=1, timeout=0.01)
+
+    with pytest.raises(psycopg2.OperationalError):
+        pool.getconn()
+
+    assert pool.getconn() is not None
+
+
+@pytest.mark.db
+def test_pool_closeall_closes_idle_and_returned_connections():
+    pool = ConnectionPool(make_conn, minconn=0, maxconn=2)
+    idle, busy = pool.getconn(), pool.getconn()
+    pool.putconn(idle)
+
+    pool.closeall()
+    idle.close.assert_called_once()
+    with pytest.raises(PoolError, match="closed"):
+        pool.getconn()
+
+    pool.putconn(busy)
+    busy.close.assert_called_once()
+    busy.rollback.assert_not_called()
+
+
+@pytest.mark.db
+def test_query_pool_bootstraps_table_once(fresh_query_pool, monkeypatch):
+    monkeypatch.setenv("DB_POOL_MIN", "0")
+    monkeypatch.setenv("DB_POOL_MAX", "3")
+
+    with patch("src.query_data._real_get_connection", side_effect=make_conn), patch(
+        "src.query_data.ensure_table_exists"
+    ) as mock_ensure:
+        conns = [query_data.get_connection() for _ in range(3)]
+        for conn in conns:
+            query_data.release_connection(conn)
+
+    assert mock_ensure.call_count == 1
+    assert query_data.get_pool().maxconn == 3
+
+
+@pytest.mark.db
+def test_query_functions_return_connections_to_pool(fresh_query_pool, monkeypatch):
+    monkeypatch.setenv("DB_POOL_MIN", "1")
+    conn = make_conn()
+    conn.cursor.return_value.__enter__.return_value.fetchone.return_value = (7,)
+
+    with patch("src.query_data._real_get_connection", return_value=conn), patch(
+        "src.query_data.ensure_table_exists"
+    ):
+        assert query_data.q1_fall_2026_count() == 7
+        assert query_data.q7_jhu_cs_masters_count() == 7
+
+    assert query_data.get_pool().getconn() is conn
+
+
+@pytest.mark.db
+def test_query_pool_recreated_after_fork(fresh_query_pool, monkeypatch):
+    with patch("src.query_data._real_get_connection", side_effect=make_conn), patch(
+        "src.query_data.ensure_table_exists"
+    ):
+        parent_pool = query_data.get_pool()
+        monkeypatch.setattr(query_data, "_POOL_PID", -1)
+        child_pool = query_data.get_pool()
+
+    assert child_pool is not parent_pool
+
+
+@pytest.mark.db
+def test_release_connection_ignores_foreign_connection(fresh_query_pool):
+    conn = make_conn()
+
+    query_data.release_connection(conn)
+    query_data.close_pool()
+
+    conn.close.assert_not_called()
@@ -0,0 +1,103 @@
+"""
+Parity tests for the LLM standardizer's FuzzyIndex against
+difflib.get_close_matches
+"""
+
+import difflib
+import random
+import string
+
+import pytest
+
+from src.module_2_1.llm_hosting.fuzzy_index import FuzzyIndex
+
+UNIVERSITIES = [
+    "Boston University",
+    "Brown University",
+    "Carnegie Mellon University",
+    "Columbia University",
+    "Cornell University",
+    "Georgetown University",
+    "Harvard University",
+    "Johns Hopkins University",
+    "Massachusetts Institute of Technology",
+    "Stanford University",
+    "University of California, Berkeley",
+    "University of California, Los Angeles",
+    "University of Michigan",
+    "University of Washington",
+    "Yale University",
+]
+PROGRAMS = [
+    "Applied Mathematics",
+    "Biology",
+    "Biomedical Engineering",
+    "Chemistry",
+    "Computer Engineering",
+    "Computer Science",
+    "Economics",
+    "Electrical Engineering",
+    "History",
+    "Mechanical Engineering",
+    "Physics",
+    "Political Science",
+    "Psychology",
+    "Public Health",
+    "Statistics",
+]
+CASES = [(UNIVERSITIES, 0.86), (PROGRAMS, 0.84)]
+
+
+def difflib_best(name, candidates, cutoff):
+    matches = difflib.get_close_matches(name, candidates, n=1, cutoff=cutoff)
+    return matches[0] if matches else None
+
+
+def misspell(rng, text):
+    """Apply one to three random character substitutions, insertions or deletions."""
+    chars = list(text)
+    for _ in range(rng.randint(1, 3)):
+        pos = rng.randrange(len(chars) + 1)
+        edit = rng.random()
+        if edit < 0.4 and chars:
+            chars[min(pos, len(chars) - 1)] = rng.choice(string.ascii_lowercase)
+        elif edit < 0.7:
+            chars.insert(pos, rng.choice(string.ascii_lowercase))
+        elif chars:
+            del chars[min(pos, len(chars) - 1)]
+    return "".join(chars)
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("canon, cutoff", CASES)
+def test_misspelled_canonical_names_match_difflib(canon, cutoff):
+    index = FuzzyIndex(canon)
+    rng = random.Random(2026)
+
+    for _ in range(300):
+        name = misspell(rng, rng.choice(canon))
+        assert index.best(name, cutoff) == difflib_best(name, canon, cutoff), name
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("cutoff", [0.5, 0.84, 0.94])
+def test_random_words_match_difflib_including_ties(cutoff):
+    rng = random.Random(cutoff)
+    canon = ["".join(rng.choice("abcab ") for _ in range(rng.randint(1, 8))) for _ in range(200)]
+    index = FuzzyIndex(canon)
+
+    for _ in range(300):
+        name = "".join(rng.choice("abcdx") for _ in range(rng.randint(1, 8)))
+        assert index.best(name, cutoff) == difflib_best(name, canon, cutoff), name
+
+
+@pytest.mark.integration
+def test_members_empty_and_unmatched_names():
+    index = FuzzyIndex(["Stanford University", "Stanford University", "MIT"])
+
+    assert index.candidates == ["MIT", "Stanford University"]
+    assert index.best("MIT", 0.9) == "MIT"
+    assert index.best("Stanfrod University", 0.86) == "Stanford University"
+    assert index.best("", 0.1) is None
+    assert index.best("zzz", 0.1) is None
+    assert FuzzyIndex([]).best("MIT") is None
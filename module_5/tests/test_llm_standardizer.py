@@ -0,0 +1,318 @@
+"""
+Tests for the LLM standardizer in llm_hosting/app.py, with the model replaced
+by a scripted fake
+"""
+
+import json
+import os
+import sys
+import types
+from collections import Counter
+
+import pytest
+
+# app.py imports fuzzy_index as a sibling module, as when it runs as a script.
+sys.path.insert(
+    0,
+    os.path.abspath(
+        os.path.join(os.path.dirname(__file__), "..", "src", "module_2_1", "llm_hosting")
+    ),
+)
+
+# The model runtime (llm_hosting/requirements.txt) is not part of the test
+# environment; the tests never load a model, so empty stand-ins suffice.
+for _name, _attrs in (
+    ("llama_cpp", {"Llama": object, "LlamaRAMCache": object}),
+    ("huggingface_hub", {"hf_hub_download": None}),
+):
+    if _name not in sys.modules:
+        sys.modules[_name] = types.SimpleNamespace(**_attrs)
+
+from src.module_2_1.llm_hosting import app as standardizer  # noqa: E402
+from src.module_2_1.llm_hosting.fuzzy_index import FuzzyIndex  # noqa: E402
+
+UNIVERSITIES = ["McGill University", "Stanford University", "University of British Columbia"]
+PROGRAMS = ["Computer Science", "Information Studies", "Mathematics"]
+
+
+class FakeLlama:
+    """Scripted chat model that records the user message of every request.
+
+    ``reply(request)`` receives the decoded user message and returns the
+    assistant's text; by default every input is answered correctly.
+    """
+
+    def __init__(self, reply=None):
+        self.requests = []
+        self.reply = reply or self.echo
+
+    @staticmethod
+    def echo(request):
+        if "programs" not in request:
+            program, university = request["program"].split(", ")
+            return json.dumps(
+                {"standardized_program": program, "standardized_university": university}
+            )
+        return json.dumps(
+            [
+                {
+                    "id": item["id"],
+                    "standardized_program": item["program"].split(", ")[0],
+                    "standardized_university": item["program"].split(", ")[1],
+                }
+                for item in request["programs"]
+            ]
+        )
+
+    def create_chat_completion(self, messages, **_):
+        request = json.loads(messages[-1]["content"])
+        self.requests.append(request)
+        return {"choices": [{"message": {"content": self.reply(request)}}]}
+
+    def inputs(self):
+        """Every input text sent to the model, across single and batched calls."""
+        return [
+            text
+            for request in self.requests
+            for text in (
+                [item["program"] for item in request["programs"]]
+                if "programs" in request
+                else [request["program"]]
+            )
+        ]
+
+
+@pytest.fixture
+def llm(monkeypatch):
+    """Small canonical lists, no persistent cache, and a fake model."""
+    fake = FakeLlama()
+    monkeypatch.setattr(standardizer, "_LLM", fake)
+    monkeypatch.setattr(standardizer, "CANON_UNIS", UNIVERSITIES)
+    monkeypatch.setattr(standardizer, "CANON_PROGS", PROGRAMS)
+    monkeypatch.setattr(standardizer, "CANON_UNI_SET", frozenset(UNIVERSITIES))
+    monkeypatch.setattr(standardizer, "CANON_PROG_SET", frozenset(PROGRAMS))
+    monkeypatch.setattr(standardizer, "CANON_UNI_INDEX", FuzzyIndex(UNIVERSITIES))
+    monkeypatch.setattr(standardizer, "CANON_PROG_INDEX", FuzzyIndex(PROGRAMS))
+    monkeypatch.setattr(standardizer, "LLM_CACHE_PATH", "")
+    monkeypatch.setattr(standardizer, "_RESULT_CACHE", None)
+    monkeypatch.setattr(standardizer, "TIER_HITS", Counter())
+    monkeypatch.setattr(standardizer, "LLM_BATCH_SIZE", 8)
+    return fake
+
+
+def row(program, university, **extra):
+    return {"program_name": program, "university": university, **extra}
+
+
+@pytest.mark.analysis
+def test_standardize_rows_calls_model_once_per_distinct_input(llm):
+    rows = [
+        row("Basket Weaving", "Clown College", n=0),
+        row("Underwater Pottery", "Sea Academy", n=1),
+        row(" basket  weaving", "CLOWN COLLEGE ", n=2),
+        row("Lunar Farming", "Moon Institute", n=3),
+        row("Underwater Pottery", "Sea Academy", n=4),
+    ]
+    results = {}
+
+    out = list(standardizer._standardize_rows(rows, results))
+
+    assert [r["n"] for r in out] == [0, 1, 2, 3, 4]
+    assert sorted(llm.inputs()) == [
+        "Basket Weaving, Clown College",
+        "Lunar Farming, Moon Institute",
+        "Underwater Pottery, Sea Academy",
+    ]
+    assert len(results) == 3
+    assert out[0]["llm-generated-program"] == "Basket Weaving"
+    assert out[2]["llm-generated-program"] == "Basket Weaving"
+    assert out[4]["llm-generated-university"] == "Sea Academy"
+
+
+@pytest.mark.analysis
+def test_standardize_rows_keeps_order_across_llm_batches(llm, monkeypatch):
+    monkeypatch.setattr(standardizer, "LLM_BATCH_SIZE", 2)
+    rows = [
+        row("Computer Science", "Stanford University", n=0),
+        row("Basket Weaving", "Clown College", n=1),
+        row("Underwater Pottery", "Sea Academy", n=2),
+        row("Mathematics", "UBC", n=3),
+        row("Lunar Farming", "Moon Institute", n=4),
+    ]
+
+    out = list(standardizer._standardize_rows(rows))
+
+    assert [r["n"] for r in out] == [0, 1, 2, 3, 4]
+    assert len(llm.requests[0]["programs"]) == 2
+    assert len(llm.inputs()) == 3
+    assert out[3]["llm-generated-university"] == "University of British Columbia"
+    assert out[4]["llm-generated-program"] == "Lunar Farming"
+
+
+@pytest.mark.db
+def test_result_cache_persists_per_fingerprint(tmp_path):
+    path = str(tmp_path / "llm_cache.db")
+    result = {"standardized_program": "Mathematics", "standardized_university": "McGill"}
+    cache = standardizer.ResultCache(path, "fp1")
+    cache.put("math, mcg", result)
+    cache.close()
+
+    reopened = standardizer.ResultCache(path, "fp1")
+    assert reopened.get("math, mcg") == result
+    assert reopened.get("physics, mcg") is None
+    assert (reopened.hits, reopened.misses) == (1, 1)
+    reopened.close()
+
+    # A new fingerprint starts empty and drops the old rows for good
+    standardizer.ResultCache(path, "fp2").close()
+    assert standardizer.ResultCache(path, "fp1").get("math, mcg") is None
+
+
+@pytest.mark.db
+@pytest.mark.parametrize(
+    "name, value",
+    [
+        ("MODEL_FILE", "other-model.gguf"),
+        ("LLM_BATCH_SIZE", 4),
+        ("CANON_UNIS", UNIVERSITIES[:1]),
+        ("COMMON_PROG_FIXES", {"Maths": "Mathematics"}),
+    ],
+)
+def test_cache_fingerprint_tracks_what_shapes_results(llm, monkeypatch, name, value):
+    before = standardizer._cache_fingerprint()
+
+    monkeypatch.setattr(standardizer, name, value)
+
+    assert standardizer._cache_fingerprint() != before
+
+
+@pytest.mark.analysis
+@pytest.mark.parametrize(
+    "program, university, expected, tier",
+    [
+        ("Mathematics", "Stanford University", "Mathematics|Stanford University", "exact"),
+        (" mathematics ", "stanford university", "Mathematics|Stanford University", "exact"),
+        ("Computer Science", "UBC", "Computer Science|University of British Columbia", "abbrev"),
+        ("Mathematic", "Mcgill University", "Mathematics|McGill University", "abbrev"),
+        ("Computer Sciences", "UBC", "Computer Science|University of British Columbia", "fuzzy"),
+    ],
+)
+def test_resolve_rules_reports_weakest_tier(llm, program, university, expected, tier):
+    result, used = standardizer._resolve_rules(program, university)
+
+    assert f"{result['standardized_program']}|{result['standardized_university']}" == expected
+    assert used == tier
+
+
+@pytest.mark.analysis
+@pytest.mark.parametrize(
+    "program, university",
+    [
+        ("Basket Weaving", "Stanford University"),
+        ("Computer Science", "Clown College"),
+        ("", "UBC"),
+    ],
+)
+def test_resolve_rules_defers_unresolved_rows_to_llm(llm, program, university):
+    assert standardizer._resolve_rules(program, university) is None
+
+
+@pytest.mark.analysis
+def test_tiers_tried_in_order_rules_cache_then_llm(llm, monkeypatch, tmp_path):
+    monkeypatch.setattr(standardizer, "LLM_CACHE_PATH", str(tmp_path / "llm_cache.db"))
+    cache = standardizer._result_cache()
+    cached = {"standardized_program": "Lunar Farming", "standardized_university": "Moon U"}
+    cache.put("lunar farming, moon institute", cached)
+    rows = [
+        row("Computer Science", "UBC"),
+        row("Lunar Farming", "Moon Institute"),
+        row("Basket Weaving", "Clown College"),
+    ]
+
+    out = list(standardizer._standardize_rows(rows))
+
+    assert standardizer.TIER_HITS == Counter(abbrev=1, cache=1, llm=1)
+    assert llm.inputs() == ["Basket Weaving, Clown College"]
+    # The rule tier answered without consulting the cache
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert out[1]["llm-generated-university"] == "Moon U"
+    assert cache.get("basket weaving, clown college") == {
+        "standardized_program": "Basket Weaving",
+        "standardized_university": "Clown College",
+    }
+    assert standardizer._tier_summary() == "abbrev 33% | cache 33% | llm 33%"
+    cache.close()
+
+
+def scripted(replies):
+    """Fake-model reply function: batched requests get ``replies`` in turn."""
+    replies = iter(replies)
+
+    def reply(request):
+        if "programs" in request:
+            return next(replies)
+        return FakeLlama.echo(request)
+
+    return reply
+
+
+TEXTS = ["Basket Weaving, Clown College", "Lunar Farming, Moon Institute", "Sea Law, Sea Academy"]
+
+
+def answer(i, text=None):
+    program, university = (text or TEXTS[i]).split(", ")
+    return {"id": i, "standardized_program": program, "standardized_university": university}
+
+
+@pytest.mark.analysis
+def test_batched_replies_matched_by_echoed_id(llm):
+    llm.reply = scripted([json.dumps([answer(2), answer(0), answer(1)])])
+
+    results = standardizer._call_llm_batch(TEXTS)
+
+    assert [r["standardized_program"] for r in results] == [
+        "Basket Weaving",
+        "Lunar Farming",
+        "Sea Law",
+    ]
+    assert len(llm.requests) == 1
+
+
+@pytest.mark.analysis
+@pytest.mark.parametrize(
+    "reply, retried",
+    [
+        # id 1 missing
+        ([answer(0), answer(2)], ["Lunar Farming, Moon Institute"]),
+        # id 0 answered twice (and id 1 not at all): neither answer can be trusted
+        ([answer(0), answer(0, TEXTS[1]), answer(2)], TEXTS[:2]),
+        # ids that are unhashable, not ints or out of range are ignored
+        (
+            [{**answer(0), "id": [0]}, {**answer(1), "id": "1"}, {**answer(2), "id": 7}],
+            TEXTS,
+        ),
+        # not a JSON array
+        ({"standardized_program": "Basket Weaving"}, TEXTS),
+    ],
+)
+def test_unmatched_batch_inputs_retried_one_by_one(llm, reply, retried):
+    llm.reply = scripted([json.dumps(reply)])
+
+    results = standardizer._call_llm_batch(TEXTS)
+
+    assert llm.inputs()[len(TEXTS):] == retried
+    assert [r["standardized_university"] for r in results] == [
+        "Clown College",
+        "Moon Institute",
+        "Sea Academy",
+    ]
+
+
+@pytest.mark.analysis
+def test_unparseable_batch_reply_falls_back_per_input(llm):
+    llm.reply = scripted(["Sure! Here are the answers."])
+
+    results = standardizer._call_llm_batch(TEXTS[:2])
+
+    assert llm.inputs() == TEXTS[:2] + TEXTS[:2]
+    assert results[1]["standardized_program"] == "Lunar Farming"
@@ -11,7 +11,7 @@ import os
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
-from src import load_data
+from src import load_data, query_data
 from tests.test_helpers import create_mock_connection
 
 
@@ -161,15 +161,15 @@ def test_insert_record_duplicate(mock_connect):
 
 @pytest.mark.db
 @patch("src.load_data.get_connection")
-@patch("src.load_data.load_json")
-def test_load_into_db(mock_load_json, mock_get_conn):
+@patch("src.load_data.iter_json_records")
+def test_load_into_db(mock_iter_records, mock_get_conn):
     """Test full load pipeline"""
     # Mock data
     mock_data = [
         {"program_name": "CS", "entry_url": "http://test.com/1"},
         {"program_name": "Physics", "entry_url": "http://test.com/2"},
     ]
-    mock_load_json.return_value = mock_data
+    mock_iter_records.return_value = iter(mock_data)
 
     # Mock connection with proper context manager
     mock_conn = create_mock_connection()
@@ -179,7 +179,7 @@ def test_load_into_db(mock_load_json, mock_get_conn):
     load_data.load_into_db("test.json")
 
     # Verify
-    mock_load_json.assert_called_once_with("test.json")
+    mock_iter_records.assert_called_once_with("test.json")
     mock_conn.close.assert_called_once()
 
 
@@ -206,3 +206,143 @@ def test_normalize_record_handles_none_values():
     assert result["program"] is None
     assert result["url"] is None
     assert result["gpa"] is None
+
+
+@pytest.mark.db
+def test_copy_escape_handles_nulls_and_control_characters():
+    """COPY text format: None becomes \\N and control characters are escaped"""
+    assert load_data._copy_escape(None) == "\\N"
+    assert load_data._copy_escape(3.9) == "3.9"
+    assert load_data._copy_escape("a\tb\nc\\d\re") == "a\\tb\\nc\\\\d\\re"
+
+
+@pytest.mark.db
+def test_insert_records_bulk_streams_rows_and_counts_duplicates():
+    """Bulk insert streams every record through COPY and reports duplicates"""
+    copied = {}
+
+    mock_cursor = MagicMock()
+    mock_cursor.rowcount = 2
+
+    def fake_copy_expert(statement, stream):
+        copied["sql"] = statement
+        copied["payload"] = stream.read(7) + stream.read()
+
+    mock_cursor.copy_expert.side_effect = fake_copy_expert
+    mock_conn = MagicMock()
+    mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+
+    records = [
+        load_data.normalize_record({"program_name": "CS", "entry_url": f"u{i}"})
+        for i in range(3)
+    ]
+    records[0]["comments"] = "tab\there"
+
+    inserted, duplicates = load_data.insert_records_bulk(mock_conn, iter(records))
+
+    assert (inserted, duplicates) == (2, 1)
+    assert copied["sql"].startswith("COPY applicants_staging (program, comments")
+    lines = copied["payload"].decode("utf-8").splitlines()
+    assert len(lines) == 3
+    assert lines[0].split("\t")[:4] == ["CS", "tab\\there", "\\N", "u0"]
+    merge_sql = mock_cursor.execute.call_args[0][0]
+    assert "ON CONFLICT (url) DO NOTHING" in merge_sql
+    mock_conn.commit.assert_called_once()
+
+
+@pytest.mark.db
+@patch("src.load_data.get_connection")
+@patch("src.load_data.iter_json_records")
+def test_load_into_db_row_by_row(mock_iter_records, mock_get_conn, capsys):
+    """bulk=False keeps the one-insert-per-record path"""
+    mock_iter_records.return_value = iter([{"entry_url": "u1"}, {"entry_url": "u2"}])
+    mock_get_conn.return_value = create_mock_connection()
+
+    with patch("src.load_data.insert_record", side_effect=[1, 0]) as mock_insert:
+        load_data.load_into_db("test.json", bulk=False)
+
+    assert mock_insert.call_count == 2
+    assert "Inserted 1 new records" in capsys.readouterr().out
+
+
+@pytest.mark.db
+@pytest.mark.parametrize("chunk_size", [1, 5, 1 << 16])
+def test_iter_json_records_reads_array_incrementally(tmp_path, chunk_size):
+    """Streaming reader yields every element of a top-level JSON array"""
+    records = [{"entry_url": f"u{i}", "comments": "a, b ] {c}"} for i in range(25)]
+    test_file = tmp_path / "data.json"
+    test_file.write_text(json.dumps(records, indent=2))
+
+    result = load_data.iter_json_records(str(test_file), chunk_size=chunk_size)
+
+    assert not isinstance(result, list)
+    assert list(result) == records
+
+
+@pytest.mark.db
+def test_iter_json_records_reads_json_lines(tmp_path):
+    """Streaming reader also accepts newline-delimited JSON"""
+    records = [{"entry_url": "u1"}, {"entry_url": "u2"}]
+    test_file = tmp_path / "data.jsonl"
+    test_file.write_text("\n".join(json.dumps(r) for r in records) + "\n")
+
+    assert list(load_data.iter_json_records(test_file, chunk_size=4)) == records
+
+
+@pytest.mark.db
+def test_iter_json_records_empty_and_missing(tmp_path):
+    """Empty arrays/files yield nothing; missing files fail before iterating"""
+    empty_array = tmp_path / "empty.json"
+    empty_array.write_text(" [ ] ")
+    empty_file = tmp_path / "blank.json"
+    empty_file.write_text("")
+
+    assert list(load_data.iter_json_records(empty_array, chunk_size=1)) == []
+    assert list(load_data.iter_json_records(empty_file)) == []
+    with pytest.raises(FileNotFoundError):
+        load_data.iter_json_records(tmp_path / "missing.json")
+
+
+@pytest.mark.db
+def test_iter_json_records_truncated_file_raises(tmp_path):
+    """A record cut off at end of file raises JSONDecodeError"""
+    test_file = tmp_path / "truncated.json"
+    test_file.write_text('[{"entry_url": "u1"}, {"entry_url": ')
+
+    records = load_data.iter_json_records(test_file, chunk_size=8)
+
+    assert next(records) == {"entry_url": "u1"}
+    with pytest.raises(json.JSONDecodeError):
+        next(records)
+
+
+@pytest.mark.db
+@pytest.mark.parametrize("bootstrap", [load_data.create_table, query_data.ensure_table_exists])
+def test_schema_bootstrap_adds_indexes(bootstrap):
+    """Both bootstrap paths build the tuned schema in the same statement."""
+    mock_conn = create_mock_connection()
+
+    bootstrap(mock_conn)
+
+    ddl = mock_conn.cursor.return_value.__enter__.return_value.execute.call_args[0][0]
+    assert ddl.index("CREATE TABLE IF NOT EXISTS applicants") < ddl.index("pg_trgm")
+    assert "ALTER TABLE" not in ddl
+    assert "applicants_fall_2026_accepted_idx" in ddl
+    assert "gin_trgm_ops" in ddl
+    assert "EXCEPTION WHEN insufficient_privilege" in ddl
+
+
+@pytest.mark.db
+def test_iter_json_records_malformed_record_raises_without_buffering(tmp_path):
+    """A malformed record mid-file raises at once instead of reading the rest"""
+    tail = ", ".join(f'{{"entry_url": "u{i}"}}' for i in range(2, 200))
+    text = '[{"entry_url": "u1"}, {"entry_url" "bad"}, ' + tail + "]"
+    test_file = tmp_path / "malformed.json"
+    test_file.write_text(text)
+
+    records = load_data.iter_json_records(test_file, chunk_size=64)
+
+    assert next(records) == {"entry_url": "u1"}
+    with pytest.raises(json.JSONDecodeError) as exc_info:
+        next(records)
+    assert len(exc_info.value.doc) < len(text) // 4
@@ -11,7 +11,7 @@ def test_cli_main_default_no_drop(monkeypatch):
 
     called_with = {}
 
-    def fake_main(drop=False):
+    def fake_main(drop=False, follow=None):
         called_with["drop"] = drop
         return "ok"
 
@@ -28,7 +28,7 @@ def test_cli_main_with_drop_flag(monkeypatch):
 
     called_with = {}
 
-    def fake_main(drop=False):
+    def fake_main(drop=False, follow=None):
         called_with["drop"] = drop
         return "ok"
 
@@ -0,0 +1,214 @@
+"""
+Tests for query_cache.py and the memoized analysis queries in query_data.py
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src import load_data, query_data
+from src.query_cache import QueryCache
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def counting(cache):
+    """Memoized function that records every real call."""
+    calls = []
+
+    @cache.memoize
+    def square(x, offset=0):
+        calls.append(x)
+        return x * x + offset
+
+    return square, calls
+
+
+@pytest.mark.db
+def test_cache_hits_until_ttl_expires():
+    clock = FakeClock()
+    cache = QueryCache(maxsize=4, ttl=10, clock=clock)
+    square, calls = counting(cache)
+
+    assert square(3) == 9
+    assert square(3) == 9
+    clock.now = 11
+    assert square(3) == 9
+
+    assert calls == [3, 3]
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 2
+
+
+@pytest.mark.db
+def test_cache_keys_include_arguments():
+    cache = QueryCache()
+    square, calls = counting(cache)
+
+    square(2)
+    square(2, offset=1)
+    square(2, offset=1)
+    square(4)
+
+    assert calls == [2, 2, 4]
+
+
+@pytest.mark.db
+def test_cache_evicts_least_recently_used():
+    cache = QueryCache(maxsize=2)
+    square, calls = counting(cache)
+
+    square(1)
+    square(2)
+    square(1)
+    square(3)
+    square(1)
+    square(2)
+
+    assert calls == [1, 2, 3, 2]
+    assert cache.stats()["evictions"] == 2
+    assert cache.stats()["size"] == 2
+
+
+@pytest.mark.db
+def test_cache_cleared_when_data_version_changes():
+    version = [1]
+    cache = QueryCache(version=lambda: version[0])
+    square, calls = counting(cache)
+
+    square(5)
+    square(5)
+    version[0] = 2
+    square(5)
+
+    assert calls == [5, 5]
+
+
+@pytest.mark.db
+def test_result_not_cached_when_data_version_moves_mid_query():
+    version = [1]
+    cache = QueryCache(version=lambda: version[0])
+    calls = []
+
+    @cache.memoize
+    def count_rows():
+        calls.append(version[0])
+        version[0] += 1  # the loader commits while the query runs
+        return len(calls)
+
+    assert count_rows() == 1
+    assert cache.stats()["size"] == 0
+    assert count_rows() == 2
+    assert calls == [1, 2]
+
+
+@pytest.mark.db
+def test_cache_get_and_put_directly():
+    cache = QueryCache()
+
+    assert cache.get("k") == (False, None)
+    cache.put("k", [1])
+    assert cache.get("k") == (True, [1])
+
+
+@pytest.mark.db
+@pytest.mark.parametrize("maxsize,ttl", [(0, 300), (128, 0)])
+def test_cache_disabled_always_calls_through(maxsize, ttl):
+    cache = QueryCache(maxsize=maxsize, ttl=ttl)
+    square, calls = counting(cache)
+
+    square(2)
+    square(2)
+    cache.put("key", "value")
+
+    assert calls == [2, 2]
+    assert cache.stats()["size"] == 0
+
+
+@pytest.mark.db
+def test_cache_stats_and_clear():
+    cache = QueryCache(maxsize=8, ttl=60)
+    assert cache.stats()["hit_rate"] == 0.0
+    square, _ = counting(cache)
+
+    square(1)
+    square(1)
+    square(1)
+    square(2)
+
+    stats = cache.stats()
+    assert stats["hit_rate"] == 0.5
+    assert (stats["maxsize"], stats["ttl"]) == (8, 60)
+
+    cache.clear()
+    assert cache.stats()["hits"] == cache.stats()["size"] == 0
+
+
+@pytest.mark.db
+def test_data_version_bumps_and_tolerates_garbage():
+    assert load_data.read_data_version() == 0
+
+    assert load_data.bump_data_version() == 1
+    assert load_data.bump_data_version() == 2
+
+    load_data.DATA_VERSION_FILE.write_text("not a number")
+    assert load_data.read_data_version() == 0
+
+
+@pytest.mark.db
+def test_load_into_db_bumps_version_only_when_rows_inserted():
+    with patch("src.load_data.get_connection"), patch(
+        "src.load_data.iter_json_records", return_value=iter([])
+    ), patch("src.load_data.create_table"), patch(
+        "src.load_data.insert_records_bulk", side_effect=[(0, 3), (2, 1)]
+    ):
+        load_data.load_into_db("data.json")
+        assert load_data.read_data_version() == 0
+        load_data.load_into_db("data.json")
+        assert load_data.read_data_version() == 1
+
+
+@pytest.mark.db
+def test_row_by_row_load_bumps_version():
+    with patch("src.load_data.get_connection"), patch(
+        "src.load_data.iter_json_records", return_value=iter([{"url": "u"}])
+    ), patch("src.load_data.create_table"), patch(
+        "src.load_data.insert_record", return_value=1
+    ):
+        load_data.load_into_db("data.json", bulk=False)
+
+    assert load_data.read_data_version() == 1
+
+
+@pytest.mark.db
+def test_analysis_queries_skip_database_until_data_version_changes():
+    conn = MagicMock()
+    cur = conn.cursor.return_value.__enter__.return_value
+    cur.fetchone.return_value = (42,)
+
+    with patch("src.query_data.get_connection", return_value=conn):
+        assert query_data.q1_fall_2026_count() == 42
+        assert query_data.q1_fall_2026_count() == 42
+        load_data.bump_data_version()
+        assert query_data.q1_fall_2026_count() == 42
+
+    assert cur.execute.call_count == 2
+    assert query_data.cache_stats()["hits"] == 1
+
+
+@pytest.mark.web
+def test_cache_stats_route(client):
+    query_data.clear_query_cache()
+
+    response = client.get("/cache-stats")
+
+    assert response.status_code == 200
+    assert response.get_json()["hits"] == 0
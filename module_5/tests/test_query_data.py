@@ -9,6 +9,39 @@ from unittest.mock import Mock, patch, MagicMock
 from src.query_data import q11_custom, q10_custom
 
 
+@pytest.mark.db
+def test_q2_percent_international():
+    """Test q2: Percent of international applicants."""
+    from src import query_data
+
+    with patch("src.query_data.get_connection") as mock_conn:
+        mock_cursor = Mock()
+        mock_cursor.fetchone.return_value = (None,)
+        mock_conn.return_value.cursor.return_value.__enter__.return_value = mock_cursor
+
+        assert query_data.q2_percent_international() == 0
+
+
+@pytest.mark.db
+def test_q3_average_metrics():
+    """Test q3: Average GPA and GRE metrics."""
+    from src import query_data
+
+    with patch("src.query_data.get_connection") as mock_conn:
+        mock_cursor = Mock()
+        mock_cursor.fetchone.return_value = (3.8, 320.0, 160.0, 4.5)
+        mock_conn.return_value.cursor.return_value.__enter__.return_value = mock_cursor
+
+        result = query_data.q3_average_metrics()
+
+    assert result == {
+        "avg_gpa": 3.8,
+        "avg_gre": 320.0,
+        "avg_gre_v": 160.0,
+        "avg_gre_aw": 4.5,
+    }
+
+
 @pytest.mark.db
 def test_q4_avg_gpa_american_fall_2026():
     """Test q4: Average GPA of American students in Fall 2026."""
@@ -260,18 +293,20 @@ def test_get_all_analysis():
 
     with patch("src.query_data.get_connection") as mock_conn:
         mock_cursor = Mock()
-        # Mock responses for all queries
-        mock_cursor.fetchone.side_effect = [
-            (100,),  # q1
-            (50.0,),  # q2
-            (3.8, 320.0, 160.0, 4.5),  # q3
-            (3.75,),  # q4
-            (25.5,),  # q5
-            (3.85,),  # q6
-            (42,),  # q7
-            (5,),  # q8
-            (3,),  # q9
-        ]
+        # One row holding every scalar metric (q1-q9) from the single scan
+        mock_cursor.fetchone.return_value = (
+            100,  # q1
+            50.0,  # q2
+            3.8, 320.0, 160.0, 4.5,  # q3
+            3.75,  # q4
+            25.5,  # q5
+            3.85,  # q6
+            42,  # q7
+            5,  # q8
+            3,  # q9
+        )
+        # q10/q11 come from one GROUPING SETS pass
+        mock_cursor.fetchall.return_value = []
         mock_conn.return_value.cursor.return_value.__enter__.return_value = mock_cursor
 
         result = query_data.get_all_analysis()
@@ -294,3 +329,61 @@ def test_get_all_analysis():
         assert "jhu_cs_masters_count" in result
         assert "elite_cs_phd_accepts_2026" in result
         assert "elite_cs_phd_llm_accepts_2026" in result
+
+        # Values match what the individual q* functions would return
+        assert result["fall_2026_count"] == 100
+        assert result["avg_gpa_american_fall_2026"] == "3.75"
+        assert result["pct_accept_fall_2026"] == "25.50"
+        assert result["jhu_cs_masters"] == 42
+        assert result["top_schools_accept_llm"] == 3
+        assert mock_cursor.execute.call_count == 2
+
+
+@pytest.mark.db
+def test_summary_metrics_uses_filtered_aggregates_in_one_scan():
+    """All scalar metrics come from one SELECT with FILTER clauses."""
+    from src import query_data
+
+    with patch("src.query_data.get_connection") as mock_conn:
+        mock_cursor = Mock()
+        mock_cursor.fetchone.return_value = (None,) * 12
+        mock_conn.return_value.cursor.return_value.__enter__.return_value = mock_cursor
+
+        result = query_data.summary_metrics()
+
+    stmt = mock_cursor.execute.call_args[0][0]
+    assert mock_cursor.execute.call_count == 1
+    assert stmt.count("FROM applicants") == 1
+    assert "FILTER (WHERE term='Fall 2026')" in stmt
+    assert result["fall_2026_count"] == 0
+    assert result["pct_international"] == 0
+    assert result["avg_gpa_accept_fall_2026"] == "N/A"
+    assert result["avg_metrics"]["avg_gpa"] is None
+    assert result["elite_cs_phd_accepts_2026"] == 0
+
+
+@pytest.mark.db
+def test_grouped_summaries_splits_grouping_sets():
+    """University and degree rows are split, ordered and limited like q10/q11."""
+    from src import query_data
+
+    rows = [
+        (0, "MIT", None, 5, 2, 40.0),
+        (0, "Stanford", None, 9, 3, 33.33),
+        (0, "JHU", None, 7, 7, 100.0),
+        (1, None, "PhD", 14, 7, 50.0),
+        (1, None, "Masters", 7, 5, 71.43),
+    ]
+
+    with patch("src.query_data.get_connection") as mock_conn:
+        mock_cursor = Mock()
+        mock_cursor.fetchall.return_value = rows
+        mock_conn.return_value.cursor.return_value.__enter__.return_value = mock_cursor
+
+        universities, degrees = query_data.grouped_summaries(
+            university_limit=2, degree_limit=500
+        )
+
+    assert "GROUPING SETS" in mock_cursor.execute.call_args[0][0]
+    assert universities == [("Stanford", 9), ("JHU", 7)]
+    assert degrees == [("Masters", 7, 5, 71.43), ("PhD", 14, 7, 50.0)]
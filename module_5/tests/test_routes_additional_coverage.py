@@ -89,6 +89,19 @@ def test_pull_data_json_success(client, monkeypatch):
     assert response.json["ok"] is True
 
 
+@pytest.mark.buttons
+def test_pull_data_merges_incremental_scrape(client, monkeypatch):
+    commands = []
+    monkeypatch.setattr(routes, "pull_running", False)
+    monkeypatch.setattr(subprocess, "run", lambda cmd, **k: commands.append(cmd))
+
+    client.post("/pull-data", json={})
+
+    scraper, cleaner, _ = commands
+    assert scraper.endswith("--incremental")
+    assert cleaner.endswith("clean.py\" --merge")
+
+
 @pytest.mark.web
 def test_load_scraped_records_valid(tmp_path, monkeypatch):
     # Create the directory structure expected by load_scraped_records()
@@ -180,3 +193,23 @@ def test_status_exception(monkeypatch, client):
     response = client.get("/status")
     assert response.status_code == 200
     assert response.json["busy"] is False
+
+
+@pytest.mark.web
+def test_iter_scraped_records_streams_file(tmp_path, monkeypatch):
+    module_dir = tmp_path / "module_2_1"
+    module_dir.mkdir(parents=True)
+    (module_dir / "llm_extend_applicant_data.json").write_text('[{"x": 1}, {"x": 2}]')
+    monkeypatch.setattr(routes, "PROJECT_ROOT", str(tmp_path))
+
+    records = routes.iter_scraped_records()
+
+    assert not isinstance(records, list)
+    assert list(records) == [{"x": 1}, {"x": 2}]
+
+
+@pytest.mark.web
+def test_iter_scraped_records_missing_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(routes, "PROJECT_ROOT", str(tmp_path))
+
+    assert list(routes.iter_scraped_records()) == []
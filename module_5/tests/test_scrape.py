@@ -9,7 +9,7 @@ import os
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
-from src.module_2_1 import scrape
+from src.module_2_1 import fetch, parsers, scrape
 from bs4 import BeautifulSoup
 
 
@@ -22,12 +22,12 @@ def test_get_opener():
 
 
 @pytest.mark.integration
-@patch("src.module_2_1.scrape.urllib.robotparser.RobotFileParser")
-def test_check_robots_allowed(mock_robot_parser):
+@patch("src.module_2_1.fetch._fetch")
+def test_check_robots_allowed(mock_fetch):
     """Test robots.txt check when allowed"""
-    mock_rp = Mock()
-    mock_rp.can_fetch.return_value = True
-    mock_robot_parser.return_value = mock_rp
+    mock_fetch.return_value = fetch.Response(
+        200, {}, b"User-agent: *\nDisallow: /admin/", fetch.ROBOTS_URL
+    )
 
     result = scrape.check_robots()
 
@@ -35,12 +35,12 @@ def test_check_robots_allowed(mock_robot_parser):
 
 
 @pytest.mark.integration
-@patch("src.module_2_1.scrape.urllib.robotparser.RobotFileParser")
-def test_check_robots_disallowed(mock_robot_parser):
+@patch("src.module_2_1.fetch._fetch")
+def test_check_robots_disallowed(mock_fetch):
     """Test robots.txt check when disallowed"""
-    mock_rp = Mock()
-    mock_rp.can_fetch.return_value = False
-    mock_robot_parser.return_value = mock_rp
+    mock_fetch.return_value = fetch.Response(
+        200, {}, b"User-agent: *\nDisallow: /survey/", fetch.ROBOTS_URL
+    )
 
     result = scrape.check_robots()
 
@@ -48,18 +48,13 @@ def test_check_robots_disallowed(mock_robot_parser):
 
 
 @pytest.mark.integration
-@patch("src.module_2_1.scrape.get_opener")
+@patch("src.module_2_1.fetch._HTTP_POOL")
 @patch("time.sleep")
-def test_get_html_success(mock_sleep, mock_get_opener):
+def test_get_html_success(mock_sleep, mock_pool):
     """Test HTML fetching succeeds"""
-    from unittest.mock import MagicMock
-
-    mock_response = MagicMock()
-    mock_response.read.return_value = b"<html>Test</html>"
-
-    mock_opener = MagicMock()
-    mock_opener.open.return_value.__enter__.return_value = mock_response
-    mock_get_opener.return_value = mock_opener
+    mock_pool.get.return_value = fetch.Response(
+        200, {}, b"<html>Test</html>", "http://test.com"
+    )
 
     html = scrape._get_html("http://test.com")
 
@@ -67,13 +62,11 @@ def test_get_html_success(mock_sleep, mock_get_opener):
 
 
 @pytest.mark.integration
-@patch("src.module_2_1.scrape.get_opener")
+@patch("src.module_2_1.fetch._HTTP_POOL")
 @patch("time.sleep")
-def test_get_html_failure(mock_sleep, mock_get_opener):
+def test_get_html_failure(mock_sleep, mock_pool):
     """Test HTML fetching handles errors"""
-    mock_opener = Mock()
-    mock_opener.open.side_effect = Exception("Network error")
-    mock_get_opener.return_value = mock_opener
+    mock_pool.get.side_effect = Exception("Network error")
 
     html = scrape._get_html("http://test.com")
 
@@ -103,7 +96,7 @@ def test_parse_row_valid():
     soup = BeautifulSoup(html, "html.parser")
     tr = soup.find("tr")
 
-    result = scrape._parse_row(tr, "https://www.thegradcafe.com/survey/")
+    result = parsers._parse_row(tr, "https://www.thegradcafe.com/survey/")
 
     assert result is not None
     assert result["university"] == "Stanford University"
@@ -120,7 +113,7 @@ def test_parse_row_no_link():
     soup = BeautifulSoup(html, "html.parser")
     tr = soup.find("tr")
 
-    result = scrape._parse_row(tr, "https://test.com")
+    result = parsers._parse_row(tr, "https://test.com")
 
     assert result is None
 
@@ -137,7 +130,7 @@ def test_parse_row_insufficient_columns():
     soup = BeautifulSoup(html, "html.parser")
     tr = soup.find("tr")
 
-    result = scrape._parse_row(tr, "https://test.com")
+    result = parsers._parse_row(tr, "https://test.com")
 
     assert result is None
 
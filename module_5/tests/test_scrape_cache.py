@@ -0,0 +1,266 @@
+"""
+Tests for the scraper's SQLite page cache and --offline mode
+"""
+
+import sqlite3
+import time
+import zlib
+from unittest.mock import patch
+
+import pytest
+
+from src.module_2_1 import fetch, scrape
+
+DETAIL_HTML = "<html><dd>GPA: 3.90</dd><dd>Fall 2026</dd></html>"
+URL = "https://www.thegradcafe.com/result/12345"
+LISTING_HTML = (
+    '<table><tr><td><a href="/result/12345">x</a></td><td>CS</td>'
+    "<td>1 Jan</td><td>Accepted</td></tr></table>"
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(tmp_path, clock):
+    page_cache = scrape.PageCache(
+        str(tmp_path / "cache" / "pages.db"),
+        revalidate_after=100,
+        max_age=1000,
+        max_entries=10,
+        clock=clock,
+    )
+    yield page_cache
+    page_cache.close()
+
+
+@pytest.mark.integration
+def test_result_id_extraction():
+    assert scrape._result_id(URL) == 12345
+    assert scrape._result_id("https://www.thegradcafe.com/survey/") is None
+    assert scrape._result_id(None) is None
+
+
+@pytest.mark.integration
+def test_first_fetch_is_stored_then_served_from_cache(cache):
+    response = fetch.Response(200, {"ETag": '"v1"'}, DETAIL_HTML.encode(), URL)
+
+    with patch.object(scrape, "_fetch", return_value=response) as fake_fetch:
+        first = scrape._cached_detail(URL, cache)
+        second = scrape._cached_detail(URL, cache)
+
+    assert fake_fetch.call_count == 1
+    assert first == second
+    assert first["gpa"] == 3.9 and first["term"] == "Fall 2026"
+    assert cache.get(12345)["etag"] == '"v1"'
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+@pytest.mark.integration
+def test_stale_entry_revalidated_with_conditional_get(cache, clock):
+    cache.put(12345, URL, DETAIL_HTML, {"gpa": 3.9}, {"ETag": '"v1"', "Last-Modified": "Mon"})
+    clock.now += 200
+    not_modified = fetch.Response(304, {}, b"", URL)
+
+    with patch.object(scrape, "_fetch", return_value=not_modified) as fake_fetch:
+        result = scrape._cached_detail(URL, cache)
+
+    assert result == {"gpa": 3.9}
+    assert fake_fetch.call_args.kwargs["headers"] == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Mon",
+    }
+    assert cache.is_fresh(cache.get(12345))
+    assert cache.revalidated == 1
+
+
+@pytest.mark.integration
+def test_validators_read_from_lowercase_headers(cache):
+    headers = {"etag": '"v2"', "last-modified": "Tue"}
+
+    cache.put(12345, URL, DETAIL_HTML, {"gpa": 3.9}, headers)
+    cache.put_listing("listing", LISTING_HTML, [], headers)
+
+    assert cache.get(12345)["etag"] == '"v2"'
+    assert cache.get(12345)["last_modified"] == "Tue"
+    assert cache.get_listing_entry("listing")["etag"] == '"v2"'
+    assert cache.get_listing_entry("listing")["last_modified"] == "Tue"
+
+
+@pytest.mark.integration
+def test_network_failure_falls_back_to_stale_entry(cache, clock):
+    cache.put(12345, URL, DETAIL_HTML, {"gpa": 3.9})
+    clock.now += 200
+
+    with patch.object(scrape, "_fetch", return_value=None):
+        assert scrape._cached_detail(URL, cache) == {"gpa": 3.9}
+        assert scrape._cached_detail(URL + "9", cache) == scrape._empty_detail()
+
+
+@pytest.mark.integration
+def test_offline_mode_reparses_cached_html_without_network(cache):
+    cache.put(12345, URL, DETAIL_HTML, {"gpa": None})
+    cache.offline = True
+
+    with patch.object(scrape, "_fetch") as fake_fetch:
+        result = scrape._cached_detail(URL, cache)
+        missing = scrape._cached_detail(URL + "0", cache)
+
+    fake_fetch.assert_not_called()
+    assert result["gpa"] == 3.9
+    assert missing == scrape._empty_detail()
+
+
+@pytest.mark.integration
+def test_eviction_by_age_and_size(tmp_path, clock):
+    path = str(tmp_path / "pages.db")
+    cache = scrape.PageCache(path, max_age=1000, max_entries=2, clock=clock)
+    cache.put(1, URL, "", {})
+    clock.now += 2000
+    for result_id in (2, 3, 4):
+        clock.now += 1
+        cache.put(result_id, URL, "", {})
+    cache.put_listing("old-listing", "<table></table>")
+    cache.close()
+
+    reopened = scrape.PageCache(path, max_age=1000, max_entries=2, clock=clock)
+
+    assert len(reopened) == 2
+    assert reopened.get(1) is None and reopened.get(2) is None
+    assert reopened.get(4) is not None
+    assert reopened.get_listing("old-listing") == "<table></table>"
+    reopened.close()
+
+
+@pytest.mark.integration
+def test_listing_pages_recorded_online_and_replayed_offline(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        scrape,
+        "_fetch",
+        lambda url, headers=None: fetch.Response(200, {}, LISTING_HTML.encode(), url),
+    )
+    cache = scrape.configure_page_cache(str(tmp_path / "pages.db"))
+    try:
+        online = scrape._fetch_listing_page(1)
+        cache.offline = True
+        monkeypatch.setattr(scrape, "_get_html", lambda url, **_: pytest.fail("network used"))
+        assert scrape._get_listing_html(scrape._listing_url(1)) == LISTING_HTML
+        assert scrape._fetch_listing_page(1) == online
+        assert scrape._get_listing_html("page-2") == ""
+    finally:
+        scrape.configure_page_cache(None)
+
+    assert scrape._PAGE_CACHE is None
+
+
+@pytest.mark.integration
+def test_detail_fetch_goes_through_cache_when_configured(tmp_path, monkeypatch, capsys):
+    scrape.configure_page_cache(str(tmp_path / "pages.db"))
+    monkeypatch.setattr(
+        scrape,
+        "_fetch",
+        lambda url, headers=None: fetch.Response(200, {}, DETAIL_HTML.encode(), url),
+    )
+    try:
+        records = scrape.fetch_detail_batch([URL, URL], max_workers=1)
+    finally:
+        scrape.configure_page_cache(None)
+
+    assert [r["gpa"] for r in records] == [3.9, 3.9]
+    assert "Page cache: 1 hits, 1 fetched" in capsys.readouterr().out
+
+
+@pytest.mark.web
+def test_cli_offline_flag_enables_offline_cache(tmp_path, monkeypatch):
+    seen = []
+    monkeypatch.setattr(scrape, "main", lambda **_: seen.append(scrape._PAGE_CACHE.offline))
+
+    scrape.cli_main(["--cache", str(tmp_path / "pages.db"), "--offline"])
+
+    assert seen == [True]
+    assert scrape._PAGE_CACHE is None
+
+
+@pytest.mark.integration
+def test_unchanged_listing_page_reuses_cached_rows(cache, clock):
+    page_url = scrape._listing_url(3)
+    first = fetch.Response(
+        200,
+        {"ETag": '"p3"', "Last-Modified": "Mon, 01 Jan 2026 00:00:00 GMT"},
+        LISTING_HTML.encode(),
+        page_url,
+    )
+    not_modified = fetch.Response(304, {}, b"", page_url)
+
+    with patch.object(scrape, "_fetch", return_value=first):
+        rows = scrape._cached_listing(page_url, cache)
+    clock.now += 50
+    with patch.object(scrape, "_fetch", return_value=not_modified) as fake_fetch, patch.object(
+        scrape, "_parse_listing_html", side_effect=AssertionError("re-parsed")
+    ):
+        again = scrape._cached_listing(page_url, cache)
+
+    assert rows[0]["entry_url"] == URL
+    assert again == rows and again[0] is not rows[0]
+    assert fake_fetch.call_args.kwargs["headers"] == {
+        "If-None-Match": '"p3"',
+        "If-Modified-Since": "Mon, 01 Jan 2026 00:00:00 GMT",
+    }
+    assert cache.listings_not_modified == 1
+    assert cache.get_listing_entry(page_url)["parsed"] == rows
+
+
+@pytest.mark.integration
+def test_listing_revalidation_edge_cases(cache):
+    page_url = scrape._listing_url(9)
+    cache.put_listing(page_url, "<p>end</p>")  # stored without rows: no validators
+
+    with patch.object(scrape, "_fetch") as fake_fetch:
+        fake_fetch.return_value = fetch.Response(200, {"ETag": '"e"'}, b"<p>end</p>", page_url)
+        assert scrape._cached_listing(page_url, cache) is None
+        assert fake_fetch.call_args.kwargs["headers"] == {}
+        fake_fetch.return_value = fetch.Response(304, {}, b"", page_url)
+        assert scrape._cached_listing(page_url, cache) is None
+        fake_fetch.return_value = fetch.Response(404, {}, b"", page_url)
+        assert scrape._cached_listing(page_url, cache) is None
+        fake_fetch.return_value = fetch.Response(429, {}, b"", page_url)
+        with pytest.raises(scrape.FetchError, match="429"):
+            scrape._cached_listing(page_url, cache)
+        fake_fetch.return_value = None
+        with pytest.raises(scrape.FetchError, match="network error"):
+            scrape._cached_listing(page_url, cache)
+
+    assert cache.get_listing_entry("unknown") is None
+
+
+@pytest.mark.integration
+def test_cache_from_before_listing_validators_is_migrated(tmp_path):
+    path = tmp_path / "old.db"
+    with sqlite3.connect(path) as db:
+        db.execute(
+            "CREATE TABLE listing_pages (url TEXT PRIMARY KEY, html BLOB, fetched_at REAL NOT NULL)"
+        )
+        db.execute(
+            "INSERT INTO listing_pages VALUES (?, ?, ?)",
+            ("old", zlib.compress(b"<table></table>"), time.time()),
+        )
+    db.close()
+
+    cache = scrape.PageCache(str(path))
+    cache.put_listing("new", "<table></table>", [], {"ETag": '"n"'})
+
+    assert cache.get_listing("old") == "<table></table>"
+    assert cache.get_listing_entry("old") == {"parsed": None, "etag": None, "last_modified": None}
+    assert cache.get_listing_entry("new")["etag"] == '"n"'
+    cache.close()
@@ -0,0 +1,172 @@
+"""
+Tests for the crawl checkpoint log and --resume
+"""
+
+import json
+
+import pytest
+
+from src.module_2_1 import scrape
+
+
+def listing_page(*result_ids):
+    """Listing HTML with one parseable row per result ID."""
+    rows = "".join(
+        f"""
+        <tr>
+            <td><a href="/result/{rid}">Link</a><div class="tw-font-medium">MIT</div></td>
+            <td><div><span>CS</span><span>PhD</span></div></td>
+            <td>15 Jan</td>
+            <td>Accepted on 15 Jan</td>
+        </tr>"""
+        for rid in result_ids
+    )
+    return f"<table>{rows}</table>"
+
+
+def url(rid):
+    return f"https://www.thegradcafe.com/result/{rid}"
+
+
+@pytest.fixture
+def crawl(monkeypatch):
+    """Serve six entries over three listing pages; record detail fetches."""
+    pages = {1: listing_page(6, 5), 2: listing_page(4, 3), 3: listing_page(2, 1)}
+    fetched = []
+
+    def fake_detail(entry_url):
+        fetched.append(entry_url)
+        return {"gpa": 3.5}
+
+    monkeypatch.setattr(
+        scrape, "_get_listing_html", lambda u: pages.get(int(u.rsplit("=", 1)[1]), "")
+    )
+    monkeypatch.setattr(scrape, "_parse_detail_page_html", fake_detail)
+    yield fetched
+    scrape.configure_checkpoint(None)
+
+
+@pytest.mark.integration
+def test_log_round_trip_and_resume_page(tmp_path):
+    path = str(tmp_path / "progress" / "log.jsonl")
+    log = scrape.CheckpointLog(path)
+    log.page_done(1, [url(6), url(5)])
+    log.entry_done({"entry_url": url(6), "gpa": 3.1})
+    log.entry_done({"entry_url": url(5), "gpa": 3.2})
+    log.page_done(2, [url(4)])
+    log.close()
+    log.close()
+
+    resumed = scrape.CheckpointLog(path, resume=True)
+
+    assert resumed.pages == {1: [url(6), url(5)], 2: [url(4)]}
+    assert resumed.entries[url(5)]["gpa"] == 3.2
+    assert resumed.resume_page() == 2
+    resumed.close()
+
+
+@pytest.mark.integration
+def test_torn_last_line_is_dropped_atomically(tmp_path):
+    path = tmp_path / "log.jsonl"
+    good = json.dumps({"entry": {"entry_url": url(1)}})
+    path.write_text(good + "\n" + '{"entry": {"entry_u')
+
+    log = scrape.CheckpointLog(str(path), resume=True)
+    log.entry_done({"entry_url": url(2)})
+    log.close()
+
+    lines = path.read_text().splitlines()
+    assert lines[0] == good
+    assert [json.loads(line)["entry"]["entry_url"] for line in lines] == [url(1), url(2)]
+    assert not (tmp_path / "log.jsonl.tmp").exists()
+
+
+@pytest.mark.integration
+def test_fresh_log_replaces_old_one_and_fsyncs_periodically(tmp_path, monkeypatch):
+    path = tmp_path / "log.jsonl"
+    path.write_text(json.dumps({"page": 1, "urls": []}) + "\n")
+    synced = []
+    real_fsync = scrape.os.fsync
+    monkeypatch.setattr(scrape.os, "fsync", lambda fd: synced.append(fd) or real_fsync(fd))
+
+    log = scrape.CheckpointLog(str(path), fsync_every=2)
+    synced.clear()
+    for page in range(5):
+        log.page_done(page, [])
+
+    assert len(synced) == 2
+    log.close()
+    assert len(path.read_text().splitlines()) == 5
+
+
+@pytest.mark.integration
+def test_resume_continues_without_refetching_finished_work(tmp_path, crawl):
+    fetched = crawl
+    path = str(tmp_path / "log.jsonl")
+
+    scrape.configure_checkpoint(path)
+    scrape.scrape_data(max_entries=100, parallel_threads=1, end_page=2)
+    first_run = list(fetched)
+    fetched.clear()
+
+    scrape.configure_checkpoint(path, resume=True)
+    entries = scrape.scrape_data(max_entries=100, parallel_threads=1)
+
+    assert sorted(first_run) == sorted(url(rid) for rid in (6, 5, 4, 3))
+    assert fetched == [url(2), url(1)]
+    assert [e["entry_url"] for e in entries] == [url(rid) for rid in (6, 5, 4, 3, 2, 1)]
+    assert all(e["gpa"] == 3.5 for e in entries)
+
+
+@pytest.mark.integration
+def test_resume_refetches_rows_whose_detail_was_lost(tmp_path, crawl):
+    fetched = crawl
+    path = str(tmp_path / "log.jsonl")
+    log = scrape.CheckpointLog(path)
+    log.page_done(1, [url(6), url(5)])
+    log.entry_done({"entry_url": url(6), "gpa": 3.0})
+    log.close()
+
+    scrape.configure_checkpoint(path, resume=True)
+    entries = scrape.scrape_data(max_entries=3, parallel_threads=1)
+
+    assert fetched == [url(5), url(4)]
+    assert [e["entry_url"] for e in entries] == [url(6), url(5), url(4)]
+    assert scrape._CHECKPOINT.resume_page() == 2
+
+
+@pytest.mark.integration
+def test_failed_detail_fetch_is_not_checkpointed(tmp_path, crawl, monkeypatch):
+    def failing(entry_url):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(scrape, "_parse_detail_page_html", failing)
+    log = scrape.configure_checkpoint(str(tmp_path / "log.jsonl"))
+
+    scrape.scrape_data(max_entries=2, parallel_threads=1)
+
+    assert log.entries == {}
+    assert log.pages == {1: [url(6), url(5)]}
+
+
+@pytest.mark.integration
+def test_output_file_written_atomically(tmp_path):
+    out = tmp_path / "raw.json"
+
+    scrape._write_entries([{"entry_url": "u"}], str(out))
+
+    assert json.loads(out.read_text()) == [{"entry_url": "u"}]
+    assert not (tmp_path / "raw.json.tmp").exists()
+
+
+@pytest.mark.web
+def test_cli_resume_uses_default_checkpoint(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    seen = []
+    monkeypatch.setattr(scrape, "main", lambda **_: seen.append(scrape._CHECKPOINT.path))
+
+    scrape.cli_main(["--resume"])
+
+    assert seen == [scrape.CHECKPOINT_FILE]
+    assert (tmp_path / scrape.CHECKPOINT_FILE).exists()
+    assert scrape._CHECKPOINT is None
@@ -9,8 +9,8 @@ def test_cli_main_success(monkeypatch):
     """cli_main prints elapsed time on success."""
     from src.module_2_1 import scrape
 
-    monkeypatch.setattr(scrape, "main", lambda: None)
-    scrape.cli_main()  # should print timing without error
+    monkeypatch.setattr(scrape, "main", lambda **_: None)
+    scrape.cli_main([])  # should print timing without error
 
 
 @pytest.mark.web
@@ -18,11 +18,11 @@ def test_cli_main_keyboard_interrupt(monkeypatch, capsys):
     """cli_main handles KeyboardInterrupt gracefully."""
     from src.module_2_1 import scrape
 
-    def raise_interrupt():
+    def raise_interrupt(**_):
         raise KeyboardInterrupt()
 
     monkeypatch.setattr(scrape, "main", raise_interrupt)
-    scrape.cli_main()
+    scrape.cli_main([])
 
     output = capsys.readouterr().out
     assert "Interrupted by user" in output
@@ -33,11 +33,11 @@ def test_cli_main_exception(monkeypatch, capsys):
     """cli_main handles unexpected exceptions and prints traceback."""
     from src.module_2_1 import scrape
 
-    def raise_error():
+    def raise_error(**_):
         raise RuntimeError("test failure")
 
     monkeypatch.setattr(scrape, "main", raise_error)
-    scrape.cli_main()
+    scrape.cli_main([])
 
     output = capsys.readouterr().out
     assert "Error: test failure" in output
@@ -28,29 +28,26 @@ class TestScrapeDetailedCoverage:
     # Lines 47-53: check_robots paths
     # ==========================================================================
 
-    @patch("urllib.robotparser.RobotFileParser")
-    def test_check_robots_returns_true_when_allowed(self, mock_parser_class):
+    @patch("src.module_2_1.fetch._fetch")
+    def test_check_robots_returns_true_when_allowed(self, mock_fetch):
         """Test check_robots returns True when allowed"""
+        from src.module_2_1.fetch import Response
         from src.module_2_1.scrape import check_robots
 
-        mock_parser = Mock()
-        mock_parser.can_fetch.return_value = True
-        mock_parser_class.return_value = mock_parser
+        mock_fetch.return_value = Response(200, {}, b"User-agent: *\nAllow: /", "u")
 
         result = check_robots()
         assert result is True
 
-    @patch("urllib.robotparser.RobotFileParser")
-    def test_check_robots_with_exception_returns_true(self, mock_parser_class):
-        """Test check_robots returns True on exception (fail-safe)"""
+    @patch("src.module_2_1.fetch._fetch")
+    def test_check_robots_unreachable_returns_false(self, mock_fetch):
+        """Test check_robots refuses when robots.txt cannot be fetched"""
         from src.module_2_1.scrape import check_robots
 
-        mock_parser = Mock()
-        mock_parser.read.side_effect = Exception("Read error")
-        mock_parser_class.return_value = mock_parser
+        mock_fetch.return_value = None
 
         result = check_robots()
-        assert result is True  # Should default to True on error
+        assert result is False  # No policy and no cached copy: fail closed
 
     # ==========================================================================
     # Lines 68-74, 78-84: get_html error handling
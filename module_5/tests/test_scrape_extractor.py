@@ -0,0 +1,73 @@
+"""
+Parity tests for DetailExtractor against the per-field regex loop it replaced
+"""
+
+import random
+from pathlib import Path
+
+import pytest
+
+from benchmarks.bench_detail_extractor import legacy_extract
+from src.module_2_1 import parsers
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+DETAIL_FIXTURES = ["detail_page_full.html", "sample_detail.html", "detail_page_sample.html"]
+
+TOKENS = [
+    "GPA", "GPA:", "gpa ", "3.85", "4.9", "0", "Term:", "Season ", "Semester:",
+    "Fall", "spring", "Winter", "2026", "1999", "GRE", "V:", "Verbal ", "Q",
+    "Quant:", "AW", "Writing:", "160", "171", "129", "4.5", "7.0", "International",
+    "internationally", "Domestic", "American", "U.S.", "US", "USA", "status", "x",
+    " ", ": ", "\n", ".",
+]
+
+
+def fuzz_blocks(rng):
+    """A page's worth of random text blocks built from field-like tokens."""
+    return [
+        "".join(rng.choice(TOKENS) for _ in range(rng.randint(0, 12)))
+        for _ in range(rng.randint(1, 6))
+    ]
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("name", DETAIL_FIXTURES)
+def test_fixture_pages_match_legacy_extraction(name):
+    blocks = parsers._detail_blocks((REPO_ROOT / name).read_text(encoding="utf-8"))
+
+    assert parsers.DetailExtractor().extract(blocks) == legacy_extract(blocks)
+
+
+@pytest.mark.integration
+def test_fuzzed_blocks_match_legacy_extraction():
+    rng = random.Random(2026)
+    extractor = parsers.DetailExtractor()
+
+    for _ in range(3000):
+        blocks = fuzz_blocks(rng)
+        assert extractor.extract(blocks) == legacy_extract(blocks), blocks
+
+
+@pytest.mark.integration
+def test_labelled_term_beats_earlier_bare_term_and_first_match_decides():
+    blocks = [
+        "Fall 2025 then Term: Spring 2026",
+        "GRE V: 175 Verbal: 160",
+        "V: 155 Q: 165 AW: 4.5 GPA: 3.9 International",
+    ]
+
+    result = parsers.DetailExtractor().extract(blocks)
+
+    assert result["term"] == "Spring 2026"
+    assert (result["gre_v"], result["gre_q"], result["gre_total"]) == (155, 165, 320)
+    assert (result["gpa"], result["gre_aw"], result["citizenship"]) == (3.9, 4.5, "International")
+
+
+@pytest.mark.integration
+def test_scan_stops_once_every_field_is_found():
+    complete = "GPA: 3.5 American Fall 2026 V: 150 Q: 151 AW: 4.0 Term: Fall 2026"
+
+    result = parsers.DetailExtractor().extract([complete, "Term: Spring 2030"])
+
+    assert result["term"] == "Fall 2026"
+    assert result["gre_total"] == 301
@@ -0,0 +1,332 @@
+"""
+Tests for the scraper fetch layer: TokenBucket, KeepAlivePool and the
+adaptive limiter's retry policy
+"""
+
+import gzip
+import http.client
+import threading
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.module_2_1 import fetch, scrape
+
+
+class FakeResponse:
+    """Minimal http.client.HTTPResponse stand-in."""
+
+    def __init__(self, status=200, body=b"ok", headers=None, will_close=False):
+        self.status = status
+        self.will_close = will_close
+        self._body = body
+        self._headers = headers or {}
+
+    def read(self):
+        return self._body
+
+    def getheader(self, name, default=None):
+        return self._headers.get(name, default)
+
+    def getheaders(self):
+        return list(self._headers.items())
+
+
+class FakeConnection:
+    """Connection that replays queued responses and records requests."""
+
+    created = []
+    responses = []
+
+    def __init__(self, host, timeout=None):
+        self.host = host
+        self.requests = []
+        self.closed = False
+        FakeConnection.created.append(self)
+
+    def request(self, method, path, headers=None):
+        self.requests.append((method, path, headers))
+
+    def getresponse(self):
+        outcome = FakeConnection.responses.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def fake_http(monkeypatch):
+    FakeConnection.created = []
+    FakeConnection.responses = []
+    monkeypatch.setattr(http.client, "HTTPSConnection", FakeConnection)
+    monkeypatch.setattr(http.client, "HTTPConnection", FakeConnection)
+    return FakeConnection
+
+
+@pytest.mark.integration
+def test_token_bucket_allows_burst_then_paces():
+    now = [0.0]
+    slept = []
+    bucket = fetch.TokenBucket(2, clock=lambda: now[0], sleep=slept.append)
+
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() == 0.0
+    assert bucket.acquire() == 0.5
+    assert bucket.acquire() == 1.0
+    now[0] = 10.0
+    assert bucket.acquire() == 0.0
+
+    assert slept == [0.5, 1.0]
+
+
+@pytest.mark.integration
+def test_pool_reuses_connection_per_host(fake_http):
+    fake_http.responses = [FakeResponse(body=b"one"), FakeResponse(body=b"two")]
+    pool = fetch.KeepAlivePool(max_connections=2)
+
+    first = pool.get("https://www.thegradcafe.com/survey/?page=1")
+    second = pool.get("https://www.thegradcafe.com/result/5")
+
+    assert (first.body, second.body) == (b"one", b"two")
+    assert len(fake_http.created) == 1
+    conn = fake_http.created[0]
+    assert [r[1] for r in conn.requests] == ["/survey/?page=1", "/result/5"]
+    assert conn.requests[0][2]["User-Agent"] == fetch.USER_AGENT
+
+
+@pytest.mark.integration
+def test_pool_retries_stale_keep_alive_connection(fake_http):
+    fake_http.responses = [
+        FakeResponse(body=b"warm"),
+        http.client.RemoteDisconnected("idle timeout"),
+        FakeResponse(body=b"fresh"),
+    ]
+    pool = fetch.KeepAlivePool()
+
+    pool.get("http://example.com/a")
+    result = pool.get("http://example.com/b")
+
+    assert result.body == b"fresh"
+    assert len(fake_http.created) == 2
+    assert fake_http.created[0].closed
+
+
+@pytest.mark.integration
+def test_pool_raises_when_fresh_connection_fails(fake_http):
+    fake_http.responses = [ConnectionRefusedError("down")]
+    pool = fetch.KeepAlivePool()
+
+    with pytest.raises(ConnectionRefusedError):
+        pool.get("http://example.com/")
+
+
+@pytest.mark.integration
+def test_pool_follows_redirects_and_decodes_gzip(fake_http):
+    fake_http.responses = [
+        FakeResponse(status=301, headers={"Location": "/new"}),
+        FakeResponse(
+            body=gzip.compress(b"<html>moved</html>"),
+            headers={"Content-Encoding": "gzip"},
+        ),
+    ]
+    pool = fetch.KeepAlivePool()
+
+    result = pool.get("http://example.com/old")
+
+    assert result.url == "http://example.com/new"
+    assert result.body == b"<html>moved</html>"
+
+
+@pytest.mark.integration
+def test_pool_drops_connection_server_closes(fake_http):
+    fake_http.responses = [
+        FakeResponse(will_close=True),
+        FakeResponse(),
+    ]
+    pool = fetch.KeepAlivePool()
+
+    pool.get("http://example.com/a")
+    pool.get("http://example.com/b")
+    pool.close()
+
+    assert len(fake_http.created) == 2
+    assert all(conn.closed for conn in fake_http.created)
+
+
+@pytest.mark.integration
+def test_get_html_paces_and_rejects_non_200():
+    with patch.object(fetch, "_RATE_LIMITER") as limiter, patch.object(
+        fetch, "_HTTP_POOL"
+    ) as pool, patch("time.sleep") as sleep:
+        pool.get.return_value = fetch.Response(404, {}, b"missing", "u")
+
+        assert fetch._get_html("http://example.com/x", delay=0.2) == ""
+
+    limiter.acquire.assert_called_once()
+    sleep.assert_called_once_with(0.2)
+
+
+class FakeClock:
+    """Clock whose sleep advances time instead of blocking."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+def make_limiter(clock=None, **options):
+    clock = clock or FakeClock()
+    bucket = MagicMock()
+    bucket.acquire.return_value = 0.0
+    return fetch.AdaptiveLimiter(
+        bucket, clock=clock, sleep=clock.sleep, rand=lambda: 1.0, **options
+    )
+
+
+@pytest.mark.integration
+def test_limiter_grows_additively_and_halves_on_throttling():
+    clock = FakeClock()
+    limiter = make_limiter(clock, max_concurrency=4, initial=2)
+
+    for _ in range(4):
+        limiter.acquire("h")
+        limiter.release("h", 200)
+    grown = limiter.windows()["h"]
+    limiter.acquire("h")
+    limiter.release("h", 429)
+    limiter.acquire("h")
+    limiter.release("h", None)  # same burst: no second decrease
+    clock.now += 1.0
+    limiter.acquire("h")
+    limiter.release("h", 503)
+    limiter.acquire("h")
+    limiter.release("h", 404)
+
+    assert 3.0 < grown <= 4.0
+    assert limiter.windows()["h"] == pytest.approx(max(1.0, grown / 4) + 1 / max(1.0, grown / 4))
+    assert limiter.status_counts == {200: 4, 429: 1, "error": 1, 503: 1, 404: 1}
+    for _ in range(100):
+        limiter.acquire("h")
+        limiter.release("h", 200)
+    assert limiter.windows()["h"] == 4
+
+
+@pytest.mark.integration
+def test_limiter_window_blocks_extra_requests_per_host():
+    limiter = make_limiter(initial=1)
+    limiter.acquire("a")
+    limiter.acquire("b")  # other hosts have their own window
+    entered = threading.Event()
+
+    def second():
+        limiter.acquire("a")
+        entered.set()
+
+    thread = threading.Thread(target=second)
+    thread.start()
+    assert not entered.wait(0.1)
+    limiter.release("a", 200)
+    thread.join(5)
+
+    assert entered.is_set()
+
+
+@pytest.mark.integration
+def test_limiter_retry_after_pauses_host_and_backoff_is_capped():
+    clock = FakeClock()
+    limiter = make_limiter(clock)
+
+    assert limiter.backoff("h", 0, retry_after=5) == fetch.BACKOFF_BASE
+    assert limiter.backoff("h", 20) == fetch.BACKOFF_CAP
+    limiter.acquire("h")
+    limiter.acquire("other")
+
+    assert clock.slept == [5]
+    assert limiter.retries == 2
+
+
+@pytest.mark.integration
+def test_retry_after_parsing():
+    later = datetime.now(timezone.utc) + timedelta(seconds=120)
+
+    def resp(value):
+        return fetch.Response(429, {"retry-after": value}, b"", "u")
+
+    assert fetch._retry_after(None) is None
+    assert fetch._retry_after(fetch.Response(429, {}, b"", "u")) is None
+    assert fetch._retry_after(resp(" 7 ")) == 7.0
+    assert 100 < fetch._retry_after(resp(format_datetime(later))) <= 120
+    assert fetch._retry_after(resp("Mon, 01 Jan 2001 00:00:00 GMT")) == 0.0
+    assert fetch._retry_after(resp("soon")) is None
+
+
+@pytest.mark.integration
+def test_fetch_retries_throttling_and_network_errors():
+    limiter = make_limiter()
+    ok = fetch.Response(200, {}, b"ok", "u")
+    throttled = fetch.Response(429, {"Retry-After": "3"}, b"", "u")
+    with patch.object(fetch, "_RATE_LIMITER", limiter), patch.object(
+        fetch, "_HTTP_POOL"
+    ) as pool, patch("time.sleep") as sleep:
+        pool.get.side_effect = [throttled, OSError("reset"), ok]
+
+        assert fetch._fetch("https://example.com/x") is ok
+
+    assert [c.args[0] for c in sleep.call_args_list] == [0.5, 1.0]
+    assert limiter.status_counts == {429: 1, "error": 1, 200: 1}
+    assert limiter.retries == 2
+
+
+@pytest.mark.integration
+def test_fetch_gives_up_and_strict_get_html_raises(capsys):
+    limiter = make_limiter()
+    unavailable = fetch.Response(503, {}, b"", "u")
+    with patch.object(fetch, "_RATE_LIMITER", limiter), patch.object(
+        fetch, "_HTTP_POOL"
+    ) as pool, patch("time.sleep"):
+        pool.get.return_value = unavailable
+        assert fetch._fetch("https://example.com/x") is unavailable
+        assert fetch._get_html("https://example.com/x") == ""
+        with pytest.raises(fetch.FetchError, match="503"):
+            fetch._get_html("https://example.com/x", strict=True)
+        pool.get.side_effect = OSError("down")
+        with pytest.raises(fetch.FetchError, match="network error"):
+            scrape._get_listing_html("https://example.com/survey/?page=1")
+        fetch._print_fetch_stats()
+
+    assert pool.get.call_count == 4 * (fetch.MAX_RETRIES + 1)
+    assert capsys.readouterr().out == (
+        f"  Fetch: 503: {3 * (fetch.MAX_RETRIES + 1)}, error: {fetch.MAX_RETRIES + 1}; "
+        f"{4 * fetch.MAX_RETRIES} retries; concurrency example.com 1.0\n"
+    )
+
+
+@pytest.mark.integration
+def test_throttled_listing_page_is_an_error_not_the_end(monkeypatch, capsys):
+    def throttled(url):
+        raise fetch.FetchError(f"{url} failed after 4 retries (429)")
+
+    monkeypatch.setattr(scrape, "_get_listing_html", throttled)
+
+    assert list(scrape.iter_listing_entries(10)) == []
+    assert "Error on page 1" in capsys.readouterr().out
+
+
+@pytest.mark.integration
+def test_fetch_stats_silent_before_any_request(capsys):
+    with patch.object(fetch, "_RATE_LIMITER", make_limiter()):
+        fetch._print_fetch_stats()
+
+    assert capsys.readouterr().out == ""
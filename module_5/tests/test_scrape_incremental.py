@@ -0,0 +1,268 @@
+"""
+Tests for the listing crawl: incremental mode, the listing/detail pipeline,
+concurrent listing pages and page-range sharding
+"""
+
+import json
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from src import load_data
+from src.module_2_1 import scrape
+
+
+def listing_page(*result_ids):
+    """Listing HTML with one parseable row per result ID."""
+    rows = "".join(
+        f"""
+        <tr>
+            <td><a href="/result/{rid}">Link</a><div class="tw-font-medium">MIT</div></td>
+            <td><div><span>CS</span><span>PhD</span></div></td>
+            <td>15 Jan</td>
+            <td>Accepted on 15 Jan</td>
+        </tr>"""
+        for rid in result_ids
+    )
+    return f"<table>{rows}</table>"
+
+
+@pytest.fixture
+def crawl(monkeypatch):
+    """Serve canned listing pages and record which detail URLs get fetched."""
+    pages = {}
+    fetched = []
+
+    def fake_listing(url):
+        page = int(url.rsplit("=", 1)[1])
+        return pages.get(page, "")
+
+    def fake_detail(entry_url):
+        fetched.append(entry_url)
+        return {}
+
+    monkeypatch.setattr(scrape, "_get_listing_html", fake_listing)
+    monkeypatch.setattr(scrape, "_parse_detail_page_html", fake_detail)
+    yield pages, fetched
+    scrape.configure_incremental(None)
+
+
+@pytest.mark.integration
+def test_known_ids_file_round_trip(tmp_path):
+    path = tmp_path / "ids.txt"
+    assert scrape.load_known_ids(str(path)) == set()
+
+    path.write_text("3\n1\n\nnot-an-id\n")
+
+    assert scrape.load_known_ids(str(path)) == {1, 3}
+    assert scrape.configure_incremental(str(path)) == {1, 3}
+    assert scrape.configure_incremental(None) is None
+
+
+@pytest.mark.integration
+def test_incremental_skips_known_and_stops_at_known_page(tmp_path, crawl):
+    pages, fetched = crawl
+    pages.update({1: listing_page(10, 9, 8), 2: listing_page(7, 6), 3: listing_page(5)})
+    ids = tmp_path / "ids.txt"
+    ids.write_text("8\n7\n6\n5\n")
+    scrape.configure_incremental(str(ids))
+
+    entries = scrape.scrape_data(max_entries=100, parallel_threads=1)
+
+    assert [scrape._result_id(e["entry_url"]) for e in entries] == [10, 9]
+    assert sorted(fetched) == sorted(e["entry_url"] for e in entries)
+
+
+@pytest.mark.integration
+def test_full_crawl_when_incremental_disabled(crawl):
+    pages, _ = crawl
+    pages.update({1: listing_page(2), 2: listing_page(1)})
+
+    entries = scrape.scrape_data(max_entries=100, parallel_threads=1)
+
+    assert len(entries) == 2
+
+
+@pytest.mark.web
+def test_cli_incremental_flag(tmp_path, monkeypatch, capsys):
+    ids = tmp_path / "ids.txt"
+    ids.write_text("1\n2\n")
+    seen = []
+    monkeypatch.setattr(scrape, "main", lambda **_: seen.append(scrape._KNOWN_IDS))
+
+    scrape.cli_main(["--incremental", str(ids)])
+
+    assert seen == [{1, 2}]
+    assert scrape._KNOWN_IDS is None
+    assert "2 known entries" in capsys.readouterr().out
+
+
+@pytest.mark.db
+def test_export_known_result_ids_from_table():
+    conn = MagicMock()
+    cur = conn.cursor.return_value.__enter__.return_value
+    cur.__iter__.return_value = iter(
+        [
+            ("https://www.thegradcafe.com/result/42",),
+            ("https://www.thegradcafe.com/result/7",),
+            ("https://example.com/no-id",),
+        ]
+    )
+
+    assert load_data.export_known_result_ids(conn) == 2
+    assert load_data.KNOWN_IDS_FILE.read_text() == "7\n42\n"
+
+
+@pytest.mark.integration
+def test_detail_fetches_overlap_listing_crawl_with_backpressure(crawl, monkeypatch):
+    pages, fetched = crawl
+    pages.update({1: listing_page(6, 5), 2: listing_page(4, 3), 3: listing_page(2, 1)})
+    events = []
+    fake_listing = scrape._get_listing_html
+
+    def tracing_listing(url):
+        events.append(("listing", url[-1]))
+        return fake_listing(url)
+
+    def tracing_detail(entry_url):
+        events.append(("detail", entry_url))
+        return {"gpa": 3.5}
+
+    monkeypatch.setattr(scrape, "_get_listing_html", tracing_listing)
+    monkeypatch.setattr(scrape, "_parse_detail_page_html", tracing_detail)
+    monkeypatch.setattr(scrape, "DETAIL_BACKLOG_PER_THREAD", 2)
+    monkeypatch.setattr(scrape, "LISTING_CONCURRENCY", 1)
+
+    entries = scrape.scrape_data(max_entries=100, parallel_threads=1)
+
+    first_detail = ("detail", entries[0]["entry_url"])
+    assert events.index(first_detail) < events.index(("listing", "2"))
+    assert [e["gpa"] for e in entries] == [3.5] * 6
+
+
+@pytest.mark.integration
+def test_listing_window_fetches_ahead_but_yields_in_order(crawl, monkeypatch):
+    pages, _ = crawl
+    pages.update({p: listing_page(100 - p) for p in range(1, 7)})
+    release = threading.Event()
+    started = []
+    lock = threading.Lock()
+    fake_listing = scrape._get_listing_html
+
+    def slow_first_page(url):
+        page = int(url.rsplit("=", 1)[1])
+        with lock:
+            started.append(page)
+        if page == 1:
+            # Page 1 only returns once later pages are already in flight.
+            assert release.wait(5)
+        elif len(started) >= 3:
+            release.set()
+        return fake_listing(url)
+
+    monkeypatch.setattr(scrape, "_get_listing_html", slow_first_page)
+    monkeypatch.setattr(scrape, "LISTING_CONCURRENCY", 3)
+
+    entries = list(scrape.iter_listing_entries(100))
+
+    assert [scrape._result_id(e["entry_url"]) for e in entries] == [99, 98, 97, 96, 95, 94]
+    assert set(started[:3]) == {1, 2, 3}
+
+
+@pytest.mark.integration
+def test_listing_crawl_stops_at_end_page_and_max_entries(crawl):
+    pages, _ = crawl
+    pages.update({p: listing_page(p * 10, p * 10 + 1) for p in range(1, 9)})
+
+    ranged = list(scrape.iter_listing_entries(100, start_page=3, end_page=4))
+    capped = list(scrape.iter_listing_entries(3))
+
+    assert [scrape._result_id(e["entry_url"]) for e in ranged] == [30, 31, 40, 41]
+    assert len(capped) == 3
+
+
+@pytest.mark.integration
+def test_listing_crawl_stops_on_page_error(crawl, monkeypatch, capsys):
+    pages, _ = crawl
+    pages.update({1: listing_page(2), 2: listing_page(1)})
+    fake_listing = scrape._get_listing_html
+
+    def failing(url):
+        if url.endswith("=2"):
+            raise OSError("reset")
+        return fake_listing(url)
+
+    monkeypatch.setattr(scrape, "_get_listing_html", failing)
+
+    entries = list(scrape.iter_listing_entries(100))
+
+    assert len(entries) == 1
+    assert "Error on page 2: reset" in capsys.readouterr().out
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("last", [0, 1, 2, 5, 37, 64])
+def test_find_last_page_probes_then_bisects(crawl, monkeypatch, last):
+    pages, _ = crawl
+    pages.update({p: listing_page(p) for p in range(1, last + 1)})
+    pages[last + 1] = "<table><tr><th>header only</th></tr></table>"
+    probes = []
+    fake_listing = scrape._get_listing_html
+    monkeypatch.setattr(
+        scrape, "_get_listing_html", lambda url: probes.append(url) or fake_listing(url)
+    )
+
+    assert scrape.find_last_page() == last
+    assert len(probes) <= 2 * max(last, 1).bit_length() + 2
+
+
+@pytest.mark.integration
+def test_plan_shards_covers_every_page_once():
+    assert scrape.plan_shards(10, 3) == [(1, 4), (5, 7), (8, 10)]
+    assert scrape.plan_shards(2, 5) == [(1, 1), (2, 2)]
+    assert scrape.plan_shards(7, 0) == [(1, 7)]
+
+
+@pytest.mark.integration
+def test_merge_shards_dedupes_in_order(tmp_path):
+    first, second = tmp_path / "a.json", tmp_path / "b.json"
+    first.write_text(json.dumps([{"entry_url": "u1"}, {"entry_url": "u2"}]))
+    second.write_text(json.dumps([{"entry_url": "u2", "dup": True}, {"entry_url": "u3"}]))
+    out = tmp_path / "merged" / "all.json"
+
+    assert scrape.merge_shards([str(first), str(second)], str(out)) == 3
+    assert json.loads(out.read_text()) == [
+        {"entry_url": "u1"},
+        {"entry_url": "u2"},
+        {"entry_url": "u3"},
+    ]
+
+
+@pytest.mark.web
+def test_cli_plan_and_merge(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(scrape, "find_last_page", lambda: 9)
+    scrape.cli_main(["--plan-shards", "2"])
+    out = capsys.readouterr().out
+    assert "Last listing page: 9" in out
+    assert "--start-page 6 --end-page 9 --output shard_6_9.json" in out
+
+    shard = tmp_path / "s.json"
+    shard.write_text(json.dumps([{"entry_url": "u"}]))
+    scrape.cli_main(["--merge", str(shard), "--output", str(tmp_path / "out.json")])
+    assert "Merged 1 unique entries" in capsys.readouterr().out
+
+
+@pytest.mark.web
+def test_cli_passes_page_range_to_main(monkeypatch):
+    seen = {}
+    monkeypatch.setattr(scrape, "main", lambda **kwargs: seen.update(kwargs))
+
+    scrape.cli_main(["--start-page", "5", "--end-page", "9", "--output", "x.json"])
+
+    assert seen == {
+        "start_page": 5,
+        "end_page": 9,
+        "output_file": "x.json",
+        "max_entries": 35000,
+    }
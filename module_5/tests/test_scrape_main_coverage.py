@@ -28,7 +28,7 @@ def test_scrape_main_success(monkeypatch, tmp_path):
     monkeypatch.setattr(
         scrape,
         "scrape_data",
-        lambda max_entries, start_page, parallel_threads: [
+        lambda max_entries, start_page, parallel_threads, end_page=None: [
             {"program_name": "CS", "university": "MIT"}
         ],
     )
@@ -0,0 +1,77 @@
+"""
+Tests for the process-pool parse stage
+"""
+
+import pytest
+
+from src.module_2_1 import fetch, parsers, scrape
+
+DETAIL_HTML = "<html><dd>GPA: 3.85</dd><li>GRE V: 160</li><li>Q: 165</li></html>"
+URL = "https://www.thegradcafe.com/result/{}"
+
+
+@pytest.fixture
+def parse_pool():
+    pool = scrape.configure_parse_pool(2)
+    yield pool
+    scrape.configure_parse_pool(None)
+
+
+@pytest.mark.integration
+def test_detail_pages_parsed_in_worker_processes(parse_pool, monkeypatch):
+    monkeypatch.setattr(scrape, "_get_html", lambda url: DETAIL_HTML)
+
+    records = scrape.fetch_detail_batch([URL.format(i) for i in range(6)], max_workers=3)
+
+    assert parsers._PARSE_POOL is parse_pool
+    assert [(r["gpa"], r["gre_total"]) for r in records] == [(3.85, 325)] * 6
+
+
+@pytest.mark.integration
+def test_cached_pages_parsed_in_worker_processes(parse_pool, tmp_path, monkeypatch):
+    cache = scrape.PageCache(str(tmp_path / "pages.db"))
+    monkeypatch.setattr(
+        scrape, "_fetch", lambda url, headers=None: fetch.Response(200, {}, DETAIL_HTML.encode(), url)
+    )
+
+    try:
+        online = scrape._cached_detail(URL.format(1), cache)
+        cache.offline = True
+        offline = scrape._cached_detail(URL.format(1), cache)
+    finally:
+        cache.close()
+
+    assert online == offline
+    assert online["gre_v"] == 160
+
+
+@pytest.mark.integration
+def test_worker_uses_parent_backend():
+    try:
+        assert parsers._parse_detail_worker(DETAIL_HTML, "soup")["gpa"] == 3.85
+        assert parsers.PARSER_BACKEND == "soup"
+    finally:
+        scrape.configure_parser("fast")
+
+
+@pytest.mark.integration
+def test_pool_disabled_by_default_and_after_reset(parse_pool):
+    assert scrape.configure_parse_pool(0) is None
+    assert parsers._PARSE_POOL is None
+    assert scrape._parse_detail_stage(DETAIL_HTML)["gre_q"] == 165
+
+
+@pytest.mark.web
+def test_cli_parse_processes_flag(monkeypatch):
+    seen = []
+    monkeypatch.setattr(scrape, "main", lambda **_: seen.append(parsers._PARSE_POOL))
+
+    scrape.cli_main(["--parse-processes", "1"])
+
+    assert seen[0] is not None
+    assert parsers._PARSE_POOL is None
+
+
+@pytest.mark.integration
+def test_pool_workers_are_not_forked_from_fetch_threads(parse_pool):
+    assert parse_pool._mp_context.get_start_method() in ("forkserver", "spawn")
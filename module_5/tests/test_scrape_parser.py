@@ -0,0 +1,136 @@
+"""
+Parity tests for the scraper's parser backends: the streaming "fast"
+parser must return exactly what the BeautifulSoup parser returns
+"""
+
+from pathlib import Path
+
+import pytest
+
+from src.module_2_1 import parsers, scrape
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+DETAIL_FIXTURES = ["detail_page_full.html", "sample_detail.html", "detail_page_sample.html"]
+BASE_URL = "https://www.thegradcafe.com/survey/?page=1"
+
+DETAIL_EDGE_CASES = [
+    "<dl><dt>GPA</dt><dd>GPA: 3.71</dd><dd>Fall 2026</dd><dd>International</dd></dl>",
+    "<ul><li>GRE V: 160</li><li>Q: 165<br>AW: 4.5</li></ul><p>Term: spring 2025</p>",
+    "<div>a<script>GPA: 3.9</script><style>x</style><template>Q: 150</template>b</div>",
+    "<div><p>Verbal: 155<p>Quant: 161</div></span>American &amp; US<div></div>",
+    "<div>GPA<!-- note -->: 3.2<img src=x><input/></div><dd>unclosed Winter 2024",
+    "",
+]
+
+LISTING_ROW = """
+<tr>
+  <td><a href="/result/{rid}">Link</a><div class="tw-font-medium">  Johns
+      Hopkins </div></td>
+  <td><div><span>Computer Science</span><span>PhD</span></div></td>
+  <td> 15 Jan </td>
+  <td>Wait listed on <b>15 Jan</b></td>
+</tr>
+"""
+
+LISTING_EDGE_CASES = [
+    "<table>" + "".join(LISTING_ROW.format(rid=rid) for rid in (3, 2, 1)) + "</table>",
+    # Fallbacks: no university div, no program div, bare status.
+    """<table><tr><th>head</th></tr>
+       <tr><td><a href="/result/9">x</a>
+               <br>MIT
+               Cambridge</td><td> CS </td><td></td><td>Accepted</td></tr></table>""",
+    # Empty tw-font-medium div falls through to div.font-medium / span.font-medium.
+    """<table><tr><td><a href="/other">o</a><a href="/result/7">r</a>
+       <div class="tw-font-medium"></div><span class="font-medium">Yale</span></td>
+       <td><div></div></td><td>1 Feb</td><td>Interview on 2 Feb</td></tr>
+       <tr><td><div class="font-medium tw-font-medium">Brown</div></td>
+       <td><div>Bio</div></td><td>x</td><td>Other</td><td>more</td></tr></table>""",
+    # Rows without links or enough cells, and rows outside a table.
+    """<tr><td><a href="/result/1">x</a></td></tr>
+       <table><tr><td><a href="/result/2">x</a></td><td>b</td></tr>
+       <tr><td>no link</td><td>b</td><td>c</td><td>d</td></tr></table>""",
+    "<table><tr><th>only headers</th></tr></table>",
+    "<p>no table</p>",
+]
+
+
+def parse_with(backend, func, *args):
+    """Run ``func`` under the given parser backend."""
+    previous = parsers.PARSER_BACKEND
+    parsers.configure_parser(backend)
+    try:
+        return func(*args)
+    finally:
+        parsers.configure_parser(previous)
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("name", DETAIL_FIXTURES)
+def test_detail_fixture_parity(name):
+    html = (REPO_ROOT / name).read_text(encoding="utf-8")
+
+    fast = parse_with("fast", parsers._parse_detail_html, html)
+
+    assert fast == parse_with("soup", parsers._parse_detail_html, html)
+    assert parse_with("fast", parsers._detail_blocks, html) == parse_with(
+        "soup", parsers._detail_blocks, html
+    )
+    assert fast["citizenship"] == "American"
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("html", DETAIL_EDGE_CASES)
+def test_detail_edge_case_parity(html):
+    assert parse_with("fast", parsers._detail_blocks, html) == parse_with(
+        "soup", parsers._detail_blocks, html
+    )
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("html", LISTING_EDGE_CASES)
+def test_listing_parity(html):
+    fast = parse_with("fast", parsers._parse_listing_html, html, BASE_URL)
+
+    assert fast == parse_with("soup", parsers._parse_listing_html, html, BASE_URL)
+
+
+@pytest.mark.integration
+def test_listing_fast_parser_fields():
+    html = LISTING_EDGE_CASES[0]
+
+    entries = parse_with("fast", parsers._parse_listing_html, html, BASE_URL)
+
+    assert [e["entry_url"] for e in entries] == [
+        f"https://www.thegradcafe.com/result/{rid}" for rid in (3, 2, 1)
+    ]
+    assert entries[0]["university"] == "Johns Hopkins"
+    assert (entries[0]["program_name"], entries[0]["degree_level"]) == ("Computer Science", "PhD")
+    assert (entries[0]["status"], entries[0]["status_date"]) == ("Waitlisted", "15 Jan")
+
+
+@pytest.mark.integration
+def test_configure_parser_rejects_unknown_backend():
+    with pytest.raises(ValueError, match="lxml"):
+        parsers.configure_parser("lxml")
+    assert parsers.PARSER_BACKEND == "fast"
+
+
+@pytest.mark.web
+def test_cli_parser_flag(monkeypatch):
+    seen = []
+    monkeypatch.setattr(scrape, "main", lambda **_: seen.append(parsers.PARSER_BACKEND))
+
+    scrape.cli_main(["--parser", "soup"])
+
+    assert seen == ["soup"]
+    assert parsers.PARSER_BACKEND == "fast"
+
+
+@pytest.mark.integration
+def test_streaming_parser_balances_stack_on_malformed_html():
+    parser = parsers._StreamingParser()
+    parser.feed("<div><br/><section/><p>x</span></div><script>y")
+    parser.close()
+
+    assert [tag for tag, _ in parser._stack] == ["script"]
+    assert parser._open == []
@@ -0,0 +1,164 @@
+"""
+Tests for the cached robots.txt policy and its enforcement in the fetch layer
+"""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.module_2_1 import fetch, scrape
+
+ROBOTS = """
+# Comments and stray lines are ignored
+Disallow: /before-any-agent
+User-agent: *
+Disallow: /
+
+User-agent: jhu-module2-scraper
+User-agent: other-bot
+Disallow: /survey/private
+Allow: /survey/private/ok
+Disallow: /result/*.json$
+Allow: /result/
+Disallow: /result
+Disallow:
+Crawl-delay: 2.5
+no colon here
+
+User-Agent: JHU-Module2-Scraper
+Disallow: /admin   # trailing comment
+Crawl-delay: soon
+"""
+
+SITE = "https://www.thegradcafe.com"
+
+
+def robots_response(status=200, body=ROBOTS):
+    return fetch.Response(status, {}, body.encode(), fetch.ROBOTS_URL)
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    "path, allowed",
+    [
+        ("/survey/?page=3", True),
+        ("/survey/private", False),
+        ("/survey/private/ok/1", True),
+        ("/result/123", True),
+        ("/result/123.json", False),
+        ("/result/123.json?x=1", True),
+        ("/results", False),
+        ("/admin/x", False),
+        ("/before-any-agent", True),
+        ("", True),
+    ],
+)
+def test_agent_group_rules_longest_match(path, allowed):
+    policy = fetch.RobotsPolicy(ROBOTS)
+
+    assert policy.allowed(SITE + path) is allowed
+    assert policy.crawl_delay == 2.5
+
+
+@pytest.mark.integration
+def test_star_group_used_when_agent_not_named_and_allow_wins_tie():
+    policy = fetch.RobotsPolicy(
+        "User-agent: *\nDisallow: /a\nAllow: /a\nDisallow: /b*\nAllow: /b*\nDisallow: /*.gz"
+    )
+
+    assert policy.allowed(SITE + "/a")
+    assert policy.allowed(SITE + "/b1")
+    assert not policy.allowed(SITE + "/data.gz")
+    assert policy.crawl_delay is None
+    assert fetch.RobotsPolicy("").allowed(SITE + "/anything")
+    assert not fetch.RobotsPolicy(disallow_all=True).allowed(SITE + "/")
+
+
+@pytest.mark.integration
+def test_load_caches_and_respects_ttl(tmp_path):
+    path = str(tmp_path / "robots" / "cache.json")
+    now = [1000.0]
+    with patch.object(fetch, "_fetch", return_value=robots_response()) as fake_fetch:
+        fetch.RobotsPolicy.load(path, ttl=60, clock=lambda: now[0])
+        now[0] += 59
+        cached = fetch.RobotsPolicy.load(path, ttl=60, clock=lambda: now[0])
+        assert fake_fetch.call_count == 1
+        now[0] += 2
+        fake_fetch.return_value = robots_response(404)
+        refreshed = fetch.RobotsPolicy.load(path, ttl=60, clock=lambda: now[0])
+
+    assert fake_fetch.call_count == 2
+    assert not cached.allowed(SITE + "/admin")
+    assert refreshed.allowed(SITE + "/admin")
+    assert json.loads((tmp_path / "robots" / "cache.json").read_text()) == {
+        "fetched_at": 1061.0,
+        "text": "",
+    }
+
+
+@pytest.mark.integration
+def test_load_falls_back_to_stale_copy_then_disallows(tmp_path):
+    path = tmp_path / "cache.json"
+    path.write_text(json.dumps({"fetched_at": 0, "text": "User-agent: *\nDisallow: /x"}))
+
+    with patch.object(fetch, "_fetch", return_value=robots_response(503)):
+        stale = fetch.RobotsPolicy.load(str(path))
+        path.write_text("{torn")
+        unreachable = fetch.RobotsPolicy.load(str(path))
+
+    assert stale.allowed(SITE + "/survey/") and not stale.allowed(SITE + "/x")
+    assert unreachable.disallow_all
+
+
+@pytest.mark.integration
+def test_configure_robots_enforces_policy_and_crawl_delay(tmp_path):
+    with patch.object(fetch, "_fetch", return_value=robots_response()):
+        policy = fetch.configure_robots(str(tmp_path / "cache.json"))
+
+    assert fetch._ROBOTS is policy
+    assert fetch._RATE_LIMITER._window("www.thegradcafe.com").interval == 2.5
+    with patch.object(fetch, "_HTTP_POOL") as pool:
+        with pytest.raises(fetch.RobotsDisallowed):
+            fetch._fetch(SITE + "/survey/private")
+        assert fetch._get_html(SITE + "/admin") == ""
+        with pytest.raises(fetch.FetchError, match="robots.txt"):
+            fetch._get_html(SITE + "/admin", strict=True)
+    pool.get.assert_not_called()
+
+    assert fetch.configure_robots(None) is None
+    assert fetch._RATE_LIMITER._window("www.thegradcafe.com").interval == 0.0
+
+
+@pytest.mark.integration
+def test_crawl_delay_spaces_request_starts():
+    now = [0.0]
+    slept = []
+
+    def sleep(seconds):
+        slept.append(seconds)
+        now[0] += seconds
+
+    bucket = MagicMock()
+    bucket.acquire.return_value = 0.0
+    limiter = fetch.AdaptiveLimiter(bucket, initial=4, clock=lambda: now[0], sleep=sleep)
+    limiter.set_crawl_delay("h", 2)
+
+    waits = [limiter.acquire("h") for _ in range(3)]
+    now[0] += 10
+    waits.append(limiter.acquire("h"))
+
+    assert waits == [0.0, 2.0, 2.0, 0.0]
+    assert slept == [2.0, 2.0]
+
+
+@pytest.mark.web
+def test_cli_main_drops_policy_after_run(monkeypatch):
+    def fake_main(**_):
+        fetch._ROBOTS = fetch.RobotsPolicy("")
+
+    monkeypatch.setattr(scrape, "main", fake_main)
+
+    scrape.cli_main([])
+
+    assert fetch._ROBOTS is None
@@ -0,0 +1,311 @@
+"""
+Tests for the streaming pipeline: scrape.py --stream writes JSONL, and
+clean.py / load_data.py --follow read it while it is being written
+"""
+
+import gzip
+import json
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src import load_data
+from src.module_2_1 import clean, jsonl_stream, scrape
+
+
+@pytest.fixture(autouse=True)
+def reset_stream():
+    yield
+    scrape.configure_stream(None)
+
+
+def read_lines(path):
+    opener = gzip.open if str(path).endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("name", ["raw.jsonl", "raw.jsonl.gz"])
+def test_record_stream_writes_lines_and_done_marker(tmp_path, name):
+    path = tmp_path / "out" / name
+    (tmp_path / "out").mkdir()
+    (tmp_path / "out" / (name + ".done")).write_text("stale")
+
+    stream = jsonl_stream.RecordStream(str(path))
+    assert not (tmp_path / "out" / (name + ".done")).exists()
+    stream.write({"entry_url": "u1", "university": "Université"})
+    stream.write({"entry_url": "u2"})
+    stream.close()
+    stream.close()
+
+    assert [r["entry_url"] for r in read_lines(path)] == ["u1", "u2"]
+    assert read_lines(path)[0]["university"] == "Université"
+    assert (tmp_path / "out" / (name + ".done")).read_text() == "2\n"
+
+
+@pytest.mark.integration
+def test_incomplete_stream_gets_no_done_marker(tmp_path):
+    path = tmp_path / "raw.jsonl.gz"
+
+    stream = jsonl_stream.RecordStream(str(path))
+    stream.write({"entry_url": "u1"})
+    stream.close(complete=False)
+
+    assert read_lines(path) == [{"entry_url": "u1"}]
+    assert not (tmp_path / "raw.jsonl.gz.done").exists()
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("name", ["raw.jsonl", "raw.jsonl.gz"])
+def test_follow_reads_while_writer_appends(tmp_path, name):
+    path = str(tmp_path / name)
+    written = threading.Event()
+
+    def writer():
+        stream = jsonl_stream.RecordStream(path)
+        for i in range(50):
+            stream.write({"entry_url": f"u{i}"})
+            if i == 24:
+                written.wait(5)
+        stream.close()
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    seen = []
+    for record in jsonl_stream.follow_records(path, poll_interval=0.01, idle_timeout=5):
+        seen.append(record["entry_url"])
+        if len(seen) == 25:
+            # Half the records were read before the writer finished.
+            written.set()
+    thread.join()
+
+    assert seen == [f"u{i}" for i in range(50)]
+
+
+@pytest.mark.integration
+def test_follow_waits_for_file_and_reads_unterminated_last_line(tmp_path):
+    path = tmp_path / "raw.jsonl"
+    sleeps = []
+
+    def fake_sleep(seconds):
+        sleeps.append(seconds)
+        path.write_text('{"a": 1}\n\n{"a": 2}')
+        (tmp_path / "raw.jsonl.done").write_text("2\n")
+
+    records = list(jsonl_stream.follow_records(path, poll_interval=0.2, sleep=fake_sleep))
+
+    assert records == [{"a": 1}, {"a": 2}]
+    assert sleeps == [0.2]
+
+
+@pytest.mark.integration
+def test_follow_times_out_when_writer_stalls(tmp_path):
+    with pytest.raises(TimeoutError):
+        list(jsonl_stream.follow_records(str(tmp_path / "never.jsonl"), 1.0, 3.0, lambda _: None))
+
+
+@pytest.mark.integration
+def test_iter_json_records_reads_gzip_array(tmp_path):
+    path = tmp_path / "data.json.gz"
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        json.dump([{"a": 1}, {"a": 2}], f)
+
+    assert list(load_data.iter_json_records(path)) == [{"a": 1}, {"a": 2}]
+
+
+@pytest.mark.integration
+def test_scrape_streams_records_as_they_finish(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        scrape,
+        "_get_listing_html",
+        lambda u: "" if not u.endswith("=1") else (
+            '<table><tr><td><a href="/result/1">x</a></td><td>CS</td>'
+            "<td>1 Jan</td><td>Accepted</td></tr></table>"
+        ),
+    )
+    monkeypatch.setattr(scrape, "_parse_detail_page_html", lambda url: {"gpa": 3.7})
+    path = tmp_path / "raw.jsonl"
+    scrape.configure_stream(str(path))
+
+    entries = scrape.scrape_data(max_entries=10, parallel_threads=1)
+    scrape.configure_stream(None)
+
+    assert read_lines(path) == entries
+    assert entries[0]["gpa"] == 3.7
+
+
+@pytest.mark.integration
+def test_resumed_entries_are_written_to_new_stream(tmp_path, monkeypatch):
+    monkeypatch.setattr(scrape, "_get_listing_html", lambda u: "")
+    log = scrape.CheckpointLog(str(tmp_path / "log.jsonl"))
+    log.entry_done({"entry_url": "https://www.thegradcafe.com/result/1"})
+    log.close()
+    scrape.configure_checkpoint(str(tmp_path / "log.jsonl"), resume=True)
+    scrape.configure_stream(str(tmp_path / "raw.jsonl"))
+    try:
+        scrape.scrape_data(max_entries=10, parallel_threads=1)
+    finally:
+        scrape.configure_checkpoint(None)
+        scrape.configure_stream(None)
+
+    assert len(read_lines(tmp_path / "raw.jsonl")) == 1
+
+
+@pytest.mark.analysis
+def test_main_skips_json_dump_when_streaming(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(scrape, "check_robots", lambda: True)
+    monkeypatch.setattr(scrape, "scrape_data", lambda **_: [{"entry_url": "u"}])
+    scrape.configure_stream(str(tmp_path / "raw.jsonl"))
+
+    scrape.main()
+
+    assert not (tmp_path / "module_2_1" / "raw_applicant_data.json").exists()
+    assert "Streamed 0 entries" in capsys.readouterr().out
+
+
+@pytest.mark.web
+def test_scrape_cli_stream_flag(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(scrape, "main", lambda **_: scrape._STREAM.write({"a": 1}))
+
+    scrape.cli_main(["--stream"])
+
+    assert read_lines(tmp_path / scrape.RAW_STREAM_FILE) == [{"a": 1}]
+    assert (tmp_path / (scrape.RAW_STREAM_FILE + ".done")).exists()
+    assert scrape._STREAM is None
+
+
+@pytest.mark.web
+@pytest.mark.parametrize("failure", [RuntimeError("boom"), KeyboardInterrupt()])
+def test_scrape_cli_failed_stream_not_marked_done(tmp_path, monkeypatch, failure):
+    monkeypatch.chdir(tmp_path)
+
+    def failing_main(**_):
+        scrape._STREAM.write({"a": 1})
+        raise failure
+
+    monkeypatch.setattr(scrape, "main", failing_main)
+
+    scrape.cli_main(["--stream"])
+
+    assert read_lines(tmp_path / scrape.RAW_STREAM_FILE) == [{"a": 1}]
+    assert not (tmp_path / (scrape.RAW_STREAM_FILE + ".done")).exists()
+    assert scrape._STREAM is None
+
+
+@pytest.mark.analysis
+def test_stream_clean_batches_and_marks_done(tmp_path, monkeypatch):
+    raw = tmp_path / "raw.jsonl"
+    raw.write_text(
+        "".join(
+            json.dumps({"program_name": f"P{i}", "university": "MIT", "status": "Accepted"})
+            + "\n"
+            for i in range(5)
+        )
+    )
+    (tmp_path / "raw.jsonl.done").write_text("5\n")
+    batches = []
+
+    def fake_llm(records):
+        batches.append(len(records))
+        return [{"llm-generated-program": r["program_name"] + "!"} for r in records]
+
+    monkeypatch.setattr(clean, "llm_clean_batch", fake_llm)
+    out = tmp_path / "clean.jsonl"
+    (tmp_path / "clean.jsonl.done").write_text("stale")
+
+    assert clean.stream_clean(str(raw), str(out), batch_size=2) == 5
+
+    rows = read_lines(out)
+    assert batches == [2, 2, 1]
+    assert [r["llm-generated-program"] for r in rows] == [f"P{i}!" for i in range(5)]
+    assert rows[0]["llm-generated-university"] == "MIT"
+    assert (tmp_path / "clean.jsonl.done").read_text() == "5\n"
+
+
+@pytest.mark.analysis
+def test_stream_clean_leaves_no_done_marker_on_error(tmp_path):
+    out = tmp_path / "clean.jsonl"
+
+    with pytest.raises(TimeoutError):
+        clean.stream_clean(
+            str(tmp_path / "missing.jsonl"), str(out), idle_timeout=0, sleep=lambda _: None
+        )
+
+    assert out.exists()
+    assert not (tmp_path / "clean.jsonl.done").exists()
+
+
+@pytest.mark.analysis
+def test_clean_cli_main(monkeypatch, capsys):
+    calls = []
+    monkeypatch.setattr(clean, "main", lambda merge: calls.append(("main", merge)))
+    monkeypatch.setattr(
+        clean, "stream_clean", lambda src, out, batch_size: calls.append((src, out, batch_size)) or 3
+    )
+
+    clean.cli_main([])
+    clean.cli_main(["--merge"])
+    clean.cli_main(["--follow", "--batch-size", "10"])
+
+    assert calls == [
+        ("main", False),
+        ("main", True),
+        (clean.RAW_STREAM_FILE, clean.CLEAN_STREAM_FILE, 10),
+    ]
+    assert "Saved 3 rows" in capsys.readouterr().out
+
+
+@pytest.mark.db
+def test_load_into_db_follows_stream(monkeypatch):
+    monkeypatch.setattr(load_data, "follow_records", lambda path: iter([{"program": path}]))
+    monkeypatch.setattr(load_data, "get_connection", MagicMock())
+    monkeypatch.setattr(load_data, "create_table", lambda conn: None)
+    monkeypatch.setattr(load_data, "export_known_result_ids", lambda conn: 0)
+    seen = []
+
+    def fake_bulk(conn, records):
+        seen.extend(records)
+        return 0, 0
+
+    monkeypatch.setattr(load_data, "insert_records_bulk", fake_bulk)
+
+    load_data.load_into_db("clean.jsonl", follow=True)
+
+    assert seen == [load_data.normalize_record({"program": "clean.jsonl"})]
+
+
+@pytest.mark.db
+def test_load_data_cli_follow(monkeypatch):
+    with patch.object(load_data, "load_into_db") as load:
+        load_data.cli_main(["--follow", "clean.jsonl"])
+
+    load.assert_called_once_with("clean.jsonl", follow=True)
+
+
+@pytest.mark.db
+def test_follow_load_commits_each_batch(monkeypatch):
+    def stream(path):
+        yield from ({"entry_url": f"u{i}"} for i in range(5))
+        raise TimeoutError("writer stalled")
+
+    monkeypatch.setattr(load_data, "follow_records", stream)
+    monkeypatch.setattr(load_data, "FOLLOW_BATCH_SIZE", 2)
+    monkeypatch.setattr(load_data, "get_connection", MagicMock())
+    monkeypatch.setattr(load_data, "create_table", lambda conn: None)
+    batches = []
+
+    def fake_bulk(conn, records):
+        batches.append([r["url"] for r in records])
+        return len(batches[-1]), 0
+
+    monkeypatch.setattr(load_data, "insert_records_bulk", fake_bulk)
+
+    with pytest.raises(TimeoutError):
+        load_data.load_into_db("clean.jsonl", follow=True)
+
+    assert batches == [["u0", "u1"], ["u2", "u3"]]
+    assert load_data.read_data_version() == 2